@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Offline analysis of the csv files of a collection output_dir. The files are
+summarized in parallel processes, and the summaries are cached by the size and
+mtime of each file, so analyzing the directory again only reads the new files.
+The summaries of the runs of each workload_type are merged into one.
+"""
+import argparse
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from summary import RunSummary
+
+# ${workload_type}-${finish_timestamp}.csv, the burst files do not match
+RUN_FILE = re.compile(r"^(?P<workload>.+)-(?P<finish>\d+)\.csv$")
+CACHE_NAME = ".analysis-cache.json"
+CACHE_VERSION = 1
+BLOCK_ROWS = 4096
+
+
+def scan(directory):
+    """
+    Find the run files of a directory.
+
+    :param directory: the output_dir of the collections
+    :returns list: (file name, workload_type, finish time in ms), sorted by name
+    """
+    runs = []
+    for name in sorted(os.listdir(directory)):
+        match = RUN_FILE.match(name)
+        if match is not None and os.path.isfile(os.path.join(directory, name)):
+            runs.append((name, match.group("workload"), int(match.group("finish"))))
+    return runs
+
+
+def summarize_file(path):
+    """
+    Summarize a csv file written by collect_data.py, block by block.
+
+    :param path: the csv file
+    :returns RunSummary: the summary of the fields, the TimeStamp column is skipped
+    :raises ValueError: Fail, the file has no header or a value is not a number
+    """
+    with open(path, "rb") as csv_file:
+        rows = sum(block.count(b"\n") for block in iter(lambda: csv_file.read(1 << 20), b"")) - 1
+    with open(path, "r") as csv_file:
+        header = next(csv.reader([csv_file.readline()]), None)
+        if not header:
+            raise ValueError("No header in {}".format(path))
+        skip = 1 if header[0] == "TimeStamp" else 0
+        summary = RunSummary(header[skip:], expected=max(rows, 0))
+        while True:
+            lines = list(itertools.islice(csv_file, BLOCK_ROWS))
+            if not lines:
+                break
+            block = np.loadtxt(lines, delimiter=",", ndmin=2,
+                               usecols=range(skip, len(header)))
+            summary.update_rows(block)
+    return summary
+
+
+def _summarize_run(directory, name):
+    """summarize a run file in a worker process, returns what is cached"""
+    path = os.path.join(directory, name)
+    summary = summarize_file(path)
+    return {"summary": summary.to_dict(), "state": summary.state()}
+
+
+def load_cache(path):
+    """load the cached summaries, empty if missing or of another version"""
+    try:
+        with open(path, "r") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(path, files):
+    """save the cached summaries, replacing the file at once"""
+    temp = "{}.{}.tmp".format(path, os.getpid())
+    with open(temp, "w") as cache_file:
+        json.dump({"version": CACHE_VERSION, "files": files}, cache_file, separators=(",", ":"))
+    os.replace(temp, path)
+
+
+def analyze(directory, workers=None, cache=True, workload=None):
+    """
+    Summarize the run files of a directory and merge them by workload_type.
+
+    :param directory: the output_dir of the collections
+    :param workers: the number of processes, the number of cores if None
+    :param cache: the cache file, True for CACHE_NAME in directory, False not to cache
+    :param workload: only analyze the runs of this workload_type, None for all
+    :returns dict: files -> name -> summary, workloads -> workload_type -> merged summary,
+                   errors -> name -> message, and the numbers of processed and cached files
+    """
+    cache_path = os.path.join(directory, CACHE_NAME) if cache is True else cache or None
+    cached = load_cache(cache_path) if cache_path else {}
+    runs = [run for run in scan(directory) if workload is None or run[1] == workload]
+
+    entries = {}
+    pending = {}
+    for name, _, _ in runs:
+        status = os.stat(os.path.join(directory, name))
+        key = [status.st_size, status.st_mtime_ns]
+        entry = cached.get(name)
+        if entry is not None and entry["key"] == key:
+            entries[name] = entry
+        else:
+            pending[name] = key
+
+    errors = {}
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = {executor.submit(_summarize_run, directory, name): name for name in pending}
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    entries[name] = dict(future.result(), key=pending[name])
+                except (OSError, ValueError) as err:
+                    errors[name] = str(err)
+
+    if cache_path and pending:
+        # the entries of the runs of other workloads are kept, those of removed files dropped
+        kept = {name: entry for name, entry in cached.items()
+                if name not in entries and os.path.exists(os.path.join(directory, name))}
+        kept.update(entries)
+        save_cache(cache_path, kept)
+
+    workloads = {}
+    for name, workload_type, finish in runs:
+        if name not in entries:
+            continue
+        summary = RunSummary.from_state(entries[name]["state"])
+        group = workloads.get(workload_type)
+        if group is None:
+            group = workloads[workload_type] = {"runs": [], "fields": {}}
+        group["runs"].append((finish, summary))
+        # the fields of all runs, in the order they first appear
+        group["fields"].update(dict.fromkeys(summary.fields))
+
+    merged = {}
+    for workload_type, group in workloads.items():
+        total = RunSummary(group["fields"])
+        for _, summary in group["runs"]:
+            total.merge(summary)
+        result = total.to_dict()
+        del result["changed"]
+        result["runs"] = len(group["runs"])
+        result["first"] = min(finish for finish, _ in group["runs"])
+        result["last"] = max(finish for finish, _ in group["runs"])
+        merged[workload_type] = result
+
+    return {"files": {name: entries[name]["summary"] for name, _, _ in runs if name in entries},
+            "workloads": merged,
+            "errors": errors,
+            "processed": len(pending) - len(errors),
+            "cached": len(entries) - len(pending) + len(errors)}
+
+
+if __name__ == "__main__":
+    ARG_PARSER = argparse.ArgumentParser(description="summarize the csv files of a collection "
+                                                     "output_dir by workload_type")
+    ARG_PARSER.add_argument('directory', help="the output_dir of the collections")
+    ARG_PARSER.add_argument('-j', '--jobs', type=int, default=None,
+                            help="the number of processes, the number of cores by default")
+    ARG_PARSER.add_argument('-w', '--workload', default=None,
+                            help="only analyze the runs of this workload_type")
+    ARG_PARSER.add_argument('-o', '--output', default=None,
+                            help="write the summaries of the files and workloads to a json file")
+    ARG_PARSER.add_argument('--no-cache', action='store_true',
+                            help="summarize every file again and do not save the cache")
+    ARGS = ARG_PARSER.parse_args()
+    RESULT = analyze(ARGS.directory, ARGS.jobs, not ARGS.no_cache, ARGS.workload)
+    print("%d files processed, %d cached" % (RESULT["processed"], RESULT["cached"]))
+    for NAME, MESSAGE in sorted(RESULT["errors"].items()):
+        print("failed to analyze %s: %s" % (NAME, MESSAGE))
+    for WORKLOAD, MERGED in sorted(RESULT["workloads"].items()):
+        print("%s: %d runs, %d samples, %d fields" % (WORKLOAD, MERGED["runs"], MERGED["samples"],
+                                                      len(MERGED["fields"])))
+    if ARGS.output:
+        with open(ARGS.output, "w") as output_file:
+            json.dump(RESULT, output_file, indent=2)
+        print("summary path is %s" % ARGS.output)
@@ -0,0 +1,468 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The catalog of the collection runs, a sqlite database holding the config,
+fields, host facts and summary of each run, and optionally the run downsampled
+to periods, so the runs are found by their statistics without reading the csv
+files. During a collection, the catalog is written by a background thread in
+batched transactions, the sampling loop only queues the samples.
+"""
+import argparse
+import json
+import os
+import platform
+import queue
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from summary import DEFAULT_QUANTILES
+
+SCHEMA_VERSION = 1
+STAT_COLUMNS = ("count", "mean", "stddev", "min") + \
+    tuple("p{:g}".format(quantile * 100) for quantile in DEFAULT_QUANTILES) + ("max",)
+# the writer commits at most every COMMIT_INTERVAL seconds or BATCH_ROWS series rows
+COMMIT_INTERVAL = 1.0
+BATCH_ROWS = 4096
+# max samples queued for the writer, later samples are dropped from the series
+MAX_QUEUED = 65536
+# seconds to wait for a database locked by another writer
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    workload TEXT NOT NULL,
+    csv_path TEXT UNIQUE,
+    host TEXT,
+    started REAL,
+    finished REAL,
+    samples INTEGER,
+    interval REAL,
+    config TEXT,
+    host_facts TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_workload ON runs (workload, finished);
+CREATE TABLE IF NOT EXISTS fields (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS run_fields (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    field_id INTEGER NOT NULL REFERENCES fields (id),
+    PRIMARY KEY (run_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    field_id INTEGER NOT NULL REFERENCES fields (id),
+    {stats},
+    PRIMARY KEY (run_id, field_id)
+) WITHOUT ROWID;
+{stat_indexes}
+CREATE TABLE IF NOT EXISTS series (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    field_id INTEGER NOT NULL REFERENCES fields (id),
+    time REAL NOT NULL,
+    mean REAL,
+    min REAL,
+    max REAL,
+    PRIMARY KEY (run_id, field_id, time)
+) WITHOUT ROWID;
+""".format(stats=",\n    ".join("{} {}".format(column, "INTEGER" if column == "count" else "REAL")
+                                for column in STAT_COLUMNS),
+           stat_indexes="\n".join("CREATE INDEX IF NOT EXISTS stats_{0} ON stats (field_id, {0});"
+                                  .format(column) for column in STAT_COLUMNS[1:]))
+
+
+def host_facts():
+    """the facts of this host recorded with each run"""
+    facts = {"hostname": socket.gethostname(), "kernel": platform.release(),
+             "machine": platform.machine(), "cpus": os.cpu_count()}
+    try:
+        with open("/proc/meminfo", "r") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemTotal:"):
+                    facts["memory_kb"] = int(line.split()[1])
+                    break
+    except OSError:
+        pass
+    return facts
+
+
+class RunCatalog:
+    """The catalog database, a connection must be used by one thread at a time"""
+
+    def __init__(self, path):
+        """
+        :param path: the sqlite database, created if missing
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError("Unsupported catalog version {} of {}".format(version, path))
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("PRAGMA user_version = {}".format(SCHEMA_VERSION))
+        self.__field_ids = {}
+
+    def close(self):
+        """close the database"""
+        self.conn.close()
+
+    def field_ids(self, names):
+        """
+        Get the ids of field names, adding the new names.
+
+        :returns list: the id of each name
+        """
+        missing = [name for name in names if name not in self.__field_ids]
+        if missing:
+            self.conn.executemany("INSERT OR IGNORE INTO fields (name) VALUES (?)",
+                                  [(name,) for name in missing])
+            for start in range(0, len(missing), 500):
+                part = missing[start:start + 500]
+                rows = self.conn.execute("SELECT id, name FROM fields WHERE name IN ({})".format(
+                    ",".join("?" * len(part))), part)
+                self.__field_ids.update((row["name"], row["id"]) for row in rows)
+        return [self.__field_ids[name] for name in names]
+
+    def register(self, workload, fields, csv_path=None, config=None, facts=None, started=None):
+        """
+        Add a run.
+
+        :param workload: the workload_type
+        :param fields: the field names of the run
+        :param csv_path: the csv file of the run, replacing a run of the same file
+        :param config: the collection config
+        :param facts: the host facts, see host_facts
+        :returns int: the id of the run
+        """
+        facts = facts or {}
+        with self.conn:
+            if csv_path is not None:
+                self.conn.execute("DELETE FROM runs WHERE csv_path = ?", (csv_path,))
+            cursor = self.conn.execute(
+                "INSERT INTO runs (workload, csv_path, host, started, samples, interval, config, "
+                "host_facts) VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+                (workload, csv_path, facts.get("hostname"), started,
+                 None if config is None else config.get("interval"),
+                 None if config is None else json.dumps(config), json.dumps(facts)))
+            run_id = cursor.lastrowid
+            self.conn.executemany("INSERT INTO run_fields (run_id, position, field_id) "
+                                  "VALUES (?, ?, ?)",
+                                  [(run_id, position, field_id) for position, field_id
+                                   in enumerate(self.field_ids(list(fields)))])
+        return run_id
+
+    def add_series(self, run_id, rows):
+        """
+        Add downsampled rows, without committing.
+
+        :param rows: (field id, time, mean, min, max) of each row
+        """
+        self.conn.executemany("INSERT OR REPLACE INTO series "
+                              "(run_id, field_id, time, mean, min, max) "
+                              "VALUES ({}, ?, ?, ?, ?, ?)".format(int(run_id)), rows)
+
+    def finish(self, run_id, summary, finished=None):
+        """
+        Record the summary of a run.
+
+        :param summary: the dict of RunSummary.to_dict
+        :param finished: the time the run finished, now by default
+        """
+        names = list(summary["fields"])
+        rows = [[run_id, field_id] + [summary["fields"][name].get(column)
+                                      for column in STAT_COLUMNS]
+                for name, field_id in zip(names, self.field_ids(names))]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO stats (run_id, field_id, {}) VALUES ({})"
+                                  .format(", ".join(STAT_COLUMNS),
+                                          ", ".join("?" * (len(STAT_COLUMNS) + 2))), rows)
+            self.conn.execute("UPDATE runs SET finished = ?, samples = ?, "
+                              "started = COALESCE(started, ?) WHERE id = ?",
+                              (time.time() if finished is None else finished,
+                               summary["samples"], summary.get("start"), run_id))
+
+    def find_runs(self, workload=None, field=None, stat="p95", above=None, below=None):
+        """
+        Find runs, by workload and by a statistic of a field.
+
+        :param workload: the workload_type, None for all
+        :param field: the field name, None not to filter by statistics
+        :param stat: the statistic of the field, one of STAT_COLUMNS
+        :param above: the min value of the statistic, exclusive
+        :param below: the max value of the statistic, exclusive
+        :returns list: dict of each run, with the statistic as value if field is given
+        :raises ValueError: Fail, unknown statistic
+        """
+        if stat not in STAT_COLUMNS:
+            raise ValueError("Unknown statistic {}, expected one of {}".format(
+                stat, ", ".join(STAT_COLUMNS)))
+        columns = "runs.id, runs.workload, runs.csv_path, runs.host, runs.started, " \
+                  "runs.finished, runs.samples"
+        conditions = []
+        params = []
+        if field is None:
+            sql = "SELECT {} FROM runs".format(columns)
+        else:
+            sql = "SELECT {}, stats.{} AS value FROM stats JOIN runs ON runs.id = stats.run_id " \
+                  "WHERE stats.field_id = (SELECT id FROM fields WHERE name = ?)".format(columns,
+                                                                                          stat)
+            params.append(field)
+            for bound, operator in ((above, ">"), (below, "<")):
+                if bound is not None:
+                    conditions.append("stats.{} {} ?".format(stat, operator))
+                    params.append(bound)
+        if workload is not None:
+            conditions.append("runs.workload = ?")
+            params.append(workload)
+        if conditions:
+            sql += (" AND " if field is not None else " WHERE ") + " AND ".join(conditions)
+        sql += " ORDER BY runs.finished, runs.id"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def run(self, run_id):
+        """
+        Get a run with its config, host facts, fields and statistics.
+
+        :returns dict: the run, None if unknown
+        """
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+        run = dict(row)
+        run["config"] = json.loads(run["config"]) if run["config"] else None
+        run["host_facts"] = json.loads(run["host_facts"]) if run["host_facts"] else None
+        run["fields"] = [field["name"] for field in self.conn.execute(
+            "SELECT fields.name FROM run_fields JOIN fields ON fields.id = run_fields.field_id "
+            "WHERE run_fields.run_id = ? ORDER BY run_fields.position", (run_id,))]
+        run["stats"] = {stats["name"]: {column: stats[column] for column in STAT_COLUMNS}
+                        for stats in self.conn.execute(
+                            "SELECT fields.name, {} FROM stats JOIN fields "
+                            "ON fields.id = stats.field_id WHERE stats.run_id = ?".format(
+                                ", ".join("stats." + column for column in STAT_COLUMNS)),
+                            (run_id,))}
+        return run
+
+    def series(self, run_id, field):
+        """
+        Get the downsampled values of a field of a run.
+
+        :returns list: (time, mean, min, max) of each period
+        """
+        return [tuple(row) for row in self.conn.execute(
+            "SELECT time, mean, min, max FROM series WHERE run_id = ? AND "
+            "field_id = (SELECT id FROM fields WHERE name = ?) ORDER BY time", (run_id, field))]
+
+
+class CatalogWriter:
+    """
+    Register a collection run in the catalog from a background thread. The
+    samples are queued without blocking, downsampled to periods and inserted
+    in batched transactions.
+    """
+
+    def __init__(self, path, workload, fields, csv_path=None, config=None, period=None):
+        """
+        :param path: the catalog database
+        :param workload: the workload_type
+        :param fields: the field names
+        :param csv_path: the csv file of the run
+        :param config: the collection config
+        :param period: the seconds of each period of the series, None not to keep the series
+        """
+        self.path = path
+        self.workload = workload
+        self.fields = list(fields)
+        self.csv_path = csv_path
+        self.config = config
+        self.period = period
+        self.run_id = None
+        self.dropped = 0
+        self.error = None
+        self.__queue = queue.Queue(MAX_QUEUED)
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def start(self):
+        """start the writer thread"""
+        self.__thread.start()
+
+    def add(self, timestamp, values):
+        """queue a sample for the series, never blocks"""
+        if self.period is None or self.error is not None:
+            return
+        try:
+            self.__queue.put_nowait((timestamp, np.array(values, dtype=float)))
+        except queue.Full:
+            self.dropped += 1
+
+    def finish(self, summary, timeout=None):
+        """
+        Record the summary and wait for the writer to finish.
+
+        :param summary: the dict of RunSummary.to_dict
+        :returns int: the id of the run, None if the catalog failed, see error
+        """
+        # a failed writer no longer drains the queue
+        while self.__thread.is_alive():
+            try:
+                self.__queue.put((None, summary), timeout=COMMIT_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self.__thread.join(timeout)
+        return self.run_id if self.error is None else None
+
+    def __run(self):
+        catalog = None
+        try:
+            catalog = RunCatalog(self.path)
+            self.run_id = catalog.register(self.workload, self.fields, self.csv_path,
+                                           self.config, host_facts(), time.time())
+            field_ids = catalog.field_ids(self.fields)
+            bucket = None
+            rows = []
+            committed = time.monotonic()
+            while True:
+                try:
+                    timestamp, values = self.__queue.get(timeout=COMMIT_INTERVAL)
+                except queue.Empty:
+                    timestamp, values = None, None
+                if timestamp is not None:
+                    if bucket is not None and bucket.time != timestamp // self.period * self.period:
+                        rows.extend(bucket.rows(field_ids))
+                        bucket = None
+                    if bucket is None:
+                        bucket = _Period(timestamp // self.period * self.period, len(self.fields))
+                    bucket.update(values)
+                elif values is not None:
+                    # finished
+                    if bucket is not None:
+                        rows.extend(bucket.rows(field_ids))
+                    with catalog.conn:
+                        catalog.add_series(self.run_id, rows)
+                    catalog.finish(self.run_id, values)
+                    return
+                if rows and (len(rows) >= BATCH_ROWS or
+                             time.monotonic() - committed >= COMMIT_INTERVAL):
+                    with catalog.conn:
+                        catalog.add_series(self.run_id, rows)
+                    rows = []
+                    committed = time.monotonic()
+        except Exception as err:
+            # any failure is reported by finish, the collection goes on without the catalog
+            self.error = err
+        finally:
+            if catalog is not None:
+                catalog.close()
+
+
+class _Period:
+    """the mean, min and max of the samples of a period, nan values are not counted"""
+
+    def __init__(self, start, width):
+        self.time = start
+        self.sum = np.zeros(width)
+        self.count = np.zeros(width, dtype=np.int64)
+        self.min = np.full(width, np.nan)
+        self.max = np.full(width, np.nan)
+
+    def update(self, values):
+        """add a sample"""
+        valid = ~np.isnan(values)
+        self.sum[valid] += values[valid]
+        self.count[valid] += 1
+        np.fmin(self.min, values, out=self.min)
+        np.fmax(self.max, values, out=self.max)
+
+    def rows(self, field_ids):
+        """the series rows of the fields with values"""
+        return [(field_id, self.time, self.sum[column] / self.count[column],
+                 self.min[column], self.max[column])
+                for column, field_id in enumerate(field_ids) if self.count[column] > 0]
+
+
+def import_directory(catalog, directory, workers=None):
+    """
+    Register the runs of an output_dir collected without the catalog.
+
+    :param catalog: RunCatalog
+    :param directory: the output_dir
+    :param workers: the number of processes of the analysis
+    :returns dict: the result of analyze.analyze, the runs already registered are skipped
+    """
+    from analyze import analyze, scan
+    registered = {row["csv_path"] for row in catalog.conn.execute(
+        "SELECT csv_path FROM runs WHERE csv_path IS NOT NULL")}
+    result = analyze(directory, workers)
+    for name, workload, finish in scan(directory):
+        path = os.path.abspath(os.path.join(directory, name))
+        if path in registered or name not in result["files"]:
+            continue
+        summary = result["files"][name]
+        run_id = catalog.register(workload, list(summary["fields"]), path)
+        catalog.finish(run_id, summary, finish / 1000)
+    return result
+
+
+if __name__ == "__main__":
+    ARG_PARSER = argparse.ArgumentParser(description="query the catalog of the collection runs")
+    ARG_PARSER.add_argument('database', help="the catalog database")
+    SUBPARSERS = ARG_PARSER.add_subparsers(dest="command", required=True)
+    QUERY = SUBPARSERS.add_parser("query", help="find runs by workload and statistics")
+    QUERY.add_argument('-w', '--workload', default=None, help="the workload_type")
+    QUERY.add_argument('-f', '--field', default=None, help="the field name, such as "
+                                                           "STORAGE.STAT.util#sda")
+    QUERY.add_argument('-s', '--stat', default="p95", choices=STAT_COLUMNS,
+                       help="the statistic of the field")
+    QUERY.add_argument('--above', type=float, default=None, help="the statistic is above")
+    QUERY.add_argument('--below', type=float, default=None, help="the statistic is below")
+    SHOW = SUBPARSERS.add_parser("show", help="show a run")
+    SHOW.add_argument('run', type=int, help="the id of the run")
+    IMPORT = SUBPARSERS.add_parser("import", help="register the csv files of an output_dir")
+    IMPORT.add_argument('directory', help="the output_dir of the collections")
+    IMPORT.add_argument('-j', '--jobs', type=int, default=None, help="the number of processes")
+    ARGS = ARG_PARSER.parse_args()
+
+    CATALOG = RunCatalog(ARGS.database)
+    try:
+        if ARGS.command == "query":
+            for RUN in CATALOG.find_runs(ARGS.workload, ARGS.field, ARGS.stat,
+                                         ARGS.above, ARGS.below):
+                FINISHED = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(RUN["finished"])) \
+                    if RUN["finished"] else "-"
+                VALUE = " %s=%s" % (ARGS.stat, RUN["value"]) if "value" in RUN else ""
+                print("%d %s %s %s %s%s" % (RUN["id"], RUN["workload"], FINISHED, RUN["host"] or "-",
+                                            RUN["csv_path"] or "-", VALUE))
+        elif ARGS.command == "show":
+            print(json.dumps(CATALOG.run(ARGS.run), indent=2))
+        else:
+            RESULT = import_directory(CATALOG, ARGS.directory, ARGS.jobs)
+            for NAME, MESSAGE in sorted(RESULT["errors"].items()):
+                print("failed to analyze %s: %s" % (NAME, MESSAGE))
+            print("%d runs in the catalog" % len(CATALOG.find_runs()))
+    finally:
+        CATALOG.close()
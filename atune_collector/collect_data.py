@@ -15,26 +15,42 @@
 The main function for collecting data.
 """
 import argparse
+import asyncio
 import json
 import os
 import time
 import csv
+import threading
 
 from plugin.plugin import MPI
-from werkzeug.utils import secure_filename
+from samples import Sample, SampleMatrix
+from summary import RunSummary
+from catalog import CatalogWriter
+from plugin.monitor.system.psi import PsiTrigger, PsiWatcher
 
 
 class Collector:
     """class for Collector"""
 
-    def __init__(self, data):
+    def __init__(self, data, capacity=None, retain=None):
+        """
+        :param data: the collection config
+        :param capacity: the number of samples to preallocate, None for unbounded
+        :param retain: the min number of latest samples kept when unbounded, None for all
+        """
         self.data = data
         self.field_name = []
         self.support_multi_block = ['storage']
         self.support_multi_nic = ['network', 'network-err']
-        self.support_multi_app = ['process']
+        self.support_multi_app = ['process', 'process-stat']
+        self.support_multi_cgroup = ['cgroup']
         self.monitors = self.parse_json()
+        self.triggers = self.parse_triggers()
+        self.samples = SampleMatrix(self.field_name, capacity, retain=retain)
+        self.field_index = self.samples.index
+        self.burst_samples = None
         self.mpi = MPI()
+        self.burst_mpi = None
 
     def parse_json(self):
         """parse json data"""
@@ -43,14 +59,34 @@ class Collector:
             if item["name"] in self.support_multi_app and ('application' not in self.data or
                                                                 self.data["application"] == ""):
                 continue
+            if item["name"] in self.support_multi_cgroup and self.data.get("cgroup", "") == "":
+                continue
             if item["name"] in self.support_multi_app:
                 applications = self.data["application"].split(',')
-                parameters = ["--interval=%s --app=%s;" %(self.data["interval"], self.data["application"])]
+                app_options = ""
+                if "aggregate" in item:
+                    app_options += " --aggregate=%s" % item["aggregate"]
+                if item.get("threads", False):
+                    app_options += " --threads"
+                if item["name"] == "process-stat":
+                    # only the files of the collected fields are read
+                    app_options += "".join(" --fields=%s" % metric for metric in item["metrics"])
+                parameters = ["--interval=%s --app=%s%s;" % (self.data["interval"], self.data["application"],
+                                                             app_options)]
                 for application in applications:    
                     for metric in item["metrics"]:
                         self.field_name.append(
                             "%s.%s.%s#%s" % (item["module"], item["purpose"], metric, application))
                         parameters.append("--fields=%s" % metric)
+            elif item["name"] in self.support_multi_cgroup:
+                cgroups = self.data["cgroup"].split(',')
+                parameters = ["--interval=%s --cgroup=%s;" % (self.data["interval"], self.data["cgroup"])]
+                for metric in item["metrics"]:
+                    for cgroup in cgroups:
+                        self.field_name.append(
+                            "%s.%s.%s#%s" % (item["module"], item["purpose"], metric, cgroup))
+                    parameters.append("--fields=%s" % metric)
+                parameters.append("--cgroup=%s" % self.data["cgroup"])
             else:
                 parameters = ["--interval=%s;" % self.data["interval"]]
                 for metric in item["metrics"]:
@@ -76,14 +112,116 @@ class Collector:
             monitors.append([item["module"], item["purpose"], " ".join(parameters)])
         return monitors
 
+    def parse_triggers(self):
+        """parse psi triggers, which take burst samples when pressure spikes"""
+        triggers = []
+        for item in self.data.get("psi_triggers", []):
+            triggers.append(PsiTrigger(item["resource"], item.get("type", "some"),
+                                       int(item["threshold"]), int(item.get("window", 1000))))
+        return triggers
+
+    @staticmethod
+    def __collect(mpi, monitors, samples):
+        """collect one sample into the next row of samples"""
+        row = samples.next_row()
+        ret = mpi.get_monitors_data(monitors, out=row)
+        if isinstance(ret, Exception):
+            samples.drop_last()
+            raise ret
+        return row
+
     def collect_data(self):
-        """collect data"""
-        raw_data = self.mpi.get_monitors_data(self.monitors)
-        float_data = [float(num) for num in raw_data]
-        return float_data
+        """collect data, returns the view of the new row of self.samples"""
+        return self.__collect(self.mpi, self.monitors, self.samples)
+
+    def iter_samples(self, count=None, duration=None, stop=None):
+        """
+        Collect samples lazily, each round is collected when the next sample is
+        requested, so a slow consumer slows down the collection instead of
+        queueing samples.
+
+        :param count: the max number of samples, None for unbounded
+        :param duration: the max time to collect in seconds, None for unbounded
+        :param stop: threading.Event or asyncio.Event to cancel, checked between rounds
+        :returns iterator: Sample of each round
+        """
+        start = time.monotonic()
+        collected = 0
+        while count is None or collected < count:
+            if stop is not None and stop.is_set():
+                return
+            if duration is not None and time.monotonic() - start >= duration:
+                return
+            values = self.collect_data()
+            collected += 1
+            yield Sample(self.samples.timestamp(-1), values, self.field_name)
+
+    async def aiter_samples(self, count=None, duration=None, stop=None, executor=None):
+        """
+        Collect samples lazily in an event loop, see iter_samples. The rounds
+        run in the executor, cancelling the consuming task stops after the
+        round in progress.
+
+        :param executor: concurrent.futures.Executor, the default one of the loop if None
+        :returns async iterator: Sample of each round
+        """
+        loop = asyncio.get_running_loop()
+        samples = self.iter_samples(count, duration, stop)
+        pending = None
+        try:
+            while True:
+                pending = loop.run_in_executor(executor, next, samples, None)
+                # shielded, so a cancellation leaves the round running until it ends
+                sample = await asyncio.shield(pending)
+                pending = None
+                if sample is None:
+                    return
+                yield sample
+        finally:
+            if pending is not None:
+                # the generator cannot be closed while the round is running in the executor
+                await asyncio.wait([pending])
+            samples.close()
+
+    def collect_burst(self):
+        """collect data out of band, with monitors separated from the regular samples"""
+        if self.burst_mpi is None:
+            self.burst_mpi = MPI()
+            # the bursts are written to the csv as they come, so at least the latest
+            # one is kept, which holds the current chunk and the previous one
+            self.burst_samples = SampleMatrix(self.field_name, retain=1)
+        return self.__collect(self.burst_mpi, self.monitors, self.burst_samples)
+
+    def watch_pressure(self, csvfile, stop):
+        """
+        take a burst sample each time psi triggers fire, until stop is set
+
+        :param csvfile: the opened burst csv file
+        :param stop: threading.Event to stop watching
+        """
+        watcher = PsiWatcher(self.triggers)
+        if not watcher.triggers and not watcher.failed:
+            return
+        writer = csv.writer(csvfile)
+        writer.writerow(["TimeStamp", "Trigger"] + self.field_name)
+        csvfile.flush()
+        try:
+            while not stop.is_set():
+                # wake up periodically to check the stop event
+                fired = watcher.wait(1000)
+                if not fired or stop.is_set():
+                    continue
+                timestamp = time.strftime("%H:%M:%S")
+                data = self.collect_burst()
+                str_data = [str(round(value, 3)) for value in data]
+                writer.writerow([timestamp, "|".join(str(trigger) for trigger in fired)] + str_data)
+                csvfile.flush()
+        finally:
+            watcher.close()
 
 
 if __name__ == "__main__":
+    from werkzeug.utils import secure_filename
     default_json_path = "/etc/atune_collector/collect_data.json"
     ARG_PARSER = argparse.ArgumentParser(description="input configuration file in json format")
     ARG_PARSER.add_argument('-c', '--config', metavar='json',
@@ -92,7 +230,14 @@ if __name__ == "__main__":
     filename=secure_filename(ARGS.config)
     with open(ARGS.config, 'r') as file:
         json_data = json.load(file)
-    collector = Collector(json_data)
+    # the rows are written to the csv as they come, so at least the latest one is
+    # kept, which holds the current chunk and the previous one
+    collector = Collector(json_data, retain=1)
+    summary = None
+    catalog = None
+    stop_event = threading.Event()
+    burst_thread = None
+    burst_file = None
     try:
         collect_num = collector.data["sample_num"]
         if int(collect_num) < 1:
@@ -105,20 +250,58 @@ if __name__ == "__main__":
             os.makedirs(path, 0o750)
         print("csv path: %s" % os.path.join(path, file_name))
         print("csv fields: %s" % " ".join(collector.field_name))
+        summary_path = os.path.join(path, "{}-summary.json".format(file_name[:-len(".csv")]))
+        summary = RunSummary(collector.field_name, int(collect_num))
+        catalog_path = collector.data.get("catalog")
+        if catalog_path:
+            catalog_period = float(collector.data.get("catalog_period", 0))
+            catalog = CatalogWriter(catalog_path, collector.data.get("workload_type", "default"),
+                                    collector.field_name,
+                                    os.path.abspath(os.path.join(path, file_name)),
+                                    collector.data, catalog_period or None)
+            catalog.start()
         print("start to collect data...")
+        if collector.triggers:
+            burst_name = "{}-burst.csv".format(file_name[:-len(".csv")])
+            print("burst csv path: %s" % os.path.join(path, burst_name))
+            burst_file = open(os.path.join(path, burst_name), "w")
+            burst_thread = threading.Thread(target=collector.watch_pressure,
+                                            args=(burst_file, stop_event), daemon=True)
+            burst_thread.start()
         with open(os.path.join(path, file_name), "w") as csvfile:
             writer = csv.writer(csvfile)
             output_fields = ["TimeStamp"] + collector.field_name
             writer.writerow(output_fields)
             csvfile.flush()
-            for _ in range(collect_num):
-                data = collector.collect_data()
-                str_data = [str(round(value, 3)) for value in data]
-                str_data.insert(0, time.strftime("%H:%M:%S"))
+            for sample in collector.iter_samples(collect_num):
+                str_data = [str(round(value, 3)) for value in sample.values]
+                str_data.insert(0, time.strftime("%H:%M:%S", time.localtime(sample.timestamp)))
                 writer.writerow(str_data)
                 csvfile.flush()
+                summary.update(sample.values, sample.timestamp)
+                if catalog is not None:
+                    catalog.add(sample.timestamp, sample.values)
                 print(" ".join(str_data))
+        summary.dump(summary_path)
         print("finish to collect data, csv path is %s" % os.path.join(path, file_name))
+        print("summary path is %s" % summary_path)
+        if catalog is not None:
+            if catalog.finish(summary.to_dict()) is None:
+                print("failed to register the run in catalog %s: %s" % (catalog_path, catalog.error))
+            else:
+                print("run %d registered in catalog %s" % (catalog.run_id, catalog_path))
 
     except KeyboardInterrupt:
-        print("user stop collect data")
\ No newline at end of file
+        print("user stop collect data")
+        if summary is not None and summary.count > 0:
+            summary.dump(summary_path)
+            print("summary of the collected samples: %s" % summary_path)
+            if catalog is not None:
+                catalog.finish(summary.to_dict())
+    finally:
+        # the burst thread may be writing, stop it before closing its file
+        stop_event.set()
+        if burst_thread is not None:
+            burst_thread.join()
+        if burst_file is not None:
+            burst_file.close()
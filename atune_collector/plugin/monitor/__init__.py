@@ -15,6 +15,7 @@
 Init file.
 """
 
+from .cgroup import *
 from .memory import *
 from .network import *
 from .performance import *
@@ -23,8 +24,13 @@ from .processor import *
 from .storage import *
 from .system import *
 from . import common
+from . import procfile
+from . import procparse
+from . import sysfstopo
+from . import topocache
 
 __all__ = [
+    "cgroup",
     "memory",
     "network",
     "performance",
@@ -32,4 +38,8 @@ __all__ = [
     "processor",
     "storage",
     "common",
+    "procfile",
+    "procparse",
+    "sysfstopo",
+    "topocache",
     "system"]
@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the stat info of cgroup v2.
+"""
+import fnmatch
+import inspect
+import logging
+import getopt
+import os
+import re
+import time
+from ..common import Monitor
+from ..procfile import ProcBuffer, ProcFile
+
+LOGGER = logging.getLogger(__name__)
+
+# "key value" lines of cpu.stat and memory.stat
+KEY_VALUE_PATTERN = re.compile(rb"^(\w+) (\d+)", re.MULTILINE)
+# "key=value" items of io.stat, summed over all devices
+IO_PATTERN = re.compile(rb"(\w+)=(\d+)")
+# total stall time of cpu.pressure
+PRESSURE_PATTERN = re.compile(rb"^(some|full) .*total=(\d+)", re.MULTILINE)
+
+# field: (file, item, whether it is a counter, scale)
+# counters are reported as rates per second, usec counters in percent of one cpu
+CGROUP_FIELDS = {
+    "cpu": ("cpu.stat", b"usage_usec", True, 1e-4),
+    "user": ("cpu.stat", b"user_usec", True, 1e-4),
+    "system": ("cpu.stat", b"system_usec", True, 1e-4),
+    "throttled": ("cpu.stat", b"throttled_usec", True, 1e-4),
+    "nr_throttled": ("cpu.stat", b"nr_throttled", True, 1),
+    "memory": ("memory.current", b"current", False, 1 / 1024),
+    "anon": ("memory.stat", b"anon", False, 1 / 1024),
+    "file": ("memory.stat", b"file", False, 1 / 1024),
+    "shmem": ("memory.stat", b"shmem", False, 1 / 1024),
+    "pgfault": ("memory.stat", b"pgfault", True, 1),
+    "pgmajfault": ("memory.stat", b"pgmajfault", True, 1),
+    "rkBs": ("io.stat", b"rbytes", True, 1 / 1024),
+    "wkBs": ("io.stat", b"wbytes", True, 1 / 1024),
+    "rios": ("io.stat", b"rios", True, 1),
+    "wios": ("io.stat", b"wios", True, 1),
+    "cpu_some": ("cpu.pressure", b"some", True, 1e-4),
+    "cpu_full": ("cpu.pressure", b"full", True, 1e-4),
+}
+
+CGROUP_FILES = ("cpu.stat", "memory.current", "memory.stat", "io.stat", "cpu.pressure")
+
+
+def cgroup_root(sysfs="/sys"):
+    """
+    Get the mount point of the cgroup v2 hierarchy.
+
+    :param sysfs: the mount point of sysfs
+    :returns path: the unified hierarchy, in both unified and hybrid mode
+    """
+    root = os.path.join(sysfs, "fs", "cgroup")
+    if os.path.exists(os.path.join(root, "cgroup.controllers")):
+        return root
+    return os.path.join(root, "unified")
+
+
+def walk(root, depth):
+    """
+    Walk the cgroup hierarchy once.
+
+    :param root: the cgroup v2 mount point
+    :param depth: the max depth to walk
+    :returns dict: relative path -> inode of all cgroups, "" for the root
+    """
+    cgroups = {"": os.stat(root).st_ino}
+    level = [""]
+    for _ in range(depth):
+        children = []
+        for parent in level:
+            try:
+                with os.scandir(os.path.join(root, parent)) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            path = os.path.join(parent, entry.name)
+                            cgroups[path] = entry.inode()
+                            children.append(path)
+            except OSError:
+                continue
+        level = children
+    return cgroups
+
+
+def match(pattern, path):
+    """
+    Match a cgroup path with a glob pattern, "*" does not match "/".
+
+    :param pattern: the pattern split by "/"
+    :param path: the relative path of the cgroup
+    :returns bool: whether the cgroup matches
+    """
+    parts = path.split("/") if path else []
+    if len(parts) != len(pattern):
+        return False
+    return all(fnmatch.fnmatchcase(part, expr) for part, expr in zip(parts, pattern))
+
+
+class CgroupStat(Monitor):
+    """To collect the stat info of cgroup v2"""
+    _module = "CGROUP"
+    _purpose = "STAT"
+    _option = "/sys"
+
+    # the size of the read buffer, grown if a file does not fit
+    __buf_size = 4096
+
+    def __init__(self, user=None, root=None):
+        Monitor.__init__(self, user)
+        self.__interval = 1
+        self.__root = root
+        self.__cgroups = []
+        self.__buf = ProcBuffer(self.__buf_size)
+        # (cgroup key, file name) -> ProcFile, kept open as long as the cgroup exists
+        self.__files = {}
+        self.__last_time = None
+        self.__last_values = {}
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--cgroup=x, --fields=" + "/".join(CGROUP_FIELDS))
+
+    def __read(self, key, path, name):
+        """read a file of a cgroup, returns a view of the content valid until the next read"""
+        file = self.__files.get((key, name))
+        if file is None:
+            file = self.__files[(key, name)] = ProcFile(os.path.join(path, name), buf=self.__buf)
+        try:
+            return file.read()
+        except OSError:
+            return None
+
+    def __sample(self, key, path):
+        """read all files of one cgroup, missing controllers are skipped"""
+        values = {}
+        for name in CGROUP_FILES:
+            content = self.__read(key, path, name)
+            if content is None:
+                continue
+            items = values.setdefault(name, {})
+            if name == "memory.current":
+                items[b"current"] = int(bytes(content))
+            elif name == "io.stat":
+                for item, value in IO_PATTERN.findall(content):
+                    items[item] = items.get(item, 0) + int(value)
+            elif name == "cpu.pressure":
+                for item, value in PRESSURE_PATTERN.findall(content):
+                    items[item] = int(value)
+            else:
+                for item, value in KEY_VALUE_PATTERN.findall(content):
+                    items[item] = int(value)
+        return values
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None, ['interval=', 'cgroup='])
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+                elif opt in '--cgroup':
+                    self.__cgroups = val.split(',')
+
+        root = self.__root or cgroup_root(self._option)
+        patterns = [[part for part in cgroup.strip("/").split("/") if part]
+                    for cgroup in self.__cgroups]
+        cgroups = walk(root, max([len(pattern) for pattern in patterns] + [0]))
+
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        alive = {}
+        output = ""
+        for cgroup, pattern in zip(self.__cgroups, patterns):
+            totals = dict.fromkeys(CGROUP_FIELDS, 0.0)
+            count = 0
+            for path, inode in cgroups.items():
+                if not match(pattern, path):
+                    continue
+                # a recreated cgroup has a new inode and restarts its counters
+                key = (path, inode)
+                values = alive.get(key)
+                if values is None:
+                    values = self.__sample(key, os.path.join(root, path))
+                    alive[key] = values
+                count += 1
+                last = self.__last_values.get(key)
+                for field, (name, item, counter, scale) in CGROUP_FIELDS.items():
+                    value = values.get(name, {}).get(item, 0)
+                    if not counter:
+                        totals[field] += value * scale
+                    elif last is not None and elapsed > 0:
+                        delta = value - last.get(name, {}).get(item, value)
+                        totals[field] += max(delta, 0) * scale / elapsed
+            output += "{} (#cgroups: {})\n".format(cgroup, count)
+            for field, value in totals.items():
+                output += "{:<24}: {:.3f}\n".format(field, value)
+
+        # close the files of the removed cgroups
+        for key in [key for key in self.__files if key[0] not in alive]:
+            self.__files.pop(key).close()
+        self.__last_time = now
+        self.__last_values = alive
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+
+        keys = []
+        all_cgroup = []
+        opts, _ = getopt.getopt(para.split(), None, ['nic=', 'fields=', 'device=', 'cgroup='])
+        for opt, val in opts:
+            if opt in '--cgroup':
+                all_cgroup = val.split(',')
+                continue
+            if opt in '--fields':
+                if val not in CGROUP_FIELDS:
+                    err = LookupError("Fail to find data for {}".format(val))
+                    LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                 inspect.stack()[0][3], str(err))
+                    raise err
+                keys.append(val)
+                continue
+
+        all_data = {}
+        data = None
+        for line in info.splitlines():
+            if line.endswith(")") and " (#cgroups: " in line:
+                data = all_data.setdefault(line[:line.rfind(" (#cgroups: ")], {})
+            elif data is not None and ":" in line:
+                field, value = line.split(":", 1)
+                data[field.strip()] = value.strip()
+
+        ret = ""
+        for key in keys:
+            for cgroup in all_cgroup:
+                ret = ret + " " + all_data.get(cgroup, {}).get(key, "0")
+        return ret
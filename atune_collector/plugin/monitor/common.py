@@ -15,6 +15,7 @@
 The base class of the monitor, used to report the given config, get the collected info,
 decode the collected info, format the collected info and output collected info to file.
 """
+import getopt
 import inspect
 import logging
 
@@ -246,3 +247,85 @@ def get_class_type(json_content, class_type, desc=None):
     dict_datas = {}
     dict_datas[class_type + "s"] = datas
     return dict_datas
+
+
+def read_sysfs(path, default=None):
+    """read a sysfs attribute, return default if it is unreadable"""
+    try:
+        with open(path, 'r') as file:
+            return file.read().strip()
+    except (IOError, OSError):
+        return default
+
+
+def parse_cpu_list(cpu_list):
+    """parse cpu list such as '0-3,8' to [0, 1, 2, 3, 8]"""
+    cpus = []
+    for part in cpu_list.split(","):
+        part = part.strip()
+        if part == "":
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def percpu_summary(name, cpus, rates, instance="cpu"):
+    """
+    Format per cpu rates as "key : value" lines of
+    name.total, name.max, name.imbalance (max / mean) and name.cpuN.
+
+    :param name: the prefix of the keys
+    :param cpus: the cpu numbers
+    :param rates: numpy array of the rates of each cpu
+    :param instance: the instance name of the per cpu keys, such as node
+    :returns str: the formatted lines
+    """
+    total = rates.sum() if len(cpus) > 0 else 0.0
+    cpu_max = rates.max() if len(cpus) > 0 else 0.0
+    mean = total / len(cpus) if len(cpus) > 0 else 0.0
+    output = "{}.total : {:.3f}\n".format(name, total)
+    output += "{}.max : {:.3f}\n".format(name, cpu_max)
+    output += "{}.imbalance : {:.3f}\n".format(name, cpu_max / mean if mean > 0 else 0.0)
+    for cpu, rate in zip(cpus, rates):
+        output += "{}.{}{} : {:.3f}\n".format(name, instance, cpu, rate)
+    return output
+
+
+def decode_fields(monitor, info, para, default=None):
+    """
+    Decode "key : value" lines by the --fields of para.
+
+    :param monitor: the monitor for logging
+    :param info: the "key : value" lines
+    :param para: command line argument
+    :param default: value of the fields not found, None to raise
+    :returns ret: values of the fields
+    :raises LookupError: Fail, a field is not found
+    """
+    keys = []
+    opts, _ = getopt.getopt(para.split(), None, ['nic=', 'fields=', 'device='])
+    for opt, val in opts:
+        if opt in '--fields':
+            keys.append(val)
+
+    data = {}
+    for line in info.splitlines():
+        field, _, value = line.partition(" : ")
+        data[field] = value
+
+    ret = ""
+    for key in keys:
+        if key not in data and default is not None:
+            ret = ret + " " + default
+            continue
+        if key not in data:
+            err = LookupError("Fail to find data for {}".format(key))
+            LOGGER.error("%s.%s: %s", monitor.__class__.__name__,
+                         inspect.stack()[1][3], str(err))
+            raise err
+        ret = ret + " " + data[key]
+    return ret
@@ -15,6 +15,6 @@
 Init file.
 """
 
-__all__ = ["numainfo", "topo", "bandwidth", "vmstat", "utilstat", "meminfo"]
+__all__ = ["numainfo", "topo", "bandwidth", "vmstat", "utilstat", "meminfo", "uncore"]
 
-from . import numainfo, topo, bandwidth, vmstat, utilstat, meminfo
+from . import numainfo, topo, bandwidth, vmstat, utilstat, meminfo, uncore
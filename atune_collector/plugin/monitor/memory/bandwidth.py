@@ -18,11 +18,10 @@ import inspect
 import logging
 import subprocess
 import getopt
-import re
 import json
 
 from ..common import Monitor
-from ..memory import topo
+from ..memory import topo, uncore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -31,83 +30,32 @@ class MemBandwidth(Monitor):
     """To collect memory bandwidth stat info"""
     _module = "MEM"
     _purpose = "BANDWIDTH"
-    _option = "-a -e {events} --interval-print {int} --interval-count 1"
-
-    __evs1620 = {
-        "c0d0c0_r": "hisi_sccl1_ddrc0/flux_rd/",
-        "c0d0c1_r": "hisi_sccl1_ddrc1/flux_rd/",
-        "c0d0c2_r": "hisi_sccl1_ddrc2/flux_rd/",
-        "c0d0c3_r": "hisi_sccl1_ddrc3/flux_rd/",
-        "c0d0c0_w": "hisi_sccl1_ddrc0/flux_wr/",
-        "c0d0c1_w": "hisi_sccl1_ddrc1/flux_wr/",
-        "c0d0c2_w": "hisi_sccl1_ddrc2/flux_wr/",
-        "c0d0c3_w": "hisi_sccl1_ddrc3/flux_wr/",
-        "c0d1c0_r": "hisi_sccl3_ddrc0/flux_rd/",
-        "c0d1c1_r": "hisi_sccl3_ddrc1/flux_rd/",
-        "c0d1c2_r": "hisi_sccl3_ddrc2/flux_rd/",
-        "c0d1c3_r": "hisi_sccl3_ddrc3/flux_rd/",
-        "c0d1c0_w": "hisi_sccl3_ddrc0/flux_wr/",
-        "c0d1c1_w": "hisi_sccl3_ddrc1/flux_wr/",
-        "c0d1c2_w": "hisi_sccl3_ddrc2/flux_wr/",
-        "c0d1c3_w": "hisi_sccl3_ddrc3/flux_wr/",
-        "c1d0c0_r": "hisi_sccl5_ddrc0/flux_rd/",
-        "c1d0c1_r": "hisi_sccl5_ddrc1/flux_rd/",
-        "c1d0c2_r": "hisi_sccl5_ddrc2/flux_rd/",
-        "c1d0c3_r": "hisi_sccl5_ddrc3/flux_rd/",
-        "c1d0c0_w": "hisi_sccl5_ddrc0/flux_wr/",
-        "c1d0c1_w": "hisi_sccl5_ddrc1/flux_wr/",
-        "c1d0c2_w": "hisi_sccl5_ddrc2/flux_wr/",
-        "c1d0c3_w": "hisi_sccl5_ddrc3/flux_wr/",
-        "c1d1c0_r": "hisi_sccl7_ddrc0/flux_rd/",
-        "c1d1c1_r": "hisi_sccl7_ddrc1/flux_rd/",
-        "c1d1c2_r": "hisi_sccl7_ddrc2/flux_rd/",
-        "c1d1c3_r": "hisi_sccl7_ddrc3/flux_rd/",
-        "c1d1c0_w": "hisi_sccl7_ddrc0/flux_wr/",
-        "c1d1c1_w": "hisi_sccl7_ddrc1/flux_wr/",
-        "c1d1c2_w": "hisi_sccl7_ddrc2/flux_wr/",
-        "c1d1c3_w": "hisi_sccl7_ddrc3/flux_wr/"}
-
-    __cnt1620 = {
-        "Total": 0,
-        "CPU0": 0,
-        "CPU1": 0,
-        "CPU0_Die0": 0,
-        "CPU0_Die1": 0,
-        "CPU1_Die0": 0,
-        "CPU1_Die1": 0,
-        "CPU0_Die0_R": 0,
-        "CPU0_Die1_R": 0,
-        "CPU1_Die0_R": 0,
-        "CPU1_Die1_R": 0,
-        "CPU0_Die0_W": 0,
-        "CPU0_Die1_W": 0,
-        "CPU1_Die0_W": 0,
-        "CPU1_Die1_W": 0,
-        "Total_Max": 0,
-        "CPU0_Max": 0,
-        "CPU1_Max": 0,
-        "Total_Util": 0}
-
-    def __init__(self, user=None):
+    _option = "-a -A -x , -e {events} --interval-print {int} --interval-count 1"
+
+    # fields which are always reported, even on platforms with less sockets or dies
+    __cnt_default = ("Total", "CPU0", "CPU1", "CPU0_Die0", "CPU0_Die1", "CPU1_Die0", "CPU1_Die1",
+                     "CPU0_Die0_R", "CPU0_Die1_R", "CPU1_Die0_R", "CPU1_Die1_R",
+                     "CPU0_Die0_W", "CPU0_Die1_W", "CPU1_Die0_W", "CPU1_Die1_W",
+                     "Total_Max", "CPU0_Max", "CPU1_Max", "Total_Util")
+
+    def __init__(self, user=None, sysfs="/sys"):
         Monitor.__init__(self, user)
         self.__cmd = "perf stat"
         self.__interval = 1000
 
-        self.__evs = self.__evs1620
-        self.__cnt = self.__cnt1620
-        self.__cnt["CPU0_Max"] = self.__get_theory_bandwidth(0) / 1024 / 1024
-        self.__cnt["CPU1_Max"] = self.__get_theory_bandwidth(1) / 1024 / 1024
-
-        all_events = subprocess.check_output(
-            "perf list".split(),
-            shell=False,
-            stderr=subprocess.STDOUT).decode()
-        self.__events = ""
-        for event in self.__evs:
-            search_obj = re.search(self.__evs[event], all_events, re.UNICODE | re.MULTILINE)
-            if search_obj is not None:
-                self.__events = self.__events + self.__evs[event] + ","
-        self.__events = self.__events.strip(",")
+        self.__layout = uncore.UncoreLayout(uncore.UncoreDiscovery(sysfs).discover())
+        self.__cnt = dict.fromkeys(self.__cnt_default, 0)
+        for socket, dies in self.__layout.dies.items():
+            for die in dies:
+                for direction in uncore.DIRECTIONS:
+                    self.__cnt["CPU{}_Die{}_{}".format(socket, die, direction)] = 0
+        theory = self.__get_theory_bandwidth() if self.__layout.sockets else {}
+        for socket in self.__layout.sockets:
+            if socket not in theory:
+                LOGGER.info("the theoretical bandwidth of socket %d is unknown, "
+                            "CPU%d_Max and Total_Util are reported as 0", socket, socket)
+            self.__cnt["CPU{}_Max".format(socket)] = theory.get(socket, 0) / 1024 / 1024
+        self.__events = ",".join(self.__layout.events)
         LOGGER.info("events is %s", self.__events)
 
         help_info = "--fields="
@@ -145,16 +93,22 @@ class MemBandwidth(Monitor):
         return output.decode()
 
     @staticmethod
-    def __get_theory_bandwidth(socket):
+    def __get_theory_bandwidth():
+        """
+        Get the theoretical bandwidth of the sockets from the dimms of lshw.
+
+        :returns dict: socket -> bytes per second, the sockets without known dimms are missing
+        """
         memtopo = topo.MemTopo()
         info_json = memtopo.report("json", None)
         if isinstance(info_json, Exception):
             raise info_json
         info = json.loads(info_json)
 
-        dimms = [[0 for i in range(8)] for i in range(8)]
         if info["memorys"] is None or len(info["memorys"]) == 0 or "children" not in info["memorys"][0]:
-            return 0
+            return {}
+        # (socket, channel) -> the bandwidth of the first dimm of the channel
+        channels = {}
         for dimm in info["memorys"][0]["children"]:
             if dimm.get("size") is None:
                 continue
@@ -162,53 +116,28 @@ class MemBandwidth(Monitor):
                 locator = memtopo.table_get_locator(dimm["slot"])
                 if locator is None:
                     continue
-                if dimms[locator[0]][locator[1]] == 0:
-                    dimms[locator[0]][locator[1]] = dimm["width"] * \
-                                                    memtopo.table_get_freq(dimm["description"]) / 8
-        ret = 0
-        for channel in dimms[socket]:
-            ret += channel
+                if (locator[0], locator[1]) not in channels:
+                    channels[(locator[0], locator[1])] = dimm["width"] * \
+                                                         memtopo.table_get_freq(dimm["description"]) / 8
+        ret = {}
+        for (socket, _), bandwidth in channels.items():
+            ret[socket] = ret.get(socket, 0) + bandwidth
         return ret
 
-    def __read_counters(self, c_evs):
-        self.__cnt["CPU0_Die0_R"] = ((int(c_evs["c0d0c0_r"]) + int(c_evs["c0d0c1_r"]) + int(
-            c_evs["c0d0c2_r"]) + int(c_evs["c0d0c3_r"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU0_Die1_R"] = ((int(c_evs["c0d1c0_r"]) + int(c_evs["c0d1c1_r"]) + int(
-            c_evs["c0d1c2_r"]) + int(c_evs["c0d1c3_r"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU1_Die0_R"] = ((int(c_evs["c1d0c0_r"]) + int(c_evs["c1d0c1_r"]) + int(
-            c_evs["c1d0c2_r"]) + int(c_evs["c1d0c3_r"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU1_Die1_R"] = ((int(c_evs["c1d1c0_r"]) + int(c_evs["c1d1c1_r"]) + int(
-            c_evs["c1d1c2_r"]) + int(c_evs["c1d1c3_r"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU0_Die0_W"] = ((int(c_evs["c0d0c0_w"]) + int(c_evs["c0d0c1_w"]) + int(
-            c_evs["c0d0c2_w"]) + int(c_evs["c0d0c3_w"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU0_Die1_W"] = ((int(c_evs["c0d1c0_w"]) + int(c_evs["c0d1c1_w"]) + int(
-            c_evs["c0d1c2_w"]) + int(c_evs["c0d1c3_w"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU1_Die0_W"] = ((int(c_evs["c1d0c0_w"]) + int(c_evs["c1d0c1_w"]) + int(
-            c_evs["c1d0c2_w"]) + int(c_evs["c1d0c3_w"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU1_Die1_W"] = ((int(c_evs["c1d1c0_w"]) + int(c_evs["c1d1c1_w"]) + int(
-            c_evs["c1d1c2_w"]) + int(c_evs["c1d1c3_w"])) * 32 / 1024 / 1024) * 1000 / \
-                                    self.__interval
-        self.__cnt["CPU0_Die0"] = self.__cnt["CPU0_Die0_R"] + \
-                                  self.__cnt["CPU0_Die0_W"]
-        self.__cnt["CPU0_Die1"] = self.__cnt["CPU0_Die1_R"] + \
-                                  self.__cnt["CPU0_Die1_W"]
-        self.__cnt["CPU1_Die0"] = self.__cnt["CPU1_Die0_R"] + \
-                                  self.__cnt["CPU1_Die0_W"]
-        self.__cnt["CPU1_Die1"] = self.__cnt["CPU1_Die1_R"] + \
-                                  self.__cnt["CPU1_Die1_W"]
-        self.__cnt["CPU0"] = self.__cnt["CPU0_Die0_R"] + self.__cnt["CPU0_Die0_W"] + \
-                             self.__cnt["CPU0_Die1_R"] + self.__cnt["CPU0_Die1_W"]
-        self.__cnt["CPU1"] = self.__cnt["CPU1_Die0_R"] + self.__cnt["CPU1_Die0_W"] + \
-                             self.__cnt["CPU1_Die1_R"] + self.__cnt["CPU1_Die1_W"]
-        self.__cnt["Total"] = self.__cnt["CPU0"] + self.__cnt["CPU1"]
-        self.__cnt["Total_Max"] = self.__cnt["CPU0_Max"] + self.__cnt["CPU1_Max"]
+    def __read_counters(self, counts):
+        for group, value in self.__layout.bandwidth(counts, self.__interval).items():
+            self.__cnt["CPU{}_Die{}_{}".format(*group)] = value
+        self.__cnt["Total"] = 0
+        self.__cnt["Total_Max"] = 0
+        for socket in self.__layout.sockets:
+            cpu = "CPU{}".format(socket)
+            self.__cnt[cpu] = 0
+            for die in self.__layout.dies[socket]:
+                die_key = "{}_Die{}".format(cpu, die)
+                self.__cnt[die_key] = self.__cnt[die_key + "_R"] + self.__cnt[die_key + "_W"]
+                self.__cnt[cpu] += self.__cnt[die_key]
+            self.__cnt["Total"] += self.__cnt[cpu]
+            self.__cnt["Total_Max"] += self.__cnt[cpu + "_Max"]
         self.__cnt["Total_Util"] = self.__cnt["Total"] / self.__cnt["Total_Max"] * 100 \
             if self.__cnt["Total_Max"] != 0 else 0
 
@@ -222,17 +151,7 @@ class MemBandwidth(Monitor):
         if para is None:
             return info
 
-        c_evs = self.__evs.copy()
-        for evs in self.__evs:
-            pattern = r"^\ {2,}(\d.*?)\ {2,}(\d.*?)\ {2,}(" + \
-                      self.__evs[evs] + ").*?"
-            search_obj = re.search(pattern, info, re.UNICODE | re.MULTILINE)
-            if search_obj is not None:
-                c_evs[evs] = search_obj.group(2).replace(",", "")
-            else:
-                c_evs[evs] = 0
-
-        self.__read_counters(c_evs)
+        self.__read_counters(self.__layout.parse_perf(info))
         fields = []
         ret = ""
 
@@ -243,5 +162,5 @@ class MemBandwidth(Monitor):
                 continue
 
         for field in fields:
-            ret = ret + " {:.2f}".format(self.__cnt[field])
+            ret = ret + " {:.2f}".format(self.__cnt.get(field, 0))
         return ret
@@ -15,12 +15,13 @@
 The sub class of the monitor, used to collect the vm stat info.
 """
 import inspect
+import math
 import logging
-import subprocess
 import getopt
-import re
 
 from ..common import Monitor
+from .. import procparse
+from ..procfile import ProcFile
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +34,11 @@ class MemInfo(Monitor):
 
     def __init__(self, user=None):
         Monitor.__init__(self, user)
-        self.__cmd = "cat"
+        self.__file = ProcFile(self._option)
+        self.__content = memoryview(b"")
+        self.__info = ""
+        self.__parser = None
+        self.__parser_keys = None
         self.__interval = 1
         self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
             "--fields=MemTotal/MemFree/MemAvailable/Buffers/Cached/SwapCached/Active/Inactive/"
@@ -60,11 +65,9 @@ class MemInfo(Monitor):
                         raise err
                     continue
 
-        output = subprocess.check_output(
-            "{cmd} {opt}".format(
-                cmd=self.__cmd,
-                opt=self._option).split())
-        return output.decode()
+        self.__content = self.__file.read()
+        self.__info = str(self.__content, "ascii")
+        return self.__info
 
     def decode(self, info, para):
         """
@@ -85,21 +88,19 @@ class MemInfo(Monitor):
                 keys.append(val)
                 continue
 
-        pattern = re.compile(
-            r"(\w+)\:\ {1,}(\d+)",
-            re.I | re.UNICODE | re.MULTILINE)
-        search_obj = pattern.findall(info)
-        search_list = []
-        for obj in search_obj:
-            search_list.append(obj[0])
-            search_list.append(obj[1])
-
-        if len(search_obj) == 0:
-            err = LookupError("Fail to find data")
-            LOGGER.error("%s.%s: %s", self.__class__.__name__,
-                         inspect.stack()[0][3], str(err))
-            raise err
-
-        for i in keys:
-            ret = ret + " " + search_list[search_list.index(i)+1]
+        if self.__parser is None or self.__parser_keys != keys:
+            self.__parser = procparse.meminfo_parser(keys)
+            self.__parser_keys = keys
+        # parse the buffer read by _get in place when the info is its text
+        if info == self.__info:
+            values = self.__parser.parse(self.__content)
+        else:
+            values = self.__parser.parse(info.encode())
+        for key, value in zip(keys, values):
+            if math.isnan(value):
+                err = LookupError("Fail to find data for {}".format(key))
+                LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                             inspect.stack()[0][3], str(err))
+                raise err
+            ret = ret + " " + str(int(value))
         return ret
@@ -15,22 +15,173 @@
 The sub class of the monitor, used to collect the memory numa info.
 """
 
-import subprocess
+import inspect
+import json
+import logging
+import getopt
+import os
+import time
+import numpy as np
 
-from ..common import Monitor
+from .. import sysfstopo
+from ..common import Monitor, read_sysfs, parse_cpu_list, percpu_summary, decode_fields
+from .. import procparse
+from ..procfile import ProcFile
+
+LOGGER = logging.getLogger(__name__)
+
+NUMASTAT_COUNTERS = ("numa_hit", "numa_miss", "numa_foreign", "interleave_hit",
+                     "local_node", "other_node")
+NODE_MEMINFO = ("MemTotal", "MemFree", "MemUsed", "FilePages", "AnonPages")
 
 
 class MemNuma(Monitor):
     """To collect the memory numa info"""
     _module = "MEM"
     _purpose = "NUMA"
-    _option = "-H"
+    _option = "/sys/devices/system/node"
 
     def __init__(self, user=None):
         Monitor.__init__(self, user)
-        self.__cmd = "numactl"
+        self.__interval = 1
+        self.__online = None
+        self.__nodes = []
+        self.__files = {}
+        self.__parsers = {}
+        self.__last_time = None
+        self.__last_counts = None
+        self.format.__func__.__doc__ = Monitor.format.__doc__ % ("xml, json")
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--fields=TYPE.total/TYPE.max/TYPE.imbalance/TYPE.nodeN, TYPE is " +
+            "/".join(NUMASTAT_COUNTERS + NODE_MEMINFO) +
+            ", --fields=remote_ratio.total/remote_ratio.nodeN")
+
+    def __open_nodes(self):
+        """open the files of the online nodes, reopened on node hotplug only"""
+        online = read_sysfs(os.path.join(self._option, "online"), "")
+        if online == self.__online:
+            return
+        for file in self.__files.values():
+            file.close()
+        self.__files = {}
+        self.__parsers = {}
+        self.__online = online
+        self.__nodes = []
+        self.__last_counts = None
+        for node in parse_cpu_list(online):
+            for name in ("numastat", "meminfo"):
+                self.__files[(node, name)] = ProcFile(
+                    os.path.join(self._option, "node%d" % node, name))
+            self.__parsers[(node, "numastat")] = procparse.vmstat_parser(NUMASTAT_COUNTERS)
+            self.__parsers[(node, "meminfo")] = procparse.meminfo_parser(NODE_MEMINFO)
+            self.__nodes.append(node)
+
+    def __parse(self, node, name):
+        """parse a node file, nan for all fields if the node is gone"""
+        try:
+            content = self.__files[(node, name)].read()
+        except OSError:
+            content = b""
+        return self.__parsers[(node, name)].parse(content)
+
+    def __hardware(self):
+        """the nodes with their cpus, memory and distances in the layout of numactl -H"""
+        nodes = self.__nodes
+        output = "available: {} nodes ({})\n".format(len(nodes), self.__online)
+        for node in nodes:
+            path = os.path.join(self._option, "node%d" % node)
+            cpus = parse_cpu_list(read_sysfs(os.path.join(path, "cpulist"), ""))
+            output += "node {} cpus:{}\n".format(node, "".join(" %d" % cpu for cpu in cpus))
+            size, free = np.nan_to_num(self.__parse(node, "meminfo")[
+                [NODE_MEMINFO.index("MemTotal"), NODE_MEMINFO.index("MemFree")]])
+            output += "node {} size: {} MB\n".format(node, int(size) >> 10)
+            output += "node {} free: {} MB\n".format(node, int(free) >> 10)
+        output += "node distances:\nnode " + "".join("% 3d " % node for node in nodes) + "\n"
+        for node in nodes:
+            distances = read_sysfs(os.path.join(self._option, "node%d" % node, "distance"), "")
+            output += "% 3d: " % node + "".join(
+                "% 3d " % int(distance) for distance in distances.split()) + "\n"
+        return output
+
+    def _get(self, para=None):
+        if para is None:
+            # without options, report the nodes in the raw format of numactl -H
+            self.__open_nodes()
+            return self.__hardware()
+
+        opts, _ = getopt.getopt(para.split(), None, ['interval='])
+        for opt, val in opts:
+            if opt in '--interval':
+                if val.isdigit():
+                    self.__interval = int(val)
+                else:
+                    err = ValueError(
+                        "Invalid parameter: {opt}={val}".format(
+                            opt=opt, val=val))
+                    LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                 inspect.stack()[0][3], str(err))
+                    raise err
+                continue
+
+        self.__open_nodes()
+        nodes = self.__nodes
+        counts = np.zeros((len(NUMASTAT_COUNTERS), len(nodes)), dtype=np.int64)
+        meminfo = np.zeros((len(NODE_MEMINFO), len(nodes)))
+        for column, node in enumerate(nodes):
+            counts[:, column] = np.nan_to_num(self.__parse(node, "numastat"))
+            meminfo[:, column] = np.nan_to_num(self.__parse(node, "meminfo"))
+
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        if self.__last_counts is None or elapsed <= 0:
+            rates = np.zeros(counts.shape)
+        else:
+            rates = np.maximum(counts - self.__last_counts, 0) / elapsed
+        self.__last_time = now
+        self.__last_counts = counts
+
+        # counters are in pages per second, meminfo in kB
+        output = ""
+        for row, counter in enumerate(NUMASTAT_COUNTERS):
+            output += percpu_summary(counter, nodes, rates[row], "node")
+        for row, item in enumerate(NODE_MEMINFO):
+            output += percpu_summary(item, nodes, meminfo[row], "node")
+
+        # the percentage of the pages allocated on a node by tasks on other nodes
+        local = rates[NUMASTAT_COUNTERS.index("local_node")]
+        remote = rates[NUMASTAT_COUNTERS.index("other_node")]
+        allocated = local + remote
+        ratio = np.divide(remote * 100, allocated, out=np.zeros(len(nodes)),
+                          where=allocated > 0)
+        total = allocated.sum()
+        output += "remote_ratio.total : {:.3f}\n".format(
+            remote.sum() * 100 / total if total > 0 else 0.0)
+        for node, value in zip(nodes, ratio):
+            output += "remote_ratio.node{} : {:.3f}\n".format(node, value)
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+        return decode_fields(self, info, para)
 
-    def _get(self, _):
-        output = subprocess.check_output("{cmd} {opt}".format(
-            cmd=self.__cmd, opt=self._option).split())
-        return output.decode()
+    def format(self, info, fmt):
+        """
+        format the result of the operation
+        :param info:  content that needs to be converted
+        :param fmt:  converted format
+        :returns output:  converted result
+        """
+        if fmt in ("json", "xml"):
+            dict_datas = sysfstopo.numa_topology()
+            if fmt == "json":
+                return json.dumps(dict_datas, indent=2)
+            import dict2xml
+            return dict2xml.dict2xml(dict_datas, "topology")
+        return Monitor.format(self, info, fmt)
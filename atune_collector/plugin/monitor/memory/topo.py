@@ -16,10 +16,10 @@ The sub class of the monitor, used to collect the memory topo.
 """
 import inspect
 import logging
-import subprocess
 import re
 import json
 
+from .. import sysfstopo, topocache
 from ..common import Monitor, get_class_type
 
 LOGGER = logging.getLogger(__name__)
@@ -37,10 +37,8 @@ class MemTopo(Monitor):
         self.format.__func__.__doc__ = Monitor.format.__doc__ % ("json, table")
 
     def _get(self, _):
-        with open('/dev/null', 'w') as no_print:
-            output = subprocess.check_output("{cmd} {opt}".format(
-                cmd=self.__cmd, opt=self._option).split(), stderr=no_print)
-        return output.decode()
+        return topocache.check_output("{cmd} {opt}".format(
+            cmd=self.__cmd, opt=self._option))
 
     @staticmethod
     def table_get_locator(bank):
@@ -90,15 +88,14 @@ class MemTopo(Monitor):
         :returns output:  converted result
         """
         if fmt in ("json", "table", "xml"):
-            with open('/dev/null', 'w') as no_print:
-                o_json = subprocess.check_output("{cmd} -json".format(
-                    cmd=self.__cmd).split(), stderr=no_print)
-            info = o_json.decode()
-            json_content = json.loads(info)
-            if (isinstance(json_content, list)):
-                json_content = {'children': json_content}
+            dict_datas = sysfstopo.memory_topology()
+            if len(dict_datas["memorys"]) == 0:
+                info = topocache.check_output("{cmd} -json".format(cmd=self.__cmd))
+                json_content = json.loads(info)
+                if (isinstance(json_content, list)):
+                    json_content = {'children': json_content}
 
-            dict_datas = get_class_type(json_content, "memory", "System Memory")
+                dict_datas = get_class_type(json_content, "memory", "System Memory")
             if fmt == "json":
                 return json.dumps(dict_datas, indent=2)
             if fmt == "xml":
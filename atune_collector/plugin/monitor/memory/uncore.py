@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Discovery of the DDR/IMC uncore PMUs, used to collect memory bandwidth on any platform.
+"""
+import logging
+import os
+import re
+
+import numpy
+
+from ..common import read_sysfs, parse_cpu_list
+
+LOGGER = logging.getLogger(__name__)
+
+# (pmu name pattern, read events, write events, bytes per count without scale file)
+# the first group of the pattern, if any, tells dies of the same socket apart
+DRAM_PMUS = (
+    (re.compile(r"^hisi_sccl(\d+)_ddrc\d+(?:_\d+)?$"), ("flux_rd",), ("flux_wr",), 32),
+    (re.compile(r"^uncore_imc_\d+$"), ("cas_count_read",), ("cas_count_write",), 64),
+    (re.compile(r"^uncore_imc_free_running_\d+$"), ("data_read",), ("data_write",), 64),
+)
+
+UNIT_BYTES = {
+    "": 1,
+    "B": 1,
+    "Bytes": 1,
+    "KiB": 1024,
+    "MiB": 1024 ** 2,
+    "GiB": 1024 ** 3,
+    "KB": 1000,
+    "MB": 1000 ** 2,
+    "GB": 1000 ** 3,
+}
+
+DIRECTIONS = ("R", "W")
+
+
+class UncoreCounter:
+    """One DRAM event of one uncore PMU, counted on one cpu of its cpumask"""
+
+    __slots__ = ("pmu", "event", "cpu", "socket", "die", "channel", "direction", "bytes_per_count")
+
+    def __init__(self, pmu, event, cpu, direction, bytes_per_count):
+        self.pmu = pmu
+        self.event = event
+        self.cpu = cpu
+        self.direction = direction
+        self.bytes_per_count = bytes_per_count
+        self.socket = 0
+        self.die = 0
+        self.channel = 0
+
+    @property
+    def name(self):
+        """perf event name"""
+        return "{}/{}/".format(self.pmu, self.event)
+
+    def __repr__(self):
+        return "UncoreCounter(%s cpu%d S%d D%d C%d %s)" % (
+            self.name, self.cpu, self.socket, self.die, self.channel, self.direction)
+
+
+class UncoreDiscovery:
+    """Enumerate DRAM uncore PMUs from sysfs and map them to socket/die/channel"""
+
+    def __init__(self, root="/sys", table=DRAM_PMUS):
+        self.__root = root
+        self.__table = table
+
+    def __pmu_dir(self):
+        return os.path.join(self.__root, "bus", "event_source", "devices")
+
+    def __cpu_topology(self, cpu, attr):
+        path = os.path.join(self.__root, "devices", "system", "cpu",
+                            "cpu%d" % cpu, "topology", attr)
+        value = read_sysfs(path, "0")
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            return 0
+
+    def __event_bytes(self, pmu_path, event, default):
+        scale = read_sysfs(os.path.join(pmu_path, "events", event + ".scale"))
+        if scale is None:
+            return default
+        unit = read_sysfs(os.path.join(pmu_path, "events", event + ".unit"), "")
+        try:
+            return float(scale) * UNIT_BYTES.get(unit, 1)
+        except ValueError:
+            LOGGER.info("invalid scale %s of %s/%s", scale, pmu_path, event)
+            return default
+
+    def discover(self):
+        """
+        Discover all DRAM counters.
+
+        :returns list: UncoreCounter sorted by socket, die, channel and direction
+        """
+        pmu_dir = self.__pmu_dir()
+        try:
+            pmus = sorted(os.listdir(pmu_dir))
+        except (IOError, OSError):
+            return []
+
+        found = []
+        for pmu in pmus:
+            for pattern, reads, writes, default_bytes in self.__table:
+                match = pattern.match(pmu)
+                if match is None:
+                    continue
+                pmu_path = os.path.join(pmu_dir, pmu)
+                events = os.listdir(os.path.join(pmu_path, "events")) \
+                    if os.path.isdir(os.path.join(pmu_path, "events")) else []
+                cpus = parse_cpu_list(read_sysfs(os.path.join(pmu_path, "cpumask"), "0"))
+                tag = match.group(1) if pattern.groups > 0 else None
+                for direction, candidates in zip(DIRECTIONS, (reads, writes)):
+                    event = next((ev for ev in candidates if ev in events), None)
+                    if event is None:
+                        continue
+                    nbytes = self.__event_bytes(pmu_path, event, default_bytes)
+                    for cpu in cpus:
+                        counter = UncoreCounter(pmu, event, cpu, direction, nbytes)
+                        found.append((tag, counter))
+                break
+
+        return self.__assign_locations(found)
+
+    def __assign_locations(self, found):
+        dies = {}
+        for tag, counter in found:
+            counter.socket = self.__cpu_topology(counter.cpu, "physical_package_id")
+            die_key = int(tag) if tag is not None else \
+                self.__cpu_topology(counter.cpu, "die_id")
+            dies.setdefault(counter.socket, set()).add(die_key)
+            counter.die = die_key
+
+        channels = {}
+        counters = []
+        for _, counter in found:
+            counter.die = sorted(dies[counter.socket]).index(counter.die)
+            pmus = channels.setdefault((counter.socket, counter.die), [])
+            if counter.pmu not in pmus:
+                pmus.append(counter.pmu)
+            counter.channel = pmus.index(counter.pmu)
+            counters.append(counter)
+        counters.sort(key=lambda c: (c.socket, c.die, c.channel, c.direction))
+        return counters
+
+
+class UncoreLayout:
+    """The reduction matrix from counters to socket/die read/write bandwidth"""
+
+    def __init__(self, counters):
+        self.counters = counters
+        self.events = []
+        for counter in counters:
+            if counter.name not in self.events:
+                self.events.append(counter.name)
+        self.__names = set(self.events)
+        self.__index = {(c.cpu, c.name): i for i, c in enumerate(counters)}
+        self.__bytes = numpy.array([c.bytes_per_count for c in counters], dtype=numpy.float64)
+
+        self.groups = sorted({(c.socket, c.die, c.direction) for c in counters})
+        self.sockets = sorted({c.socket for c in counters})
+        self.dies = {socket: sorted({c.die for c in counters if c.socket == socket})
+                     for socket in self.sockets}
+        self.__matrix = numpy.zeros((len(self.groups), len(counters)), dtype=numpy.float64)
+        for col, counter in enumerate(counters):
+            row = self.groups.index((counter.socket, counter.die, counter.direction))
+            self.__matrix[row, col] = 1
+
+    def parse_perf(self, output):
+        """
+        Parse 'perf stat -A -x,' output into bytes of each counter.
+
+        :param output: perf stat output string
+        :returns numpy.ndarray: bytes of each counter
+        """
+        counts = numpy.zeros(len(self.counters), dtype=numpy.float64)
+        for line in output.splitlines():
+            items = [item.strip() for item in line.split(",")]
+            for pos in range(2, len(items)):
+                if items[pos] not in self.__names:
+                    continue
+                cpu = next((item for item in items[:pos - 2] if item.startswith("CPU")), "CPU0")
+                index = self.__index.get((int(cpu[3:]), items[pos]))
+                if index is None:
+                    break
+                try:
+                    value = float(items[pos - 2])
+                except ValueError:
+                    break
+                unit = items[pos - 1]
+                counts[index] = value * UNIT_BYTES[unit] if unit in UNIT_BYTES and unit != "" \
+                    else value * self.__bytes[index]
+                break
+        return counts
+
+    def bandwidth(self, counts, interval):
+        """
+        Reduce bytes of counters to MB/s of each socket, die and direction.
+
+        :param counts: bytes of each counter
+        :param interval: sample interval in ms
+        :returns dict: {(socket, die, direction): MB/s}
+        """
+        mbs = self.__matrix.dot(counts) / 1024 / 1024 * 1000 / interval
+        return dict(zip(self.groups, mbs.tolist()))
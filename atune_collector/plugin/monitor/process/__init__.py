@@ -15,6 +15,6 @@
 Init file.
 """
 
-__all__ = ["sched"]
+__all__ = ["procindex", "sched", "stat"]
 
-from . import sched
+from . import procindex, sched, stat
@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The index of running processes, used to find the pids of the monitored applications.
+"""
+import logging
+import os
+import re
+
+LOGGER = logging.getLogger(__name__)
+
+# field index of starttime in /proc/<pid>/stat, counted from the state field
+STAT_STARTTIME = 19
+
+
+def parse_stat(stat):
+    """
+    Get comm and start time from the content of /proc/<pid>/stat.
+
+    :param stat: content of the stat file in bytes
+    :returns tuple: (comm, starttime), None if the content is invalid
+    """
+    begin = stat.find(b"(")
+    end = stat.rfind(b")")
+    if begin < 0 or end < begin:
+        return None
+    fields = stat[end + 2:].split()
+    if len(fields) <= STAT_STARTTIME:
+        return None
+    return stat[begin + 1:end].decode(errors="replace"), int(fields[STAT_STARTTIME])
+
+
+class AppMatcher:
+    """
+    Matcher of one application given by --app:
+        "name"     the comm or the basename of argv[0] is name
+        "name*"    the comm or the basename of argv[0] starts with name
+        "re:expr"  the whole command line matches the regular expression
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.__regex = None
+        self.__prefix = None
+        self.__name = None
+        if app.startswith("re:"):
+            self.__regex = re.compile(app[3:])
+        elif app.endswith("*"):
+            self.__prefix = app[:-1]
+        else:
+            self.__name = app
+
+    def match(self, comm, cmdline):
+        """
+        Match the process.
+
+        :param comm: the comm of the process
+        :param cmdline: callable to get the command line argument list
+        :returns bool: whether the process belongs to the application
+        """
+        if self.__regex is not None:
+            return self.__regex.search(" ".join(cmdline())) is not None
+        if self.__prefix is not None:
+            if comm.startswith(self.__prefix):
+                return True
+            argv = cmdline()
+            return len(argv) > 0 and os.path.basename(argv[0]).startswith(self.__prefix)
+        if comm == self.__name:
+            return True
+        # comm is truncated to 15 characters, check argv[0] for the full name
+        if len(comm) >= 15 or len(self.__name) >= 15:
+            argv = cmdline()
+            return len(argv) > 0 and os.path.basename(argv[0]) == self.__name
+        return False
+
+
+class ProcIndex:
+    """Scan /proc once per round and match all applications in one pass"""
+
+    def __init__(self, proc="/proc"):
+        self.__proc = proc
+        self.__apps = []
+        self.__matchers = []
+        # pid -> (starttime, indexes of matched applications)
+        self.__known = {}
+
+    @property
+    def proc(self):
+        """the mount point of procfs"""
+        return self.__proc
+
+    @property
+    def apps(self):
+        """the monitored applications"""
+        return self.__apps
+
+    def set_apps(self, apps):
+        """
+        Set the monitored applications.
+
+        :param apps: list of application patterns, see AppMatcher
+        :returns: None
+        """
+        if apps == self.__apps:
+            return
+        self.__apps = list(apps)
+        self.__matchers = [AppMatcher(app) for app in self.__apps]
+        self.__known = {}
+
+    def read(self, pid, name):
+        """
+        Read a file of a process.
+
+        :param pid: the process id
+        :param name: the file name in /proc/<pid>
+        :returns bytes: Success, content of the file
+        :returns None: Fail, the process has exited
+        """
+        try:
+            with open(os.path.join(self.__proc, str(pid), name), 'rb') as file:
+                return file.read()
+        except (IOError, OSError):
+            return None
+
+    def __cmdline(self, pid):
+        cache = []
+
+        def cmdline():
+            if not cache:
+                content = self.read(pid, "cmdline") or b""
+                cache.append([arg.decode(errors="replace") for arg in content.split(b"\0") if arg])
+            return cache[0]
+        return cmdline
+
+    def __match(self, pid, comm):
+        cmdline = self.__cmdline(pid)
+        return tuple(index for index, matcher in enumerate(self.__matchers)
+                     if matcher.match(comm, cmdline))
+
+    def scan(self):
+        """
+        Scan all processes once.
+
+        :returns list: sorted pid list of each application
+        """
+        matches = [[] for _ in self.__apps]
+        if not self.__apps:
+            return matches
+
+        known = {}
+        for name in os.listdir(self.__proc):
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            stat = self.read(pid, "stat")
+            parsed = parse_stat(stat) if stat is not None else None
+            if parsed is None:
+                continue
+            comm, starttime = parsed
+            entry = self.__known.get(pid)
+            if entry is None or entry[0] != starttime:
+                # new process, or the pid is reused by another process
+                entry = (starttime, self.__match(pid, comm))
+            known[pid] = entry
+            for index in entry[1]:
+                matches[index].append(pid)
+        self.__known = known
+
+        for pids in matches:
+            pids.sort()
+        return matches
+
+    def starttime(self, pid):
+        """
+        Get the start time of a process found by the last scan.
+
+        :param pid: the process id
+        :returns int: start time in clock ticks, None if it is not found
+        """
+        entry = self.__known.get(pid)
+        return entry[0] if entry is not None else None
@@ -16,34 +16,68 @@ The sub class of the monitor, used to collect the process sched info
 """
 import inspect
 import logging
-import subprocess
 import getopt
+import os
 import re
+import time
 from ..common import Monitor
+from ..procfile import FD_EXHAUSTED, ProcBuffer, ProcFileCache
+from . import procindex
 
 LOGGER = logging.getLogger(__name__)
 
+SCHED_PATTERN = re.compile(rb"^([\w.]+)\s+:\s+(-?\d+\.?\d*)\s*$", re.MULTILINE)
+
+# counters of /proc/<pid>/sched besides the "nr_*", "*_sum", "*_count" and "*_runtime" ones
+SCHED_COUNTERS = (b"numa_pages_migrated", b"total_numa_faults")
+
+
+def sched_key(name):
+    """
+    Get the field name of a sched item, as used by --fields.
+
+    :param name: the item name in bytes, such as b"se.nr_migrations"
+    :returns tuple: (field name, whether the item is a counter)
+    """
+    last = name.rsplit(b".", 1)[-1]
+    counter = not name.startswith(b"se.avg.") and (
+        last.startswith(b"nr_") or last.endswith((b"_sum", b"_count", b"_runtime")) or
+        last in SCHED_COUNTERS)
+    if last.startswith(b"nr_"):
+        last = last[3:]
+    return last.decode(), counter
+
 
 class ProcSched(Monitor):
     """To collect the process sched info"""
     _module = "PROCESS"
     _purpose = "SCHED"
-    _option = "/proc/{}/sched"
+    _option = "sched"
+
+    # the size of the read buffer, grown if a sched file does not fit
+    __buf_size = 8192
 
-    def __init__(self, user=None):
+    def __init__(self, user=None, proc="/proc"):
         Monitor.__init__(self, user)
-        self.__cmd = "cat"
         self.__interval = 1
         self.__applications = []
+        self.__aggregate = "first"
+        self.__threads = False
         self.__pids = []
         self.__proc_flag = []
- 
+        self.__index = procindex.ProcIndex(proc)
+        self.__buf = ProcBuffer(self.__buf_size)
+        self.__files = ProcFileCache(buf=self.__buf)
+        self.__last_time = None
+        self.__last_tasks = {}
+
     def _get(self, para=None):
         output = ""
         pids = []
         proc_flag = []
         if para is not None:
-            opts, _ = getopt.getopt(para.split(), None, ['interval=', 'app='])
+            opts, _ = getopt.getopt(para.split(), None,
+                                    ['interval=', 'app=', 'aggregate=', 'threads'])
             for opt, val in opts:
                 if opt in '--interval':
                     if val.isdigit():
@@ -66,24 +100,105 @@ class ProcSched(Monitor):
                         LOGGER.error("%s.%s: %s", self.__class__.__name__,
                                      inspect.stack()[0][3], str(err))
                         raise err
-        
-        for app in self.__applications:
-            pid = subprocess.getoutput("ps -A")
-            app_processes = [line for line in pid.split('\n') if app in line]
-            pid = [line.split()[0] for line in app_processes]
-            app_pid_flag = True if pid else False
-            proc_flag.append(app_pid_flag)
-            if pid:
-                pids.append(pid[0])
+                elif opt in '--aggregate':
+                    if val not in ("first", "sum", "avg"):
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    self.__aggregate = val
+                elif opt in '--threads':
+                    self.__threads = True
+
+        self.__index.set_apps(self.__applications)
+        if self.__aggregate != "first":
+            return self.__get_aggregated(self.__index.scan())
+
+        for app_pids in self.__index.scan():
+            sched = None
+            for pid in app_pids:
+                sched = self.__index.read(pid, self._option)
+                if sched is not None:
+                    pids.append(pid)
+                    break
+            proc_flag.append(sched is not None)
+            if sched is not None:
+                output = output + sched.decode()
         self.__pids = pids
         self.__proc_flag = proc_flag
+        return output
+
+    def __read(self, key, path):
+        """read a sched file of a task, None if the task has exited"""
+        try:
+            return self.__files.read(key, self._option, path)
+        except OSError as err:
+            if err.errno not in FD_EXHAUSTED:
+                return None
+            LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                         inspect.stack()[0][3], str(err))
+            raise err
+
+    def __task_paths(self, pid):
+        base = os.path.join(self.__index.proc, str(pid))
+        if not self.__threads:
+            return [(pid, os.path.join(base, self._option))]
+        try:
+            tids = os.listdir(os.path.join(base, "task"))
+        except OSError:
+            return []
+        return [(int(tid), os.path.join(base, "task", tid, self._option)) for tid in tids]
 
-        for pid in self.__pids:
-            out = subprocess.check_output(
-                "{cmd} {opt}".format(
-                    cmd=self.__cmd,
-                    opt=self._option.format(pid)).split())
-            output = output + "" + out.decode()
+    def __get_aggregated(self, matches):
+        """
+        Aggregate the sched items of all processes, and all threads if --threads
+        is given, of each application. Counters are converted to rates per second
+        of the tasks alive in both this and the last round, others are summed.
+        With --aggregate=avg, all of them are divided by the number of tasks.
+        """
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        tasks = {}
+        output = ""
+        proc_flag = []
+        for app, app_pids in zip(self.__applications, matches):
+            keys = []
+            values = {}
+            count = 0
+            for pid in app_pids:
+                starttime = self.__index.starttime(pid)
+                for tid, path in self.__task_paths(pid):
+                    content = self.__read((pid, starttime, tid), path)
+                    if content is None:
+                        continue
+                    count += 1
+                    current = {}
+                    for name, value in SCHED_PATTERN.findall(content):
+                        key, counter = sched_key(name)
+                        current[key] = float(value)
+                        if key not in values:
+                            keys.append(key)
+                            values[key] = [counter, 0.0]
+                    last = self.__last_tasks.get((pid, starttime, tid))
+                    for key, value in current.items():
+                        if not values[key][0]:
+                            values[key][1] += value
+                        elif last is not None and elapsed > 0:
+                            values[key][1] += (value - last.get(key, value)) / elapsed
+                    tasks[(pid, starttime, tid)] = current
+            proc_flag.append(count > 0)
+            if count == 0:
+                continue
+            output += "{} ({}, #tasks: {})\n".format(app, self.__aggregate, count)
+            for key in keys:
+                value = values[key][1] / count if self.__aggregate == "avg" else values[key][1]
+                output += "{:<45}: {:>20.6f}\n".format(key, value)
+        self.__files.retain(tasks)
+        self.__last_time = now
+        self.__last_tasks = tasks
+        self.__proc_flag = proc_flag
         return output
 
     def decode(self, info, para):
@@ -0,0 +1,249 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the resource usage of applications.
+"""
+import inspect
+import logging
+import getopt
+import os
+import re
+import time
+from ..common import Monitor
+from ..procfile import FD_EXHAUSTED, ProcFileCache
+from . import procindex
+
+LOGGER = logging.getLogger(__name__)
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+# "key: value" lines of status, io and smaps_rollup
+ITEM_PATTERN = re.compile(rb"^(\w+):\s+(\d+)", re.MULTILINE)
+
+# field index of /proc/<pid>/stat counted from the state field
+STAT_FIELDS = {"minflt": 7, "majflt": 9, "utime": 11, "stime": 12, "threads": 17}
+
+# field: (source file, item, whether it is a counter)
+PROC_FIELDS = {
+    "utime": ("stat", "utime", True),
+    "stime": ("stat", "stime", True),
+    "cpu": ("stat", "cpu", True),
+    "minflt": ("stat", "minflt", True),
+    "majflt": ("stat", "majflt", True),
+    "threads": ("stat", "threads", False),
+    "rss": ("status", b"VmRSS", False),
+    "swap": ("status", b"VmSwap", False),
+    "voluntary_switches": ("status", b"voluntary_ctxt_switches", True),
+    "involuntary_switches": ("status", b"nonvoluntary_ctxt_switches", True),
+    "pss": ("smaps_rollup", b"Pss", False),
+    "rchar": ("io", b"rchar", True),
+    "wchar": ("io", b"wchar", True),
+    "read_bytes": ("io", b"read_bytes", True),
+    "write_bytes": ("io", b"write_bytes", True),
+    "fds": ("fd", "fds", False),
+}
+
+
+class ProcessFiles:
+    """The files of one process, re-read in every round through the file cache"""
+
+    __slots__ = ("path", "key", "cache")
+
+    def __init__(self, path, key, cache):
+        self.path = path
+        self.key = key
+        self.cache = cache
+
+    def read(self, name):
+        """read a file of the process, None if the process has exited"""
+        try:
+            return self.cache.read(self.key, name, os.path.join(self.path, name))
+        except OSError as err:
+            if err.errno not in FD_EXHAUSTED:
+                return None
+            LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                         inspect.stack()[0][3], str(err))
+            raise err
+
+
+class ProcStat(Monitor):
+    """To collect the resource usage of applications"""
+    _module = "PROCESS"
+    _purpose = "STAT"
+    _option = "/proc"
+
+    def __init__(self, user=None, proc=None):
+        Monitor.__init__(self, user)
+        self.__interval = 1
+        self.__applications = []
+        self.__aggregate = "sum"
+        self.__index = procindex.ProcIndex(proc or self._option)
+        self.__files = ProcFileCache()
+        # the fields given by --fields, None for all
+        self.__fields = None
+        self.__last_time = None
+        self.__last_values = {}
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--fields=" + "/".join(PROC_FIELDS))
+
+    def __count_fds(self, files):
+        try:
+            return len(os.listdir(os.path.join(files.path, "fd")))
+        except OSError as err:
+            if err.errno not in FD_EXHAUSTED:
+                return 0
+            LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                         inspect.stack()[0][3], str(err))
+            raise err
+
+    def __sample(self, files, sources):
+        """read the items of one process from the given source files"""
+        values = {}
+        if "stat" in sources:
+            content = files.read("stat")
+            if content is None:
+                return None
+            fields = bytes(content[bytes(content).rfind(b")") + 2:]).split()
+            for item, index in STAT_FIELDS.items():
+                values[item] = int(fields[index])
+            values["cpu"] = values["utime"] + values["stime"]
+        for source in ("status", "io", "smaps_rollup"):
+            if source not in sources:
+                continue
+            content = files.read(source)
+            if content is None:
+                continue
+            for item, value in ITEM_PATTERN.findall(content):
+                values[item] = int(value)
+        if "fd" in sources:
+            values["fds"] = self.__count_fds(files)
+        return values
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None,
+                                    ['interval=', 'app=', 'aggregate=', 'fields='])
+            fields = []
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+                elif opt in '--app':
+                    self.__applications = val.split(',')
+                elif opt in '--aggregate':
+                    if val not in ("sum", "avg"):
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    self.__aggregate = val
+                elif opt in '--fields':
+                    if val not in PROC_FIELDS:
+                        err = LookupError("Fail to find data for {}".format(val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    fields.append(val)
+            if fields:
+                self.__fields = fields
+
+        self.__index.set_apps(self.__applications)
+        matches = self.__index.scan()
+        # only the sources of the requested fields are read, stat tells whether a process is alive
+        fields = {field: PROC_FIELDS[field] for field in self.__fields or PROC_FIELDS}
+        sources = {"stat"} | {source for source, _, _ in fields.values()}
+
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        alive = {}
+        output = ""
+        for app, app_pids in zip(self.__applications, matches):
+            totals = dict.fromkeys(fields, 0.0)
+            count = 0
+            for pid in app_pids:
+                key = (pid, self.__index.starttime(pid))
+                files = ProcessFiles(os.path.join(self.__index.proc, str(pid)), key, self.__files)
+                values = self.__sample(files, sources)
+                if values is None:
+                    continue
+                count += 1
+                alive[key] = values
+                last = self.__last_values.get(key)
+                for field, (_, item, counter) in fields.items():
+                    value = values.get(item, 0)
+                    if not counter:
+                        totals[field] += value
+                    elif last is not None and elapsed > 0:
+                        totals[field] += (value - last.get(item, value)) / elapsed
+            if count > 0 and self.__aggregate == "avg":
+                totals = {field: value / count for field, value in totals.items()}
+            # cpu time is reported in percent of one cpu
+            for field in ("utime", "stime", "cpu"):
+                if field in totals:
+                    totals[field] = totals[field] * 100 / CLK_TCK
+            output += "{} (#processes: {})\n".format(app, count)
+            for field, value in totals.items():
+                output += "{:<24}: {:.3f}\n".format(field, value)
+
+        self.__files.retain(alive)
+        self.__last_time = now
+        self.__last_values = alive
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+
+        keys = []
+        opts, _ = getopt.getopt(para.split(), None, ['nic=', 'fields=', 'device='])
+        for opt, val in opts:
+            if opt in '--fields':
+                keys.append(val)
+                continue
+
+        apps = []
+        for line in info.splitlines():
+            if line.endswith(")") and " (#processes: " in line:
+                apps.append({})
+            elif apps and ":" in line:
+                field, value = line.split(":", 1)
+                apps[-1][field.strip()] = value.strip()
+
+        step = len(set(keys))
+        ret = ""
+        for index, key in enumerate(keys):
+            app = index // step if step > 0 else 0
+            if key not in PROC_FIELDS:
+                err = LookupError("Fail to find data for {}".format(key))
+                LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                             inspect.stack()[0][3], str(err))
+                raise err
+            ret = ret + " " + (apps[app].get(key, "0") if app < len(apps) else "0")
+        return ret
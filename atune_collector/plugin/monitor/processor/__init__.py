@@ -15,6 +15,6 @@
 Init file.
 """
 
-__all__ = ["info", "stat", "topo"]
+__all__ = ["info", "schedstat", "stat", "topo"]
 
-from . import info, stat, topo
+from . import info, schedstat, stat, topo
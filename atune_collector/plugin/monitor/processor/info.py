@@ -15,7 +15,9 @@
 The sub class of the monitor, used to collect the CPU info.
 """
 
-import subprocess
+import json
+
+from .. import sysfstopo, topocache
 from ..common import Monitor
 
 
@@ -31,11 +33,8 @@ class CpuInfo(Monitor):
         self.format.__func__.__doc__ = Monitor.format.__doc__ % ("xml, json")
 
     def _get(self, _):
-        with open('/dev/null', 'w') as no_print:
-            output = subprocess.check_output("{cmd} {opt}".format(
-                cmd=self.__cmd, opt=self._option).split(),
-                                             stderr=no_print)
-        return output.decode()
+        return topocache.check_output("{cmd} {opt}".format(
+            cmd=self.__cmd, opt=self._option))
 
     def format(self, info, fmt):
         """
@@ -44,13 +43,11 @@ class CpuInfo(Monitor):
         :param fmt:  converted format
         :returns output:  converted result
         """
+        if fmt == "json":
+            processors = sysfstopo.processor_topology()["processors"]
+            if len(processors) != 0:
+                return json.dumps(processors, indent=2)
         if fmt in ("xml", "json"):
-            with open("/dev/null", "w") as no_print:
-                o_fmt = subprocess.check_output(
-                    "{cmd} -{fm} {opt}".format(
-                        cmd=self.__cmd,
-                        fm=fmt,
-                        opt=self._option).split(),
-                    stderr=no_print)
-                return o_fmt.decode()
+            return topocache.check_output("{cmd} -{fm} {opt}".format(
+                cmd=self.__cmd, fm=fmt, opt=self._option))
         return Monitor.format(self, info, fmt)
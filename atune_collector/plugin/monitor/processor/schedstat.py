@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the per cpu scheduler statistics.
+"""
+import inspect
+import logging
+import getopt
+import time
+import numpy as np
+from ..common import Monitor, percpu_summary, decode_fields
+from ..procfile import ProcFile
+
+LOGGER = logging.getLogger(__name__)
+
+# columns of the cpu lines of /proc/schedstat after the cpu name:
+# time spent running by tasks, time spent waiting to run, and timeslices run
+SCHEDSTAT_COLUMNS = {"run": 6, "wait": 7, "timeslices": 8}
+# run and wait are in ns, reported in ms per second
+SCHEDSTAT_SCALE = {"run": 1e-6, "wait": 1e-6, "timeslices": 1}
+
+
+def parse_schedstat(content):
+    """
+    Parse the cpu lines of /proc/schedstat.
+
+    :param content: content of /proc/schedstat
+    :returns tuple: (cpus, counts), counts is the cpu x column matrix
+    """
+    cpus = []
+    columns = []
+    width = None
+    for line in content.splitlines():
+        if not line.startswith("cpu"):
+            continue
+        fields = line.split()
+        if width is None:
+            width = len(fields) - 1
+        if len(fields) - 1 != width:
+            continue
+        cpus.append(int(fields[0][3:]))
+        columns.extend(fields[1:])
+    if not cpus:
+        return cpus, np.zeros((0, len(SCHEDSTAT_COLUMNS)), dtype=np.int64)
+    counts = np.fromstring(" ".join(columns), dtype=np.int64, sep=" ")
+    return cpus, counts.reshape(len(cpus), width)
+
+
+class CpuSchedstat(Monitor):
+    """To collect the per cpu scheduler statistics"""
+    _module = "CPU"
+    _purpose = "SCHEDSTAT"
+    _option = "/proc/schedstat"
+
+    def __init__(self, user=None):
+        Monitor.__init__(self, user)
+        self.__file = None
+        self.__interval = 1
+        self.__last_time = None
+        self.__last_cpus = None
+        self.__last_counts = None
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--fields=TYPE.total/TYPE.max/TYPE.imbalance/TYPE.cpuN, TYPE is run/wait/timeslices")
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None, ['interval='])
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+
+        if self.__file is None:
+            self.__file = ProcFile(self._option)
+        cpus, counts = parse_schedstat(self.__file.read_text())
+        columns = list(SCHEDSTAT_COLUMNS.values())
+        counts = counts[:, columns]
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        if cpus != self.__last_cpus or elapsed <= 0:
+            # the first round, or cpus are hotplugged
+            rates = np.zeros(counts.shape)
+        else:
+            rates = np.maximum(counts - self.__last_counts, 0) / elapsed
+        self.__last_time = now
+        self.__last_cpus = cpus
+        self.__last_counts = counts
+
+        output = ""
+        for index, name in enumerate(SCHEDSTAT_COLUMNS):
+            output += percpu_summary(name, cpus, rates[:, index] * SCHEDSTAT_SCALE[name])
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+        return decode_fields(self, info, para)
@@ -16,6 +16,7 @@ The sub class of the monitor, used to collect the CPU topo.
 """
 
 import subprocess
+from .. import topocache
 from ..common import Monitor
 
 
@@ -39,9 +40,8 @@ class CpuTopo(Monitor):
                 self.__cmd = None
 
     def _get(self, _):
-        output = subprocess.check_output("{cmd} {opt}".format(
-            cmd=self.__cmd, opt=self._option).split())
-        return output.decode()
+        return topocache.check_output("{cmd} {opt}".format(
+            cmd=self.__cmd, opt=self._option))
 
     def format(self, info, fmt):
         """
@@ -51,11 +51,9 @@ class CpuTopo(Monitor):
         :returns output:  converted result
         """
         if fmt == "xml":
-            o_xml = subprocess.check_output("{cmd} --of xml {opt}".format(
-                cmd=self.__cmd, opt=self._option).split())
-            return o_xml.decode()
+            return topocache.check_output("{cmd} --of xml {opt}".format(
+                cmd=self.__cmd, opt=self._option))
         if fmt == "table":
-            o_xml = subprocess.check_output("{cmd} --of ascii {opt}".format(
-                cmd=self.__cmd, opt=self._option).split())
-            return o_xml.decode()
+            return topocache.check_output("{cmd} --of ascii {opt}".format(
+                cmd=self.__cmd, opt=self._option))
         return Monitor.format(self, info, fmt)
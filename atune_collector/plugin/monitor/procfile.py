@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The persistent handle of a procfs or sysfs file, used by the monitors sampling
+the same files every round. The file is opened once and re-read from offset 0
+into a reused buffer, so a steady-state read takes no open nor allocation.
+"""
+import errno
+import os
+import resource
+
+# errors of open when the collector is out of fds, which do not mean the file is gone
+FD_EXHAUSTED = (errno.EMFILE, errno.ENFILE)
+
+
+def open_file_limit(share=8):
+    """
+    The number of files a ProcFileCache keeps open, a share of the soft fd limit.
+
+    :param share: the divisor of the limit, the rest is left to the other monitors
+    :returns int: the number of files
+    """
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        soft = 65536
+    return max(16, soft // share)
+
+
+class ProcBuffer:
+    """A read buffer, which can be shared by files read one after another"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, size=4096):
+        self.data = bytearray(size)
+
+    def grow(self, keep=0):
+        """
+        double the size of the buffer
+
+        :param keep: the number of bytes at the start which are kept
+        """
+        data = bytearray(len(self.data) * 2)
+        data[:keep] = memoryview(self.data)[:keep]
+        self.data = data
+
+
+class ProcFile:
+    """A procfs or sysfs file kept open and re-read with pread"""
+
+    __slots__ = ("path", "__dir_fd", "__fd", "__buf")
+
+    def __init__(self, path, dir_fd=None, size=4096, buf=None):
+        """
+        :param path: the file path, relative to dir_fd if it is given
+        :param dir_fd: fd of the directory to open the file in, such as /proc/<pid>
+        :param size: the initial size of the buffer, grown if the file does not fit
+        :param buf: ProcBuffer shared with other files instead of an own buffer,
+                    for monitors keeping many files open
+        """
+        self.path = path
+        self.__dir_fd = dir_fd
+        self.__fd = None
+        self.__buf = buf if buf is not None else ProcBuffer(size)
+
+    def read(self):
+        """
+        Read the whole file from offset 0.
+
+        :returns memoryview: Success, content of the file, valid until the
+                             next read of the buffer
+        :raises OSError: Fail, the file can not be opened or read
+        """
+        if self.__fd is None:
+            self.__fd = os.open(self.path, os.O_RDONLY, dir_fd=self.__dir_fd)
+        # a seq_file returns about a page per read, only 0 is the end of file
+        size = 0
+        while True:
+            if size == len(self.__buf.data):
+                self.__buf.grow(size)
+            count = os.preadv(self.__fd, [memoryview(self.__buf.data)[size:]], size)
+            if count == 0:
+                return memoryview(self.__buf.data)[:size]
+            size += count
+
+    def read_text(self):
+        """
+        Read the whole file as str.
+
+        :returns str: Success, content of the file
+        :raises OSError: Fail, the file can not be opened or read
+        """
+        return bytes(self.read()).decode()
+
+    def close(self):
+        """close the file, it is reopened by the next read"""
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except OSError:
+            pass
+
+
+class ProcFileCache:
+    """
+    The ProcFiles of the tasks of the monitors sampling many processes or
+    threads. At most limit files are kept open, the files of the others are
+    opened and closed around each read, so the fds are never exhausted.
+    """
+
+    __slots__ = ("limit", "__files", "__buf")
+
+    def __init__(self, limit=None, buf=None):
+        """
+        :param limit: the number of files kept open, open_file_limit() by default
+        :param buf: ProcBuffer shared by all files, an own one by default
+        """
+        self.limit = limit if limit is not None else open_file_limit()
+        # (owner, name) -> ProcFile
+        self.__files = {}
+        self.__buf = buf if buf is not None else ProcBuffer()
+
+    def read(self, owner, name, path):
+        """
+        Read a file of a task.
+
+        :param owner: the key of the task, such as (pid, starttime)
+        :param name: the name of the file among the ones of the task
+        :param path: the file path
+        :returns memoryview: Success, content of the file, valid until the next read
+        :raises OSError: Fail, the file can not be opened or read
+        """
+        file = self.__files.get((owner, name))
+        if file is not None:
+            return file.read()
+        file = ProcFile(path, buf=self.__buf)
+        if len(self.__files) < self.limit:
+            self.__files[(owner, name)] = file
+            return file.read()
+        try:
+            return file.read()
+        finally:
+            file.close()
+
+    def retain(self, owners):
+        """close the files of the tasks which are not in owners"""
+        for key in [key for key in self.__files if key[0] not in owners]:
+            self.__files.pop(key).close()
+
+    def __len__(self):
+        return len(self.__files)
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The byte level parsers of the /proc text formats. A parser is built for the
+requested fields only, finds the row of each field by its key on the first
+read and remembers the offset, so the following reads of the same file check
+the key at the remembered offset and parse just the requested columns, without
+decoding the content or splitting it into lines. The content may be bytes or
+the memoryview returned by ProcFile.read, which is parsed in place.
+"""
+import math
+import re
+import numpy as np
+
+NEWLINE = re.compile(b"\n")
+
+
+class RowParser:
+    """
+    Parser of the formats with one row per key, such as "MemTotal: 123 kB" or
+    "nr_free_pages 123". The columns of a row are the whitespace separated
+    numbers following its key.
+    """
+
+    def __init__(self, fields):
+        """
+        :param fields: list of (key, column), key is the bytes starting the row
+                       including its ":" if any, column is the index after the key
+        """
+        self.fields = list(fields)
+        self.values = np.zeros(len(self.fields))
+        # key -> [remembered offset, max column, [(column, index in values)], pattern]
+        # memoryview has no find, the patterns search it as well as bytes
+        self.__rows = {}
+        for index, (key, column) in enumerate(self.fields):
+            row = self.__rows.setdefault(key, [-1, 0, [], re.compile(re.escape(key))])
+            row[1] = max(row[1], column)
+            row[2].append((column, index))
+
+    @staticmethod
+    def __at(content, key, offset):
+        """whether key starts a row at offset"""
+        if offset < 0 or content[offset:offset + len(key)] != key:
+            return False
+        if offset > 0 and content[offset - 1] not in b"\n \t":
+            return False
+        end = offset + len(key)
+        return key.endswith(b":") or end == len(content) or content[end] in b" \t\n"
+
+    def __find(self, content, key, pattern):
+        """find the offset of the row of key, -1 if it is not found"""
+        match = pattern.search(content)
+        while match is not None and not self.__at(content, key, match.start()):
+            match = pattern.search(content, match.start() + 1)
+        return match.start() if match is not None else -1
+
+    def parse(self, content):
+        """
+        Parse the requested fields.
+
+        :param content: bytes or memoryview of the file
+        :returns values: the preallocated numpy array in the order of fields,
+                         nan for the fields not found
+        """
+        values = self.values
+        for key, row in self.__rows.items():
+            offset = row[0]
+            if not self.__at(content, key, offset):
+                # the layout changed, or the first read
+                offset = self.__find(content, key, row[3])
+                row[0] = offset
+            if offset < 0:
+                for _, index in row[2]:
+                    values[index] = math.nan
+                continue
+            start = offset + len(key)
+            match = NEWLINE.search(content, start)
+            end = match.start() if match is not None else len(content)
+            # split only as far as the last requested column, copying the row only
+            columns = bytes(content[start:end]).split(None, row[1] + 1)
+            for column, index in row[2]:
+                values[index] = int(columns[column]) if column < len(columns) else math.nan
+        return values
+
+
+def meminfo_parser(fields):
+    """
+    Parser of /proc/meminfo, and the node*/meminfo of sysfs by "Node N " prefixed keys.
+
+    :param fields: names such as MemFree, in kB
+    :returns RowParser: the parser
+    """
+    return RowParser((field.encode() + b":", 0) for field in fields)
+
+
+def vmstat_parser(fields):
+    """
+    Parser of /proc/vmstat.
+
+    :param fields: names such as pgfault
+    :returns RowParser: the parser
+    """
+    return RowParser((field.encode(), 0) for field in fields)
@@ -15,8 +15,8 @@
 The sub class of the monitor, used to collect the storage topo.
 """
 
-import subprocess
 import json
+from .. import sysfstopo, topocache
 from ..common import Monitor, get_class_type
 
 
@@ -32,11 +32,8 @@ class StorageTopo(Monitor):
         self.format.__func__.__doc__ = Monitor.format.__doc__ % ("xml, json")
 
     def _get(self, _):
-        with open('/dev/null', 'w') as no_print:
-            output = subprocess.check_output("{cmd} {opt}".format(
-                cmd=self.__cmd, opt=self._option).split(),
-                                             stderr=no_print)
-        return output.decode()
+        return topocache.check_output("{cmd} {opt}".format(
+            cmd=self.__cmd, opt=self._option))
 
     def format(self, info, fmt):
         """
@@ -46,13 +43,12 @@ class StorageTopo(Monitor):
         :returns output:  converted result
         """
         if fmt in ("json", "xml"):
-            with open("/dev/null", "w") as no_print:
-                o_json = subprocess.check_output("{cmd} -json".format(
-                    cmd=self.__cmd).split(), stderr=no_print)
-            info = o_json.decode()
-            json_content = json.loads(info)
+            dict_datas = sysfstopo.storage_topology()
+            if len(dict_datas["storages"]) == 0:
+                info = topocache.check_output("{cmd} -json".format(cmd=self.__cmd))
+                json_content = json.loads(info)
 
-            dict_datas = get_class_type(json_content, "storage")
+                dict_datas = get_class_type(json_content, "storage")
             if fmt == "json":
                 return json.dumps(dict_datas, indent=2)
             if fmt == "xml":
@@ -0,0 +1,331 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The topology collectors reading sysfs directly, used as the fast path of the topo monitors.
+They build lshw-like nodes, so the result has the same layout as get_class_type().
+"""
+import os
+import re
+import struct
+
+from .common import read_sysfs, parse_cpu_list
+
+PCI_BUSINFO = re.compile(r"^[0-9a-f]{4}:[0-9a-f]{2}:[0-9a-f]{2}\.[0-9a-f]$")
+
+SIZE_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+DMI_MEMORY_TYPES = {
+    0x12: "DDR", 0x13: "DDR2", 0x14: "DDR2 FB-DIMM", 0x18: "DDR3", 0x1A: "DDR4",
+    0x1B: "LPDDR", 0x1C: "LPDDR2", 0x1D: "LPDDR3", 0x1E: "LPDDR4", 0x20: "HBM",
+    0x21: "HBM2", 0x22: "DDR5", 0x23: "LPDDR5"}
+
+DMI_FORM_FACTORS = {0x09: "DIMM", 0x0B: "Row of chips", 0x0C: "RIMM", 0x0D: "SODIMM",
+                    0x0F: "FB-DIMM", 0x10: "Die"}
+
+
+def _int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _size(value):
+    """convert sysfs size such as '32K' to bytes"""
+    if not value:
+        return None
+    if value[-1] in SIZE_UNITS:
+        return _int(value[:-1]) * SIZE_UNITS[value[-1]]
+    return _int(value)
+
+
+def _pci_businfo(path):
+    """get the nearest pci address in the real path of a device"""
+    for part in reversed(os.path.realpath(path).split(os.sep)):
+        if PCI_BUSINFO.match(part):
+            return part
+    return None
+
+
+def _cpu_model(proc="/proc"):
+    try:
+        with open(os.path.join(proc, "cpuinfo"), 'r') as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except (IOError, OSError):
+        pass
+    return None
+
+
+def processor_topology(root="/sys", proc="/proc"):
+    """
+    Build one processor node per physical package, with its caches as children.
+
+    :returns dict: {"processors": [node, ...]}
+    """
+    cpu_dir = os.path.join(root, "devices", "system", "cpu")
+    online = parse_cpu_list(read_sysfs(os.path.join(cpu_dir, "online"), ""))
+    packages = {}
+    for cpu in online:
+        topology = os.path.join(cpu_dir, "cpu%d" % cpu, "topology")
+        package = _int(read_sysfs(os.path.join(topology, "physical_package_id")))
+        core = (_int(read_sysfs(os.path.join(topology, "die_id"))),
+                _int(read_sysfs(os.path.join(topology, "core_id"))))
+        packages.setdefault(max(package, 0), []).append((cpu, core))
+
+    product = _cpu_model(proc)
+    processors = []
+    for package in sorted(packages):
+        cpus = packages[package]
+        caches = {}
+        cache_dir = os.path.join(cpu_dir, "cpu%d" % cpus[0][0], "cache")
+        indexes = sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []
+        for index in indexes:
+            path = os.path.join(cache_dir, index)
+            level = read_sysfs(os.path.join(path, "level"))
+            cache_type = read_sysfs(os.path.join(path, "type"), "Unified")
+            if level is None:
+                continue
+            instances = set()
+            for cpu, _ in cpus:
+                shared = read_sysfs(os.path.join(cpu_dir, "cpu%d" % cpu, "cache", index,
+                                                 "shared_cpu_list"))
+                instances.add(shared)
+            caches[index] = {
+                "id": "cache:%d" % len(caches),
+                "class": "memory",
+                "description": "L%s cache" % level,
+                "units": "bytes",
+                "size": _size(read_sysfs(os.path.join(path, "size"))),
+                "configuration": {"level": level, "type": cache_type,
+                                  "instances": str(len(instances))}}
+        node = {
+            "id": "cpu:%d" % package,
+            "class": "processor",
+            "description": "CPU",
+            "physid": str(package),
+            "businfo": "cpu@%d" % package,
+            "configuration": {"cores": str(len({core for _, core in cpus})),
+                              "threads": str(len(cpus)),
+                              "cpus": ",".join(str(cpu) for cpu, _ in cpus)},
+            "children": [caches[index] for index in indexes if index in caches]}
+        if product is not None:
+            node["product"] = product
+        processors.append(node)
+    return {"processors": processors}
+
+
+def numa_topology(root="/sys"):
+    """
+    Build one node per online NUMA node with its cpus, memory and distances.
+
+    :returns dict: {"numas": [node, ...]}
+    """
+    node_dir = os.path.join(root, "devices", "system", "node")
+    numas = []
+    for node in parse_cpu_list(read_sysfs(os.path.join(node_dir, "online"), "")):
+        path = os.path.join(node_dir, "node%d" % node)
+        size = None
+        meminfo = read_sysfs(os.path.join(path, "meminfo"), "")
+        match = re.search(r"MemTotal:\s+(\d+)\s+kB", meminfo)
+        if match is not None:
+            size = int(match.group(1)) * 1024
+        numas.append({
+            "id": "node:%d" % node,
+            "class": "numa",
+            "description": "NUMA node",
+            "physid": str(node),
+            "units": "bytes",
+            "size": size,
+            "configuration": {
+                "cpus": read_sysfs(os.path.join(path, "cpulist"), ""),
+                "distance": read_sysfs(os.path.join(path, "distance"), "")}})
+    return {"numas": numas}
+
+
+def storage_topology(root="/sys"):
+    """
+    Build storage controller nodes with their disks as children.
+
+    :returns dict: {"storages": [node, ...]}
+    """
+    block_dir = os.path.join(root, "block")
+    controllers = {}
+    devices = sorted(os.listdir(block_dir)) if os.path.isdir(block_dir) else []
+    for dev in devices:
+        path = os.path.join(block_dir, dev)
+        if not os.path.exists(os.path.join(path, "device")):
+            continue
+        device = os.path.join(path, "device")
+        disk = {
+            "id": "disk",
+            "class": "disk",
+            "logicalname": "/dev/%s" % dev,
+            "units": "bytes",
+            "size": _int(read_sysfs(os.path.join(path, "size"))) * 512,
+            "configuration": {
+                "rotational": read_sysfs(os.path.join(path, "queue", "rotational"), "0"),
+                "logicalsectorsize": read_sysfs(
+                    os.path.join(path, "queue", "logical_block_size"), "512"),
+                "scheduler": read_sysfs(os.path.join(path, "queue", "scheduler"), "")}}
+        for key, attr in (("vendor", "vendor"), ("product", "model")):
+            value = read_sysfs(os.path.join(device, attr))
+            if value:
+                disk[key] = value
+        businfo = _pci_businfo(device)
+        if businfo not in controllers:
+            controller = {"id": "storage", "class": "storage", "children": []}
+            if businfo is not None:
+                pci = os.path.join(root, "bus", "pci", "devices", businfo)
+                controller["businfo"] = "pci@" + businfo
+                controller["vendor"] = read_sysfs(os.path.join(pci, "vendor"))
+                controller["product"] = read_sysfs(os.path.join(pci, "device"))
+                controller["configuration"] = {
+                    "driver": os.path.basename(os.path.realpath(os.path.join(pci, "driver"))),
+                    "numa_node": read_sysfs(os.path.join(pci, "numa_node"), "-1")}
+            controllers[businfo] = controller
+        controllers[businfo]["children"].append(disk)
+    return {"storages": list(controllers.values())}
+
+
+def network_topology(root="/sys"):
+    """
+    Build network nodes of the physical interfaces with their pci and NUMA locality.
+
+    :returns dict: {"networks": [node, ...]}
+    """
+    net_dir = os.path.join(root, "class", "net")
+    networks = []
+    interfaces = sorted(os.listdir(net_dir)) if os.path.isdir(net_dir) else []
+    for nic in interfaces:
+        path = os.path.join(net_dir, nic)
+        device = os.path.join(path, "device")
+        if not os.path.exists(device):
+            continue
+        speed = _int(read_sysfs(os.path.join(path, "speed")), -1)
+        node = {
+            "id": "network",
+            "class": "network",
+            "description": "Ethernet interface",
+            "logicalname": nic,
+            "serial": read_sysfs(os.path.join(path, "address")),
+            "configuration": {
+                "driver": os.path.basename(os.path.realpath(os.path.join(device, "driver"))),
+                "link": "yes" if read_sysfs(os.path.join(path, "carrier")) == "1" else "no",
+                "duplex": read_sysfs(os.path.join(path, "duplex"), "unknown"),
+                "mtu": read_sysfs(os.path.join(path, "mtu")),
+                "numa_node": read_sysfs(os.path.join(device, "numa_node"), "-1"),
+                "local_cpus": read_sysfs(os.path.join(device, "local_cpulist"), "")}}
+        if speed > 0:
+            node["units"] = "bit/s"
+            node["size"] = speed * 1000000
+            node["configuration"]["speed"] = "%dMbit/s" % speed
+        businfo = _pci_businfo(device)
+        if businfo is not None:
+            node["businfo"] = "pci@" + businfo
+        networks.append(node)
+    return {"networks": networks}
+
+
+def _dmi_strings(raw, length):
+    strings = raw[length:].split(b"\0")
+    return [item.decode(errors="replace").strip() for item in strings]
+
+
+def _dmi_memory_device(raw):
+    """decode a SMBIOS type 17 memory device into a lshw-like bank node"""
+    length = raw[1]
+    strings = _dmi_strings(raw, length)
+
+    def dmi_string(offset):
+        index = raw[offset] if length > offset else 0
+        return strings[index - 1] if 0 < index <= len(strings) else None
+
+    # the handle of the device itself, the one at offset 4 is of its memory array
+    handle = struct.unpack_from("<H", raw, 2)[0]
+    data_width = struct.unpack_from("<H", raw, 0x0A)[0] if length > 0x0B else 0
+    size = struct.unpack_from("<H", raw, 0x0C)[0] if length > 0x0D else 0
+    if size == 0x7FFF and length > 0x1F:
+        size = (struct.unpack_from("<I", raw, 0x1C)[0] & 0x7FFFFFFF) * 1024 * 1024
+    elif size in (0, 0xFFFF):
+        size = None
+    elif size & 0x8000:
+        size = (size & 0x7FFF) * 1024
+    else:
+        size = size * 1024 * 1024
+    speed = struct.unpack_from("<H", raw, 0x15)[0] if length > 0x16 else 0
+
+    bank = {"id": "bank", "class": "memory", "handle": "DMI:%04X" % handle}
+    slot = dmi_string(0x10)
+    if slot:
+        bank["slot"] = slot
+    if size is None:
+        bank["description"] = "[empty]"
+        return bank
+
+    form = DMI_FORM_FACTORS.get(raw[0x0E] if length > 0x0E else 0, "")
+    mem_type = DMI_MEMORY_TYPES.get(raw[0x12] if length > 0x12 else 0, "")
+    description = " ".join(item for item in (form, mem_type) if item)
+    if speed not in (0, 0xFFFF):
+        description += " %d MHz (%.1f ns)" % (speed, 1000.0 / speed)
+        bank["clock"] = speed * 1000000
+    bank["description"] = description.strip()
+    bank["units"] = "bytes"
+    bank["size"] = size
+    if data_width not in (0, 0xFFFF):
+        bank["width"] = data_width
+    for key, offset in (("vendor", 0x17), ("serial", 0x18), ("product", 0x1A)):
+        value = dmi_string(offset)
+        if value:
+            bank[key] = value
+    return bank
+
+
+def memory_topology(root="/sys"):
+    """
+    Build the 'System Memory' nodes with the DIMMs from the SMBIOS entries.
+
+    :returns dict: {"memorys": [node, ...]}, empty if the entries are not readable
+    """
+    entry_dir = os.path.join(root, "firmware", "dmi", "entries")
+    arrays = {}
+    entries = os.listdir(entry_dir) if os.path.isdir(entry_dir) else []
+    for entry in sorted(entries, key=lambda name: _int(name.split("-")[-1])):
+        if not entry.startswith("17-"):
+            continue
+        try:
+            with open(os.path.join(entry_dir, entry, "raw"), 'rb') as file:
+                raw = file.read()
+        except (IOError, OSError):
+            continue
+        if len(raw) < 0x0E:
+            continue
+        array = struct.unpack_from("<H", raw, 4)[0]
+        arrays.setdefault(array, []).append(_dmi_memory_device(raw))
+
+    memorys = []
+    for array in sorted(arrays):
+        banks = arrays[array]
+        for i, bank in enumerate(banks):
+            bank["id"] = "bank:%d" % i
+            bank["physid"] = str(i)
+        memorys.append({
+            "id": "memory" if len(arrays) == 1 else "memory:%d" % len(memorys),
+            "class": "memory",
+            "description": "System Memory",
+            "units": "bytes",
+            "size": sum(bank.get("size", 0) for bank in banks),
+            "children": banks})
+    return {"memorys": memorys}
@@ -15,6 +15,6 @@
 The import content of the package.
 """
 
-__all__ = ["bios", "ldavg", "tasks", "filed", "interrupts"]
+__all__ = ["bios", "ldavg", "tasks", "filed", "interrupts", "psi", "irqrate", "softirq"]
 
-from . import bios, ldavg, tasks, filed, interrupts
+from . import bios, ldavg, tasks, filed, interrupts, psi, irqrate, softirq
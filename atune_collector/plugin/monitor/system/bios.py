@@ -15,8 +15,8 @@
 The sub class of the monitor, used to collect the system BIOS info.
 """
 
-import subprocess
 import json
+from .. import topocache
 from ..common import Monitor, walk_class_type
 
 
@@ -32,10 +32,8 @@ class SysBiosInfo(Monitor):
         self.format.__func__.__doc__ = Monitor.format.__doc__ % ("xml, json")
 
     def _get(self, _):
-        with open('/dev/null', 'w') as no_print:
-            output = subprocess.check_output("{cmd} {opt}".format(
-                cmd=self.__cmd, opt=self._option).split(), stderr=no_print)
-        return output.decode()
+        return topocache.check_output("{cmd} {opt}".format(
+            cmd=self.__cmd, opt=self._option))
 
     def format(self, info, fmt):
         """
@@ -45,10 +43,7 @@ class SysBiosInfo(Monitor):
         :returns output:  converted result
         """
         if fmt in ("json", "xml"):
-            with open("/dev/null") as no_print:
-                o_json = subprocess.check_output("{cmd} -json".format(
-                    cmd=self.__cmd).split(), stderr=no_print)
-            info = o_json.decode()
+            info = topocache.check_output("{cmd} -json".format(cmd=self.__cmd))
             json_content = json.loads(info)
 
             datas = []
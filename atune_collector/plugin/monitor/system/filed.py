@@ -19,6 +19,7 @@ import logging
 import getopt
 import re
 from ..common import Monitor
+from ..procfile import ProcFile
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,11 +34,10 @@ class SysFdUtil(Monitor):
         Monitor.__init__(self, user)
         self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
             "--fields=allocated/pending/maximum/fd-util")
+        self.__file = ProcFile(self._option)
 
     def _get(self, _):
-        with open(self._option, 'r') as file:
-            fdinfo = file.read()
-        return fdinfo
+        return self.__file.read_text()
 
     def decode(self, info, para):
         """
@@ -16,26 +16,60 @@ The sub class of the monitor, used to collect the system device interrupts.
 """
 import getopt
 import re
-import subprocess
+import numpy as np
 from ..common import Monitor
+from ..procfile import ProcFile
+
+
+def parse_interrupts(content):
+    """
+    Parse the content of /proc/interrupts.
+
+    :param content: content of /proc/interrupts
+    :returns tuple: (cpus, labels, names, counts), cpus are the cpu numbers of
+                    the columns, labels and names are the irq number or symbol
+                    and the last word of its description, counts is the
+                    irq x cpu matrix, lines without per cpu counts are skipped
+    """
+    lines = content.splitlines()
+    if not lines:
+        return [], [], [], np.zeros((0, 0), dtype=np.int64)
+    cpus = [int(cpu[3:]) for cpu in lines[0].split()]
+    ncpu = len(cpus)
+    labels = []
+    names = []
+    columns = []
+    for line in lines[1:]:
+        fields = line.split(None, ncpu + 1)
+        if len(fields) <= ncpu or not fields[0].endswith(":") or not fields[ncpu].isdigit():
+            continue
+        labels.append(fields[0][:-1])
+        rest = fields[ncpu + 1].split() if len(fields) > ncpu + 1 else []
+        names.append(rest[-1] if rest else "")
+        columns.extend(fields[1:ncpu + 1])
+    if not columns:
+        return cpus, labels, names, np.zeros((0, ncpu), dtype=np.int64)
+    # convert all counts at once instead of per field
+    counts = np.fromstring(" ".join(columns), dtype=np.int64, sep=" ")
+    return cpus, labels, names, counts.reshape(len(labels), ncpu)
 
 
 class SysInterrupts(Monitor):
     """To collect the system device interrupts"""
     _module = "SYS"
     _purpose = "INTERRUPTS"
-    _option = '{print$1$NF}'
-    _path = "/proc/interrupts"
+    _option = "/proc/interrupts"
 
     def __init__(self, user=None):
         Monitor.__init__(self, user)
+        self.__file = None
         self.decode.__func__.__doc__ = Monitor.decode.__doc__ % "--nic=x"
-        self.__cmd = "awk"
 
     def _get(self, _):
-        output = subprocess.check_output("{cmd} {opt} {path}".format(
-            cmd=self.__cmd, opt=self._option, path=self._path).split())
-        return output.decode()
+        if self.__file is None:
+            self.__file = ProcFile(self._option)
+        _, labels, names, _ = parse_interrupts(self.__file.read_text())
+        return "\n".join("{}:{}".format(label, name) for label, name in zip(labels, names))
 
     def decode(self, info, para):
         """
@@ -0,0 +1,185 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the rates of the system device interrupts.
+"""
+import inspect
+import logging
+import getopt
+import re
+import time
+import numpy as np
+from ..common import Monitor
+from ..procfile import ProcFile
+from .interrupts import parse_interrupts
+
+LOGGER = logging.getLogger(__name__)
+
+IRQ_PATTERN = re.compile(r"^irq (\S+) (\S*) : (\S+)$", re.MULTILINE)
+# topN is the rate of the N-th hottest irq and topN_irq its number, -1 for the symbolic ones
+TOP_PATTERN = re.compile(r"^top(\d+)(_irq)?$")
+# nic_queueN is the rate of the N-th irq of the nics in the order of the irq numbers
+QUEUE_PATTERN = re.compile(r"^nic_queue(\d+)$")
+FIELDS = ("total", "cpu_max", "cpu_mean", "imbalance", "nic", "nic_imbalance")
+
+
+def nic_pattern(devices):
+    """
+    Get the pattern of the irq names of the nic queues.
+
+    :param devices: the nic names
+    :returns Pattern: matching a nic as a whole word of the name, so that
+                      eth1 matches eth1-TxRx-0 but not eth10-TxRx-0
+    """
+    return re.compile("|".join(r"(?<![A-Za-z0-9]){}(?![A-Za-z0-9])".format(re.escape(device))
+                               for device in devices) or r"(?!)")
+
+
+class SysIrqRate(Monitor):
+    """To collect the rates of the system device interrupts"""
+    _module = "SYS"
+    _purpose = "IRQRATE"
+    _option = "/proc/interrupts"
+
+    def __init__(self, user=None):
+        Monitor.__init__(self, user)
+        self.__file = None
+        self.__interval = 1
+        self.__last_time = None
+        self.__last_labels = []
+        self.__last_counts = None
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--nic=x, --fields=total/cpu_max/cpu_mean/imbalance/topN/topN_irq/nic/nic_queueN/"
+            "nic_imbalance")
+
+    def __rates(self, labels, counts, elapsed):
+        """per irq per cpu rates of the irqs and cpus also found in the last round"""
+        if self.__last_counts is None or elapsed <= 0:
+            return np.zeros(counts.shape)
+        last = self.__last_counts
+        if labels != self.__last_labels or last.shape[1] != counts.shape[1]:
+            # irqs are added or removed, or cpus are hotplugged
+            rows = {label: row for row, label in enumerate(self.__last_labels)}
+            ncpu = min(last.shape[1], counts.shape[1])
+            aligned = counts.copy()
+            for row, label in enumerate(labels):
+                if label in rows:
+                    aligned[row, :ncpu] = last[rows[label], :ncpu]
+            last = aligned
+        return np.maximum(counts - last, 0) / elapsed
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None, ['interval='])
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+
+        if self.__file is None:
+            self.__file = ProcFile(self._option)
+        cpus, labels, names, counts = parse_interrupts(self.__file.read_text())
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        rates = self.__rates(labels, counts, elapsed)
+        self.__last_time = now
+        self.__last_labels = labels
+        self.__last_counts = counts
+
+        irq_rates = rates.sum(axis=1)
+        cpu_rates = rates.sum(axis=0)
+        cpu_max = cpu_rates.max() if len(cpus) > 0 else 0.0
+        cpu_mean = cpu_rates.mean() if len(cpus) > 0 else 0.0
+        output = "cpus : {}\n".format(len(cpus))
+        output += "total : {:.3f}\n".format(irq_rates.sum())
+        output += "cpu_max : {:.3f}\n".format(cpu_max)
+        output += "cpu_mean : {:.3f}\n".format(cpu_mean)
+        output += "imbalance : {:.3f}\n".format(cpu_max / cpu_mean if cpu_mean > 0 else 0.0)
+        # the hottest irqs first
+        for row in np.argsort(-irq_rates, kind="stable"):
+            output += "irq {} {} : {:.3f}\n".format(labels[row], names[row], irq_rates[row])
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+
+        keys = []
+        nic = ""
+        opts, _ = getopt.getopt(para.split(), None, ['nic=', 'fields=', 'device='])
+        for opt, val in opts:
+            if opt in '--nic':
+                nic = val
+                continue
+            if opt in '--fields':
+                if val not in FIELDS and TOP_PATTERN.match(val) is None and \
+                        QUEUE_PATTERN.match(val) is None:
+                    err = LookupError("Fail to find data for {}".format(val))
+                    LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                 inspect.stack()[0][3], str(err))
+                    raise err
+                keys.append(val)
+                continue
+
+        summary = {}
+        for line in info.splitlines():
+            field, _, value = line.partition(" : ")
+            if not field.startswith("irq "):
+                summary[field] = value
+        irqs = IRQ_PATTERN.findall(info)
+
+        # the queues of the nics, in the order of the irq numbers
+        pattern = nic_pattern([device.strip() for device in nic.split(',') if device.strip()])
+        queues = [rate for _, rate in sorted(
+            (int(label), float(rate)) for label, name, rate in irqs
+            if label.isdigit() and pattern.search(name) is not None)]
+
+        ret = ""
+        for key in keys:
+            top = TOP_PATTERN.match(key)
+            queue = QUEUE_PATTERN.match(key)
+            if top is not None:
+                index = int(top.group(1)) - 1
+                if not 0 <= index < len(irqs):
+                    value = "-1" if top.group(2) else "0"
+                elif top.group(2):
+                    value = irqs[index][0] if irqs[index][0].isdigit() else "-1"
+                else:
+                    value = irqs[index][2]
+            elif queue is not None:
+                index = int(queue.group(1)) - 1
+                value = "{:.3f}".format(queues[index]) if 0 <= index < len(queues) else "0"
+            elif key == "nic":
+                value = "{:.3f}".format(sum(queues))
+            elif key == "nic_imbalance":
+                mean = sum(queues) / len(queues) if queues else 0
+                value = "{:.3f}".format(max(queues) / mean if mean > 0 else 0)
+            else:
+                value = summary.get(key, "0")
+            ret = ret + " " + value
+        return ret
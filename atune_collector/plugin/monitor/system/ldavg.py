@@ -20,6 +20,7 @@ import subprocess
 import getopt
 import re
 from ..common import Monitor
+from ..procfile import ProcFile
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +35,7 @@ class SysLdavg(Monitor):
         Monitor.__init__(self, user)
         self.__cmd = "sar"
         self.__interval = 1
+        self.__threads_max = ProcFile("/proc/sys/kernel/threads-max")
         self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
             "--fields=time/runq-sz/plist-sz/ldavg-1/ldavg-5/ldavg-15/blocked/task-util")
 
@@ -103,8 +105,7 @@ class SysLdavg(Monitor):
             if type(i).__name__ == 'int':
                 ret = ret + " " + search_obj[-1][i]
             elif i == "task-util":
-                with open("/proc/sys/kernel/threads-max", 'r') as file:
-                    threads_max = file.read()
+                threads_max = self.__threads_max.read_text()
                 util = int(search_obj[-1][keyword["plist-sz"]]) / \
                     int(threads_max) * 100
                 ret = ret + " " + str(util)
@@ -0,0 +1,273 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the pressure stall information,
+and the psi triggers, used to wait for pressure spikes reported by the kernel.
+"""
+import inspect
+import logging
+import getopt
+import os
+import re
+import select
+import time
+from ..common import Monitor
+from ..procfile import ProcFile
+
+LOGGER = logging.getLogger(__name__)
+
+PSI_RESOURCES = ("cpu", "memory", "io", "irq")
+PSI_KINDS = ("some", "full")
+PSI_PATTERN = re.compile(
+    r"^(some|full) avg10=(\d+\.?\d*) avg60=(\d+\.?\d*) avg300=(\d+\.?\d*) total=(\d+)",
+    re.MULTILINE)
+
+# avg10 and avg60 are reported by the kernel in percent, total is the stall
+# time of the last round in percent of the round
+PSI_FIELDS = ["{}_{}_{}".format(resource, kind, item)
+              for resource in PSI_RESOURCES
+              for kind in PSI_KINDS
+              for item in ("avg10", "avg60", "total")]
+
+# seconds between the attempts to register the psi triggers which failed
+TRIGGER_RETRY = 60
+
+
+class SysPsi(Monitor):
+    """To collect the pressure stall information"""
+    _module = "SYS"
+    _purpose = "PSI"
+    _option = "/proc/pressure"
+
+    def __init__(self, user=None):
+        Monitor.__init__(self, user)
+        self.__interval = 1
+        self.__last_time = None
+        self.__last_totals = {}
+        self.__files = {}
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--fields=" + "/".join(PSI_FIELDS))
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None, ['interval='])
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        totals = {}
+        output = ""
+        for resource in PSI_RESOURCES:
+            if resource not in self.__files:
+                self.__files[resource] = ProcFile(os.path.join(self._option, resource))
+            if self.__files[resource] is None:
+                continue
+            try:
+                content = self.__files[resource].read_text()
+            except (IOError, OSError):
+                # irq pressure depends on the kernel config, do not retry
+                self.__files[resource] = None
+                continue
+            for kind, avg10, avg60, _, total in PSI_PATTERN.findall(content):
+                key = "{}_{}".format(resource, kind)
+                totals[key] = int(total)
+                last = self.__last_totals.get(key)
+                rate = 0.0
+                if last is not None and elapsed > 0:
+                    # total is in usec
+                    rate = (int(total) - last) / elapsed / 1e4
+                output += "{}_avg10 : {}\n".format(key, avg10)
+                output += "{}_avg60 : {}\n".format(key, avg60)
+                output += "{}_total : {:.3f}\n".format(key, rate)
+        self.__last_time = now
+        self.__last_totals = totals
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+
+        keys = []
+        opts, _ = getopt.getopt(para.split(), None, ['nic=', 'fields=', 'device='])
+        for opt, val in opts:
+            if opt in '--fields':
+                if val not in PSI_FIELDS:
+                    err = LookupError("Fail to find data for {}".format(val))
+                    LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                 inspect.stack()[0][3], str(err))
+                    raise err
+                keys.append(val)
+                continue
+
+        data = {}
+        for line in info.splitlines():
+            field, _, value = line.partition(" : ")
+            data[field] = value
+
+        ret = ""
+        for key in keys:
+            ret = ret + " " + data.get(key, "0")
+        return ret
+
+
+class PsiTrigger:
+    """
+    A psi trigger of one resource. The kernel notifies POLLPRI on the open
+    pressure file when the stall time exceeds threshold within the window.
+    """
+
+    def __init__(self, resource, kind="some", threshold=100, window=1000, proc="/proc/pressure"):
+        """
+        :param resource: cpu/memory/io/irq
+        :param kind: some/full
+        :param threshold: the stall time in ms
+        :param window: the tracking window in ms, 500 to 10000
+        :param proc: the directory of the pressure files
+        """
+        if resource not in PSI_RESOURCES or kind not in PSI_KINDS:
+            raise ValueError("Invalid psi trigger: {} {}".format(resource, kind))
+        if not 0 < threshold <= window:
+            raise ValueError("Invalid psi trigger threshold: {}/{}".format(threshold, window))
+        self.resource = resource
+        self.kind = kind
+        self.threshold = threshold
+        self.window = window
+        self.__path = os.path.join(proc, resource)
+        self.__fd = None
+
+    def open(self):
+        """
+        Register the trigger, it is removed when the file is closed.
+
+        :returns: None
+        :raises OSError: Fail, psi triggers are not supported or permitted
+        """
+        fd = os.open(self.__path, os.O_RDWR | os.O_NONBLOCK)
+        try:
+            os.write(fd, "{} {} {}\0".format(self.kind, self.threshold * 1000,
+                                            self.window * 1000).encode())
+        except OSError:
+            os.close(fd)
+            raise
+        self.__fd = fd
+
+    def fileno(self):
+        """the fd to poll, None if it is not open"""
+        return self.__fd
+
+    def close(self):
+        """unregister the trigger"""
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    def __str__(self):
+        return "{}_{}>{}ms/{}ms".format(self.resource, self.kind, self.threshold, self.window)
+
+
+class PsiWatcher:
+    """
+    Wait for any of the psi triggers without polling cost when idle. A trigger
+    failing to register, such as when the pressure files are not writable yet,
+    is logged once and registered again every retry seconds while waiting.
+    """
+
+    def __init__(self, triggers, retry=TRIGGER_RETRY):
+        self.__triggers = {}
+        self.__failed = []
+        self.__retry = retry
+        self.__retried = time.monotonic()
+        self.__poll = select.poll()
+        for trigger in triggers:
+            try:
+                self.__register(trigger)
+            except OSError as err:
+                LOGGER.error("%s.%s: fail to register psi trigger %s, retry every %ss: %s",
+                             self.__class__.__name__, inspect.stack()[0][3],
+                             trigger, retry, str(err))
+                self.__failed.append(trigger)
+
+    def __register(self, trigger):
+        trigger.open()
+        self.__triggers[trigger.fileno()] = trigger
+        self.__poll.register(trigger.fileno(), select.POLLPRI)
+
+    def __retry_failed(self):
+        """register the failed triggers again, once per retry period"""
+        now = time.monotonic()
+        if not self.__failed or now - self.__retried < self.__retry:
+            return
+        self.__retried = now
+        failed = []
+        for trigger in self.__failed:
+            try:
+                self.__register(trigger)
+            except OSError:
+                failed.append(trigger)
+                continue
+            LOGGER.info("%s.%s: psi trigger %s registered", self.__class__.__name__,
+                        inspect.stack()[0][3], trigger)
+        self.__failed = failed
+
+    @property
+    def triggers(self):
+        """the registered triggers"""
+        return list(self.__triggers.values())
+
+    @property
+    def failed(self):
+        """the triggers failing to register, retried while waiting"""
+        return list(self.__failed)
+
+    def wait(self, timeout=None):
+        """
+        Wait until some triggers fire.
+
+        :param timeout: max time to wait in ms, None to wait forever
+        :returns list: the fired triggers, empty on timeout
+        :raises OSError: Fail, the pressure files become invalid
+        """
+        self.__retry_failed()
+        fired = []
+        for fd, event in self.__poll.poll(timeout):
+            if event & (select.POLLERR | select.POLLNVAL):
+                raise OSError("psi trigger {} is invalid".format(self.__triggers[fd]))
+            if event & select.POLLPRI:
+                fired.append(self.__triggers[fd])
+        return fired
+
+    def close(self):
+        """unregister all triggers"""
+        for fd, trigger in self.__triggers.items():
+            self.__poll.unregister(fd)
+            trigger.close()
+        self.__triggers = {}
+        self.__failed = []
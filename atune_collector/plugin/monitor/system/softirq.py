@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The sub class of the monitor, used to collect the rates of the softirqs.
+"""
+import inspect
+import logging
+import getopt
+import time
+import numpy as np
+from ..common import Monitor, percpu_summary, decode_fields
+from ..procfile import ProcFile
+from .interrupts import parse_interrupts
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SysSoftirq(Monitor):
+    """To collect the rates of the softirqs"""
+    _module = "SYS"
+    _purpose = "SOFTIRQ"
+    _option = "/proc/softirqs"
+
+    def __init__(self, user=None):
+        Monitor.__init__(self, user)
+        self.__file = None
+        self.__interval = 1
+        self.__last_time = None
+        self.__last_counts = None
+        self.decode.__func__.__doc__ = Monitor.decode.__doc__ % (
+            "--fields=TYPE.total/TYPE.max/TYPE.imbalance/TYPE.cpuN, "
+            "TYPE is HI/TIMER/NET_TX/NET_RX/BLOCK/IRQ_POLL/TASKLET/SCHED/HRTIMER/RCU")
+
+    def _get(self, para=None):
+        if para is not None:
+            opts, _ = getopt.getopt(para.split(), None, ['interval='])
+            for opt, val in opts:
+                if opt in '--interval':
+                    if val.isdigit():
+                        self.__interval = int(val)
+                    else:
+                        err = ValueError(
+                            "Invalid parameter: {opt}={val}".format(
+                                opt=opt, val=val))
+                        LOGGER.error("%s.%s: %s", self.__class__.__name__,
+                                     inspect.stack()[0][3], str(err))
+                        raise err
+                    continue
+
+        # softirqs have the same layout as interrupts without descriptions
+        if self.__file is None:
+            self.__file = ProcFile(self._option)
+        cpus, types, _, counts = parse_interrupts(self.__file.read_text())
+        now = time.monotonic()
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        if self.__last_counts is None or self.__last_counts.shape != counts.shape or elapsed <= 0:
+            rates = np.zeros(counts.shape)
+        else:
+            rates = np.maximum(counts - self.__last_counts, 0) / elapsed
+        self.__last_time = now
+        self.__last_counts = counts
+
+        output = ""
+        for row, softirq in enumerate(types):
+            output += percpu_summary(softirq, cpus, rates[row])
+        return output
+
+    def decode(self, info, para):
+        """
+        decode the result of the operation
+        :param info:  content that needs to be decoded
+        :param para:  command line argument
+        :returns ret:  operation result
+        """
+        if para is None:
+            return info
+        return decode_fields(self, info, para)
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The persistent cache of the hardware topology, shared by the topo monitors.
+The output of lshw and lstopo only changes on reboot or hotplug, so it is kept
+under /run and keyed by the boot id, the online cpus and nodes, the DMI tables,
+and the block devices and network interfaces present.
+"""
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_PATH = "/run/atune_collector/topology.json"
+
+# the cache is valid as long as all of these files keep their content, the DMI
+# tables are only readable by root, the modalias of the board is readable by all
+GENERATION_FILES = (
+    "/proc/sys/kernel/random/boot_id",
+    "/sys/devices/system/cpu/online",
+    "/sys/devices/system/node/online",
+    "/sys/class/dmi/id/modalias",
+    "/sys/firmware/dmi/tables/DMI",
+)
+
+# the cache is also valid as long as these directories keep their entries, so a
+# hotplugged disk or nic refreshes the storage and network topology
+GENERATION_DIRS = (
+    "/sys/block",
+    "/sys/class/net",
+)
+
+
+class TopologyCache:
+    """Cache of topology command outputs, invalidated by reboot or hotplug"""
+
+    def __init__(self, path=CACHE_PATH, generation_files=GENERATION_FILES,
+                 generation_dirs=GENERATION_DIRS):
+        self.__path = path
+        self.__generation_files = generation_files
+        self.__generation_dirs = generation_dirs
+        self.__lock = threading.Lock()
+        self.__generation = None
+        self.__entries = {}
+        self.__loaded = False
+
+    def generation(self):
+        """
+        Get the current generation of the hardware.
+
+        :returns list: digest of the content of all generation files and of the sorted
+                       entries of all generation dirs, None for missing one
+        """
+        generation = []
+        for path in self.__generation_files:
+            try:
+                with open(path, 'rb') as file:
+                    generation.append(hashlib.sha1(file.read()).hexdigest())
+            except (IOError, OSError):
+                generation.append(None)
+        for path in self.__generation_dirs:
+            try:
+                entries = "\n".join(sorted(os.listdir(path)))
+                generation.append(hashlib.sha1(entries.encode()).hexdigest())
+            except (IOError, OSError):
+                generation.append(None)
+        return generation
+
+    def __load(self):
+        self.__loaded = True
+        try:
+            with open(self.__path, 'r') as file:
+                content = json.load(file)
+            self.__generation = content["generation"]
+            self.__entries = content["entries"]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            self.__generation = None
+            self.__entries = {}
+
+    def __store(self):
+        """
+        Write the cache to a unique temporary file renamed over it, so a reader never
+        sees a partial cache, even with several collectors storing at once.
+        """
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.__path)
+            os.makedirs(directory, 0o750, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".topology.", dir=directory)
+            with os.fdopen(fd, 'w') as file:
+                json.dump({"generation": self.__generation, "entries": self.__entries}, file)
+            os.chmod(tmp_path, 0o640)
+            os.replace(tmp_path, self.__path)
+        except (IOError, OSError) as err:
+            LOGGER.info("fail to store topology cache %s: %s", self.__path, str(err))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def check_output(self, cmd):
+        """
+        Get the output of a topology command, run it only if it is not cached.
+
+        :param cmd: the command string, which is also the cache key
+        :returns output: Success, decoded output of the command
+        :raises Exceptions: Fail, the command fails
+        """
+        generation = self.generation()
+        with self.__lock:
+            if not self.__loaded:
+                self.__load()
+            if self.__generation != generation:
+                self.__generation = generation
+                self.__entries = {}
+            if cmd in self.__entries:
+                return self.__entries[cmd]
+
+        with open('/dev/null', 'w') as no_print:
+            output = subprocess.check_output(cmd.split(), stderr=no_print).decode()
+
+        with self.__lock:
+            if self.__generation == generation:
+                self.__entries[cmd] = output
+                self.__store()
+        return output
+
+    def invalidate(self):
+        """
+        Drop all cached outputs, both in memory and on disk.
+
+        :returns: None
+        """
+        with self.__lock:
+            self.__loaded = True
+            self.__generation = None
+            self.__entries = {}
+            try:
+                os.remove(self.__path)
+            except (IOError, OSError):
+                pass
+
+
+CACHE = TopologyCache()
+
+
+def check_output(cmd):
+    """get the output of a topology command through the shared cache"""
+    return CACHE.check_output(cmd)
+
+
+def invalidate():
+    """drop the shared topology cache"""
+    CACHE.invalidate()
@@ -127,14 +127,17 @@ class MPI:
             raise err
         return mpis[0]
 
-    def get_monitors_data(self, monitors, pool=None):
+    def get_monitors_data(self, monitors, pool=None, out=None):
         """
         Get given monitors report data in one.
 
         :param monitors: ((module, purpose, options), ...)
                 options is for report(para)
         :param pool: monitors pool for looking up
+        :param out: float array to write the data into, each monitor fills the
+                slice following the previous one
         :returns list: Success, decoded data strings of all given monitors
+        :returns out: Success, the given out filled with the data
         :returns Exceptions: Success, formatted info
         :raises LookupError: Fail, find monitor error
         """
@@ -149,6 +152,7 @@ class MPI:
             m_thread.start()
 
         rets = []
+        pos = 0
         for m_thread in mts:
             start = time.time()
             ret = m_thread.get_result()
@@ -157,8 +161,22 @@ class MPI:
                          end - start, m_thread.func, str(ret))
             if isinstance(ret, Exception):
                 return ret
-            rets += ret
-        return rets
+            if out is None:
+                rets += ret
+                continue
+            if pos + len(ret) > len(out):
+                err = ValueError("Too many data for {} columns".format(len(out)))
+                LOGGER.error("MPI.%s: %s", inspect.stack()[0][3], str(err))
+                return err
+            out[pos:pos + len(ret)] = ret
+            pos += len(ret)
+        if out is None:
+            return rets
+        if pos != len(out):
+            err = ValueError("Got {} data for {} columns".format(pos, len(out)))
+            LOGGER.error("MPI.%s: %s", inspect.stack()[0][3], str(err))
+            return err
+        return out
 
 
 class CPI:
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The matrix of collected samples, one row per sample and one column per field.
+"""
+import collections
+import time
+
+import numpy as np
+
+DEFAULT_CHUNK = 1024
+
+# a collected sample: the time it was taken, the row of values and the field
+# names of the row, values is a view of the SampleMatrix holding the sample
+Sample = collections.namedtuple("Sample", ["timestamp", "values", "fields"])
+
+
+class SampleMatrix:
+    """
+    Samples stored in float64 rows. With capacity, all rows are preallocated in
+    one array; without it, the matrix grows by chunks of rows for unbounded runs,
+    so rows already written are never copied. With retain, the oldest chunk is
+    dropped and reused once the other chunks hold at least retain rows, so long
+    running consumers such as the UI use bounded memory. Since the chunk being
+    filled may hold a single row, the previous chunk is kept as well, even with
+    a retain of 1.
+    """
+
+    def __init__(self, field_names, capacity=None, chunk=DEFAULT_CHUNK, retain=None):
+        """
+        :param field_names: the names of the columns
+        :param capacity: the number of samples, None for unbounded
+        :param chunk: the number of rows of each chunk when unbounded
+        :param retain: the min number of latest rows kept when unbounded, None for all
+        """
+        self.field_names = list(field_names)
+        self.index = {name: column for column, name in enumerate(self.field_names)}
+        self.__chunk = max(capacity, 1) if capacity is not None else chunk
+        self.__bounded = capacity is not None
+        self.__retain = retain
+        self.__chunks = []
+        self.__times = []
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def width(self):
+        """the number of fields"""
+        return len(self.field_names)
+
+    def next_row(self, timestamp=None):
+        """
+        Take the row of the next sample.
+
+        :param timestamp: the time of the sample, now by default
+        :returns ndarray: writable view of the row
+        :raises IndexError: Fail, the bounded matrix is full
+        """
+        chunk, row = divmod(self.__count, self.__chunk)
+        if chunk == len(self.__chunks):
+            if self.__bounded and self.__chunks:
+                raise IndexError("sample matrix is full: {} rows".format(self.__count))
+            if self.__retain is not None and self.__count - self.__chunk >= self.__retain:
+                # the views of the rows of the dropped chunk are overwritten
+                self.__chunks.append(self.__chunks.pop(0))
+                self.__times.append(self.__times.pop(0))
+                self.__count -= self.__chunk
+                chunk -= 1
+            else:
+                self.__chunks.append(np.zeros((self.__chunk, self.width)))
+                self.__times.append(np.zeros(self.__chunk))
+        self.__times[chunk][row] = time.time() if timestamp is None else timestamp
+        self.__count += 1
+        return self.__chunks[chunk][row]
+
+    def drop_last(self):
+        """drop the last row, such as when collecting it fails"""
+        if self.__count > 0:
+            self.__count -= 1
+
+    def row(self, index):
+        """
+        Get a row.
+
+        :param index: the row number, negative from the end
+        :returns ndarray: view of the row
+        """
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("sample index out of range: {}".format(index))
+        chunk, row = divmod(index, self.__chunk)
+        return self.__chunks[chunk][row]
+
+    def timestamp(self, index):
+        """get the time of a row"""
+        if index < 0:
+            index += self.__count
+        chunk, row = divmod(index, self.__chunk)
+        return self.__times[chunk][row]
+
+    def chunks(self):
+        """
+        Iterate the filled rows chunk by chunk.
+
+        :returns iterator: (timestamps, rows) views of each chunk
+        """
+        remain = self.__count
+        for times, rows in zip(self.__times, self.__chunks):
+            if remain <= 0:
+                break
+            size = min(remain, self.__chunk)
+            yield times[:size], rows[:size]
+            remain -= size
+
+    def array(self):
+        """
+        Get all filled rows as one array.
+
+        :returns ndarray: a view when the rows are in one chunk, otherwise a copy
+        """
+        parts = [rows for _, rows in self.chunks()]
+        if not parts:
+            return np.zeros((0, self.width))
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def column(self, name):
+        """
+        Get all values of a field.
+
+        :param name: the field name
+        :returns ndarray: see array()
+        """
+        return self.array()[:, self.index[name]]
@@ -0,0 +1,489 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The summary of a collection run: the moments and quantiles of each field,
+updated sample by sample in constant memory, so the statistics are known when
+the run ends without reading the csv file again.
+"""
+import base64
+import json
+import math
+import zlib
+
+import numpy as np
+
+# the quantiles are within 1% of the exact values
+DEFAULT_ACCURACY = 0.01
+DEFAULT_BINS = 2048
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+# the values closer to zero are counted as zero
+MIN_VALUE = 1e-9
+# a field has changed when the means of the two halves of the run differ by
+# CHANGE_EFFECT times the pooled stddev and by CHANGE_RELATIVE of the first mean
+CHANGE_EFFECT = 1.0
+CHANGE_RELATIVE = 0.05
+
+
+class RunningStats:
+    """
+    Count, mean, variance, min and max of each field, updated by Welford's
+    algorithm. nan values are not counted.
+    """
+
+    def __init__(self, width):
+        self.count = np.zeros(width, dtype=np.int64)
+        self.mean = np.full(width, np.nan)
+        self.min = np.full(width, np.nan)
+        self.max = np.full(width, np.nan)
+        self.__m2 = np.zeros(width)
+
+    def update(self, row):
+        """add a row of values"""
+        row = np.asarray(row, dtype=float)
+        valid = ~np.isnan(row)
+        first = valid & (self.count == 0)
+        self.mean[first] = 0.0
+        self.min[first] = row[first]
+        self.max[first] = row[first]
+        self.count[valid] += 1
+        delta = row[valid] - self.mean[valid]
+        self.mean[valid] += delta / self.count[valid]
+        self.__m2[valid] += delta * (row[valid] - self.mean[valid])
+        np.fmin(self.min, row, out=self.min)
+        np.fmax(self.max, row, out=self.max)
+
+    def update_rows(self, rows):
+        """add the rows of a block at once, merged by Chan's parallel algorithm"""
+        rows = np.asarray(rows, dtype=float)
+        valid = ~np.isnan(rows)
+        count = valid.sum(axis=0)
+        has = count > 0
+        if not has.any():
+            return
+        mean = np.divide(np.where(valid, rows, 0).sum(axis=0), count,
+                         out=np.zeros(len(count)), where=has)
+        m2 = np.where(valid, (rows - mean) ** 2, 0).sum(axis=0)
+        with np.errstate(all="ignore"):
+            low = np.fmin.reduce(rows, axis=0)
+            high = np.fmax.reduce(rows, axis=0)
+        self.__combine(np.arange(len(count)), count, mean, m2, low, high)
+
+    def merge(self, other, columns=None):
+        """
+        Add the values counted by other statistics.
+
+        :param other: RunningStats
+        :param columns: the columns of self of each column of other, the same columns if None
+        """
+        columns = np.arange(len(other.count)) if columns is None else np.asarray(columns)
+        self.__combine(columns, other.count, other.mean, other.__m2, other.min, other.max)
+
+    def __combine(self, columns, count, mean, m2, low, high):
+        """merge the moments of other values into the columns"""
+        has = count > 0
+        columns, count, mean, m2 = columns[has], count[has], mean[has], m2[has]
+        self.mean[columns[self.count[columns] == 0]] = 0.0
+        total = self.count[columns] + count
+        delta = mean - self.mean[columns]
+        self.mean[columns] += delta * count / total
+        self.__m2[columns] += m2 + delta ** 2 * self.count[columns] * count / total
+        self.count[columns] = total
+        self.min[columns] = np.fmin(self.min[columns], low[has])
+        self.max[columns] = np.fmax(self.max[columns], high[has])
+
+    def state(self):
+        """the statistics as lists, see from_state"""
+        return {"count": self.count.tolist(), "mean": self.mean.tolist(),
+                "m2": self.__m2.tolist(), "min": self.min.tolist(), "max": self.max.tolist()}
+
+    @classmethod
+    def from_state(cls, state):
+        """restore the statistics saved by state()"""
+        stats = cls(len(state["count"]))
+        stats.count = np.array(state["count"], dtype=np.int64)
+        stats.mean = np.array(state["mean"], dtype=float)
+        stats.__m2 = np.array(state["m2"], dtype=float)
+        stats.min = np.array(state["min"], dtype=float)
+        stats.max = np.array(state["max"], dtype=float)
+        return stats
+
+    @property
+    def variance(self):
+        """the sample variance, nan for fields with less than 2 values"""
+        return np.divide(self.__m2, self.count - 1, out=np.full(len(self.count), np.nan),
+                         where=self.count > 1)
+
+
+class _Buckets:
+    """
+    The counts of a contiguous range of bucket keys. Past max_bins buckets, the
+    lowest keys are collapsed into the lowest bucket kept.
+    """
+
+    def __init__(self, max_bins):
+        self.max_bins = max_bins
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def total(self):
+        """the number of counted values"""
+        return int(self.counts.sum())
+
+    def __resize(self, low, high):
+        """cover the keys [low, high], folding the counts below low into low"""
+        counts = np.zeros(high - low + 1, dtype=np.int64)
+        if len(self.counts):
+            cut = min(max(low - self.offset, 0), len(self.counts))
+            start = self.offset + cut - low
+            counts[start:start + len(self.counts) - cut] = self.counts[cut:]
+            counts[0] += self.counts[:cut].sum()
+        self.offset = low
+        self.counts = counts
+
+    def add(self, keys, counts=None):
+        """
+        Count keys.
+
+        :param keys: the keys, an array
+        :param counts: the count of each key, 1 if None
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if not len(keys):
+            return
+        top = self.offset + len(self.counts) - 1
+        high = int(keys.max()) if not len(self.counts) else max(int(keys.max()), top)
+        floor = high - self.max_bins + 1
+        keys = np.maximum(keys, floor)
+        low = int(keys.min()) if not len(self.counts) else \
+            max(min(int(keys.min()), self.offset), floor)
+        if not len(self.counts) or low != self.offset or high != top:
+            self.__resize(low, high)
+        if counts is None:
+            self.counts += np.bincount(keys - low, minlength=len(self.counts))
+        else:
+            self.counts += np.bincount(keys - low, weights=counts,
+                                       minlength=len(self.counts)).astype(np.int64)
+
+    def merge(self, other):
+        """add the counts of other buckets"""
+        if len(other.counts):
+            self.add(np.arange(other.offset, other.offset + len(other.counts)), other.counts)
+
+    def state(self):
+        """the counts as the offset and a compressed little-endian int64 array in base64"""
+        data = zlib.compress(self.counts.astype("<i8").tobytes())
+        return {"offset": self.offset, "counts": base64.b64encode(data).decode("ascii")}
+
+    @classmethod
+    def from_state(cls, max_bins, state):
+        """restore the buckets saved by state()"""
+        buckets = cls(max_bins)
+        buckets.offset = state["offset"]
+        buckets.counts = np.frombuffer(zlib.decompress(base64.b64decode(state["counts"])),
+                                       dtype="<i8").astype(np.int64)
+        return buckets
+
+
+class QuantileSketch:
+    """
+    The quantiles of a stream of values, by the logarithmic buckets of DDSketch.
+    A value is counted in the bucket (gamma^(k-1), gamma^k] of its magnitude, so
+    any quantile is within the relative accuracy of the exact one. Past max_bins
+    buckets of a sign, the buckets of the smallest magnitudes are collapsed, which
+    keeps the memory bounded and the high quantiles accurate.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_ACCURACY, max_bins=DEFAULT_BINS):
+        """
+        :param relative_accuracy: the max relative error of the quantiles
+        :param max_bins: the max number of buckets of each sign
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Invalid relative accuracy: {}".format(relative_accuracy))
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.count = 0
+        self.zeros = 0
+        self.min = math.nan
+        self.max = math.nan
+        # the buckets of the positive values and of the magnitudes of the negative ones
+        self.positive = _Buckets(max_bins)
+        self.negative = _Buckets(max_bins)
+        self.__log_gamma = math.log(self.gamma)
+
+    def __keys(self, magnitudes):
+        """the bucket keys of positive values"""
+        return np.ceil(np.log(magnitudes) / self.__log_gamma).astype(np.int64)
+
+    def __value(self, key):
+        """the value representing a bucket"""
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value):
+        """add a value, nan is not counted"""
+        if math.isnan(value):
+            return
+        self.count += 1
+        self.min = value if self.count == 1 else min(self.min, value)
+        self.max = value if self.count == 1 else max(self.max, value)
+        if value > MIN_VALUE:
+            buckets = self.positive
+        elif value < -MIN_VALUE:
+            buckets = self.negative
+        else:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(abs(value)) / self.__log_gamma)
+        if 0 <= key - buckets.offset < len(buckets):
+            buckets.counts[key - buckets.offset] += 1
+        else:
+            buckets.add([key])
+
+    def add_many(self, values):
+        """add an array of values at once, nan is not counted"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = float(np.fmin(self.min, values.min()))
+        self.max = float(np.fmax(self.max, values.max()))
+        self.zeros += int(np.count_nonzero(np.abs(values) <= MIN_VALUE))
+        self.positive.add(self.__keys(values[values > MIN_VALUE]))
+        self.negative.add(self.__keys(-values[values < -MIN_VALUE]))
+
+    def merge(self, other):
+        """
+        Add the values counted by another sketch.
+
+        :raises ValueError: Fail, the sketches have different accuracies
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches of accuracies {} and {}".format(
+                self.relative_accuracy, other.relative_accuracy))
+        if other.count == 0:
+            return
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = other.max if self.count == 0 else max(self.max, other.max)
+        self.count += other.count
+        self.zeros += other.zeros
+        self.positive.merge(other.positive)
+        self.negative.merge(other.negative)
+
+    def state(self):
+        """the sketch for json or pickle, see from_state"""
+        return {"relative_accuracy": self.relative_accuracy, "max_bins": self.max_bins,
+                "count": self.count, "zeros": self.zeros, "min": self.min, "max": self.max,
+                "positive": self.positive.state(), "negative": self.negative.state()}
+
+    @classmethod
+    def from_state(cls, state):
+        """restore the sketch saved by state()"""
+        sketch = cls(state["relative_accuracy"], state["max_bins"])
+        sketch.count = state["count"]
+        sketch.zeros = state["zeros"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch.positive = _Buckets.from_state(sketch.max_bins, state["positive"])
+        sketch.negative = _Buckets.from_state(sketch.max_bins, state["negative"])
+        return sketch
+
+    def quantile(self, quantile):
+        """
+        Estimate a quantile.
+
+        :param quantile: in [0, 1]
+        :returns float: the estimate, nan if no value was added
+        """
+        if self.count == 0:
+            return math.nan
+        if quantile <= 0 or quantile >= 1:
+            return self.min if quantile <= 0 else self.max
+        rank = quantile * (self.count - 1)
+        # the negative values from the largest magnitude, the zeros, the positive values
+        negative = np.cumsum(self.negative.counts[::-1])
+        if len(negative) and negative[-1] > rank:
+            key = self.negative.offset + len(negative) - 1 - \
+                int(np.searchsorted(negative, rank, side="right"))
+            estimate = -self.__value(key)
+        elif (negative[-1] if len(negative) else 0) + self.zeros > rank:
+            estimate = 0.0
+        else:
+            seen = (negative[-1] if len(negative) else 0) + self.zeros
+            positive = seen + np.cumsum(self.positive.counts)
+            index = int(np.searchsorted(positive, rank, side="right"))
+            estimate = self.__value(self.positive.offset + index) if index < len(positive) \
+                else self.max
+        return min(max(estimate, self.min), self.max)
+
+
+class RunSummary:
+    """
+    The summary of the fields of a run. With the expected number of samples,
+    the means of the first and second halves of the run are also kept, to tell
+    the fields which changed during the run.
+    """
+
+    def __init__(self, fields, expected=None, quantiles=DEFAULT_QUANTILES,
+                 relative_accuracy=DEFAULT_ACCURACY):
+        """
+        :param fields: the field names
+        :param expected: the number of samples of the run, None if unknown
+        :param quantiles: the quantiles to report
+        :param relative_accuracy: the max relative error of the quantiles
+        """
+        self.fields = list(fields)
+        self.__columns = {name: column for column, name in enumerate(self.fields)}
+        self.quantiles = tuple(quantiles)
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self.start = None
+        self.end = None
+        self.stats = RunningStats(len(self.fields))
+        self.sketches = [QuantileSketch(relative_accuracy) for _ in self.fields]
+        self.__split = expected // 2 if expected is not None and expected >= 4 else None
+        self.__halves = (RunningStats(len(self.fields)), RunningStats(len(self.fields))) \
+            if self.__split is not None else None
+
+    def update(self, values, timestamp=None):
+        """
+        Add a sample.
+
+        :param values: the row of values
+        :param timestamp: the time of the sample
+        """
+        values = np.asarray(values, dtype=float)
+        self.stats.update(values)
+        for sketch, value in zip(self.sketches, values.tolist()):
+            sketch.add(value)
+        if self.__halves is not None:
+            self.__halves[self.count >= self.__split].update(values)
+        self.count += 1
+        if timestamp is not None:
+            self.start = timestamp if self.start is None else self.start
+            self.end = timestamp
+
+    def update_rows(self, rows, timestamps=None):
+        """
+        Add the samples of a block at once.
+
+        :param rows: the rows of values
+        :param timestamps: the times of the rows
+        """
+        rows = np.asarray(rows, dtype=float).reshape(-1, len(self.fields))
+        if not len(rows):
+            return
+        self.stats.update_rows(rows)
+        for column, sketch in enumerate(self.sketches):
+            sketch.add_many(rows[:, column])
+        if self.__halves is not None:
+            first = min(max(self.__split - self.count, 0), len(rows))
+            self.__halves[0].update_rows(rows[:first])
+            self.__halves[1].update_rows(rows[first:])
+        self.count += len(rows)
+        if timestamps is not None and len(timestamps):
+            self.start = timestamps[0] if self.start is None else self.start
+            self.end = timestamps[-1]
+
+    def merge(self, other):
+        """
+        Add the samples of another summary, such as of another run. The fields
+        of other are matched by name, the halves of other are not merged.
+
+        :raises KeyError: Fail, other has a field self does not have
+        """
+        columns = [self.__columns[name] for name in other.fields]
+        self.stats.merge(other.stats, columns)
+        for column, sketch in zip(columns, other.sketches):
+            self.sketches[column].merge(sketch)
+        self.count += other.count
+        for name, pick in (("start", min), ("end", max)):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs if mine is None else mine if theirs is None
+                    else pick(mine, theirs))
+
+    def state(self):
+        """the summary as lists and dicts for json or pickle, see from_state"""
+        return {"fields": self.fields, "quantiles": list(self.quantiles),
+                "relative_accuracy": self.relative_accuracy, "count": self.count,
+                "start": self.start, "end": self.end, "stats": self.stats.state(),
+                "sketches": [sketch.state() for sketch in self.sketches]}
+
+    @classmethod
+    def from_state(cls, state):
+        """restore the summary saved by state(), without the halves"""
+        summary = cls(state["fields"], quantiles=state["quantiles"],
+                      relative_accuracy=state["relative_accuracy"])
+        summary.count = state["count"]
+        summary.start = state["start"]
+        summary.end = state["end"]
+        summary.stats = RunningStats.from_state(state["stats"])
+        summary.sketches = [QuantileSketch.from_state(sketch) for sketch in state["sketches"]]
+        return summary
+
+    def changed(self):
+        """
+        Tell the fields whose mean shifted between the halves of the run.
+
+        :returns list: (field, mean of the first half, mean of the second half)
+        """
+        if self.__halves is None:
+            return []
+        before, after = self.__halves
+        with np.errstate(all="ignore"):
+            pooled = np.sqrt((before.variance + after.variance) / 2)
+            shift = np.abs(after.mean - before.mean)
+            flags = (shift > CHANGE_EFFECT * pooled) & \
+                    (shift > CHANGE_RELATIVE * np.abs(before.mean)) & (after.count > 1)
+        return [(self.fields[column], float(before.mean[column]), float(after.mean[column]))
+                for column in np.flatnonzero(flags)]
+
+    def to_dict(self, digits=3):
+        """
+        Get the summary.
+
+        :param digits: round the statistics to digits
+        :returns dict: the run and the statistics of each field, None for missing values
+        """
+        def number(value):
+            return None if math.isnan(value) else round(float(value), digits)
+
+        variance = self.stats.variance
+        fields = {}
+        for column, name in enumerate(self.fields):
+            field = {"count": int(self.stats.count[column]),
+                     "mean": number(self.stats.mean[column]),
+                     "stddev": number(math.sqrt(variance[column])),
+                     "min": number(self.stats.min[column])}
+            for quantile in self.quantiles:
+                field["p{:g}".format(quantile * 100)] = \
+                    number(self.sketches[column].quantile(quantile))
+            field["max"] = number(self.stats.max[column])
+            fields[name] = field
+        return {"samples": self.count,
+                "start": self.start,
+                "end": self.end,
+                "relative_accuracy": self.relative_accuracy,
+                "fields": fields,
+                "changed": [{"field": name, "before": number(before), "after": number(after)}
+                            for name, before, after in self.changed()]}
+
+    def dump(self, path):
+        """write the summary to a json file"""
+        with open(path, "w") as summary_file:
+            json.dump(self.to_dict(), summary_file, separators=(",", ":"))
@@ -21,15 +21,20 @@ import os
 import csv
 import argparse
 import json
-import copy
+import locale
 import threading
-import time
 from typing import List
 
 from log import logger
 
 sys.path.append(os.path.dirname(__file__) + '/..')
 from collect_data import Collector
+from stats import FieldStats, DEFAULT_HISTORY, DEFAULT_PERIOD
+from feed import CollectorFeed
+from csvindex import CsvIndex, CsvWindow
+from downsample import Downsampler, PlotData
+from replay import CsvReplay, replay_speed
+from dashboard import MultiHostFeed, DASHBOARD_METRICS, SPARK_CHARS, SPARK_ASCII, open_sources, sparkline
 
 
 KEY_RESET = ord('r')
@@ -37,6 +42,13 @@ KEY_EXIT = ord('q')
 KEY_HELP = ord('h')
 KEY_OPTIONS = ord('o')
 KEY_ENTER = ord('e')
+KEY_LONGTERM = ord('l')
+KEY_JUMP = ord('g')
+KEY_PAUSE = ord(' ')
+KEY_STEP = ord('s')
+KEY_FASTER = ord('+')
+KEY_SLOWER = ord('-')
+KEY_METRIC = ord('m')
 KEY_LEFT = curses.KEY_LEFT
 KEY_RIGHT = curses.KEY_RIGHT
 KEY_UP = curses.KEY_UP
@@ -53,16 +65,27 @@ COLOR_WHITE_BLACK = 7
 MIN_TERMINAL_WIDTH = 20
 MIN_TERMINAL_HEIGHT = 20
 
+# max time between two frames in ms, also the latency of key handling
+FRAME_INTERVAL = 100
+
 
 class DisplayScreen:
     """
     Class for A-Tune-Collector data visualization.
     """
 
-    def __init__(self):
+    def __init__(self, history=DEFAULT_HISTORY, period=DEFAULT_PERIOD, downsample="lttb"):
         """
         Initialize and configurate the whole screen and independent windows. 
+
+        :param history: the number of samples kept for the plots
+        :param period: the bucket length of the long-term plots in seconds
+        :param downsample: lttb/minmax, how the plots are reduced to the diagram width
         """
+        self.history = history
+        self.period = period
+        self.downsampler = Downsampler(downsample)
+        self.longterm = False
         self.screen = curses.initscr()
         curses.noecho()
         curses.cbreak()
@@ -177,8 +200,7 @@ class DisplayScreen:
             self.network_height, self.network_width, self.network_y, self.network_x)
         self.win_notebar = curses.newwin(1, self.width, self.height-1, 0)
 
-    @staticmethod
-    def draw_diagram(window: curses.window, name_y: str, name_x: str,
+    def draw_diagram(self, window: curses.window, name_y: str, name_x: str,
                      height=10, width=20, begin_y=1, begin_x=1, data: list = None,
                      dmax=None, dmin=None, unit=None, unit_scale=1):
         """
@@ -191,7 +213,7 @@ class DisplayScreen:
         :width:  
         :begin_y: left start point height
         :begin_x: top start point width
-        :data: data points
+        :data: data points, reduced to the width by the downsampler
         """
         if unit is not None:
             name_y = f"{name_y} {unit}"
@@ -214,6 +236,7 @@ class DisplayScreen:
                             msg, curses.A_BOLD | curses.color_pair(COLOR_RED_BLACK))
         else:
             win_data.clear()
+            data = self.downsampler.reduce(getattr(data, "key", None), data, data_width)
             if dmin is None:
                 dmin = min(data)
             if dmax is None:
@@ -762,18 +785,119 @@ class DisplayScreen:
             self.win_system, item[1], "Time", 8, 20, 2, 65, plot_data[item[1]])
         self.win_system.refresh()
 
-    def display_notebar(self):
+    def display_notebar(self, status: str = ""):
         """
         Need refresh method in the end.
         """
-        notebarstr = "[q]: quit [h]: help [o]: options, any other key to refresh"
+        notebarstr = "[q]: quit [h]: help [o]: options [l]: long-term, any other key to refresh"
+        if status:
+            notebarstr = "{} | {}".format(notebarstr, status)
+        notebarstr = notebarstr[:self.width - 1]
         self.win_notebar.addstr(
             0, 0, notebarstr + " " * (self.width - len(notebarstr) - 1), curses.A_REVERSE)
         self.win_notebar.refresh()
 
-    def display_from_file(self, csvfile: str = None, jsonfile: str = None, use_collector=False):
+    def prompt(self, msg: str):
+        """
+        Read a line typed in the note bar.
+        """
+        self.win_notebar.erase()
+        self.win_notebar.addnstr(0, 0, msg, self.width - 1, curses.A_REVERSE)
+        curses.echo()
+        curses.curs_set(1)
+        try:
+            return self.win_notebar.getstr(0, len(msg), 20).decode()
+        finally:
+            curses.curs_set(0)
+            curses.noecho()
+
+    def scrub(self, window: CsvWindow):
+        """
+        Move the time window of a file by the arrow keys:
+        left/right to scroll, up/down to zoom in/out, [g] to jump to a time.
+        """
+        if self.key == KEY_LEFT:
+            window.scroll(-0.5)
+        elif self.key == KEY_RIGHT:
+            window.scroll(0.5)
+        elif self.key == KEY_UP:
+            window.zoom(0.5)
+        elif self.key == KEY_DOWN:
+            window.zoom(2)
+        elif self.key == KEY_JUMP:
+            try:
+                window.jump(self.prompt("jump to (HH:MM:SS): "))
+            except ValueError as err:
+                logger.info(err)
+
+    def control_replay(self, replay: CsvReplay):
+        """
+        Control a replay: [space] to pause, [s] to step while paused, [+]/[-] to change speed.
+        """
+        if self.key == KEY_PAUSE:
+            replay.toggle_pause()
+        elif self.key == KEY_STEP:
+            replay.step()
+        elif self.key == KEY_FASTER:
+            replay.faster()
+        elif self.key == KEY_SLOWER:
+            replay.slower()
+
+    def series(self, stats: FieldStats, module: str, metric: str):
+        """
+        Get the plot data of a metric, the means of each period if [l] toggled the long-term tier.
+        """
+        if self.longterm:
+            return PlotData(stats.longterm_series(module, metric), key=(module, metric))
+        return PlotData(stats.series(module, metric), stats.offset, (module, metric))
+
+    def toggle_longterm(self):
+        """
+        Switch between the recent samples and the long-term tier if [l] is pressed.
+        """
+        if self.key == KEY_LONGTERM:
+            self.longterm = not self.longterm
+            # the same keys now name the series of the other tier
+            self.downsampler.forget()
+            self.key = 0
+
+    def run_frames(self, draw, feed: CollectorFeed = None, handle_key=None):
+        """
+        Handle keys and redraw at a fixed frame rate until [q] is pressed.
+        A frame is drawn only if new samples are published, the terminal size
+        changes or a key is pressed.
+
+        :draw: function drawing a frame
+        :feed: feed publishing the samples, None if the data is static
+        :handle_key: function called when a key is pressed
+        """
+        lock = feed.lock if feed is not None else threading.Lock()
+        self.screen.timeout(FRAME_INTERVAL)
+        drawn = None
+        while True:
+            self.key = self.screen.getch()
+            if self.key == KEY_EXIT:
+                return
+            self.toggle_longterm()
+            if handle_key is not None and self.key != -1:
+                handle_key()
+            if feed is not None and feed.error is not None:
+                raise feed.error
+            state = (feed.version if feed is not None else 0, self.screen.getmaxyx(), self.longterm)
+            if state == drawn and self.key == -1:
+                continue
+            self.height, self.width = state[1]
+            with lock:
+                draw()
+            # the series not drawn in this frame are no longer on the screen
+            self.downsampler.sweep()
+            drawn = state
+
+    def display_from_file(self, csvfile: str = None, jsonfile: str = None, use_collector=False,
+                          replay: float = None):
         """
         Display welcome page, data, progress bar and diagrams in the whole monitor screen.
+        Replay the file at the speed of replay if it is given.
         """
         self.win_init()
         try:
@@ -785,105 +909,67 @@ class DisplayScreen:
                 nic = json_data["network"].split(",")
                 block = json_data["block"].split(",")
 
+                feed = None
+                window = None
+                index = None
+                source = None
                 if use_collector:
-                    collector = Collector(json_data)
+                    collector = Collector(json_data, retain=self.history)
                     logger.info('collector.field_name')
                     logger.info(collector.field_name)
-                    fields = list(collector.field_name)
-                    csv_data = []
+                    stats = FieldStats(collector.field_name, self.history, self.period)
+                    feed = CollectorFeed(collector, stats)
+                elif replay is not None:
+                    # stream the rows into the same pipeline as a live collection
+                    index = CsvIndex(csvfile.name)
+                    logger.info('index.fields')
+                    logger.info(index.fields)
+                    source = CsvReplay(index, replay, interval)
+                    stats = FieldStats(index.fields, self.history, self.period)
+                    feed = CollectorFeed(source, stats)
                 else:
-                    csv_reader = csv.DictReader(csvfile)
-                    logger.info('csv_reader.fieldnames')
-                    logger.info(csv_reader.fieldnames)
-                    fields = csv_reader.fieldnames
-                    csv_data = [row for row in csv_reader]
-                avg_data = {
-                    "CPU": {},
-                    "STORAGE": {},
-                    "NET": {},
-                    "MEM": {},
-                    "PERF": {},
-                    "SYS": {}
-                }
-                # field_data = copy.deepcopy(avg_data)
-
-                # for key in fields:
-                #     item = key.split('.')
-                #     if len(item) > 3:
-                #         item[-2] = item[-2] + "." + item[-1]
-                #         item.pop()
-                #     module, metric = item[0], item[-1]
-                #     self.modules.append(module)
-                #     field_data[module][metric] = [float(row[key]) for row in csv_data]
-                #     avg_data[module][metric] = round(sum(field_data[module][metric]) / len(field_data[module][metric]), 2)
-                # del csv_data
-                # self.modules = sorted(list(set(self.modules)), key=self.modules.index)
+                    # parse only the rows of the displayed window, see csvindex
+                    window = CsvWindow(CsvIndex(csvfile.name), self.history)
+                    logger.info('window.fields')
+                    logger.info(window.fields)
+                    stats = feed = source = window
+                self.modules = stats.modules
                 self.display_welcome()
                 if self.wait_for_enter_or_exit() == "ENTER":
-                    listening = True
-
-                    def listen_user_input():
-                        while listening and self.key != KEY_EXIT:
-                            self.key = self.screen.getch()
-                    x = threading.Thread(target=listen_user_input, args=())
-                    x.start()
-                    while self.key != KEY_EXIT:
-                        # update field_data
-                        self.modules = []
-                        field_data = copy.deepcopy(avg_data)
-                        if use_collector:
-                            data = collector.collect_data()
-                            csv_data.append(data)
-                            for index, key in enumerate(fields):
-                                item = key.split('.')
-                                if len(item) > 3:
-                                    item[-2] = item[-2] + "." + item[-1]
-                                    item.pop()
-                                module, metric = item[0], item[-1]
-                                self.modules.append(module)
-                                field_data[module][metric] = [
-                                    float(row[index]) for row in csv_data]
-                                avg_data[module][metric] = sum(
-                                    field_data[module][metric]) / len(field_data[module][metric])
-                                avg_data[module][metric] = round(
-                                    avg_data[module][metric], 2)
-                        else:
-                            for key in fields:
-                                item = key.split('.')
-                                if len(item) > 3:
-                                    item[-2] = item[-2] + "." + item[-1]
-                                    item.pop()
-                                module, metric = item[0], item[-1]
-                                self.modules.append(module)
-                                field_data[module][metric] = [
-                                    float(row[key]) for row in csv_data]
-                                avg_data[module][metric] = round(
-                                    sum(field_data[module][metric]) / len(field_data[module][metric]), 2)
-                        self.modules = sorted(
-                            list(set(self.modules)), key=self.modules.index)
-
-                        # update screen
-                        self.height, self.width = self.screen.getmaxyx()
-                        self.display_notebar()
+                    def draw():
+                        avg_data = stats.averages()
+                        self.display_notebar(source.describe() if source is not None else "")
                         logger.info("avg_data")
                         logger.info(avg_data["CPU"])
-                        logger.info("field_data")
-                        logger.info(field_data["CPU"])
-                        self.display_cpu(avg_data["CPU"], plot_data={"user %": field_data["CPU"]["usr"],
-                                                                     "util %": field_data["CPU"]["util"]})
-                        self.display_storage(block, avg_data["STORAGE"], plot_data={"util %": field_data["STORAGE"]["util"],
-                                                                                    "ws": field_data["STORAGE"]["ws"]})
-                        self.display_network(nic, avg_data["NET"], plot_data={"ifutil": field_data["NET"]["ifutil"],
-                                                                              "rxkBs": field_data["NET"]["rxkBs"]})
-                        self.display_mem(avg_data["MEM"], plot_data={"Free": field_data["MEM"]["MemFree"],
-                                                                     "BWUtil": field_data["MEM"]["Total_Util"]})
-                        # self.display_perf(avg_data["PERF"], plot_data={"IPC": field_data["PERF"]["IPC"],
-                        #                                                "CMR": field_data["PERF"]["CACHE-MISS-RATIO"]})
-                        # self.display_system(avg_data["SYS"], plot_data={"FD Util %": field_data["SYS"]["fd-util"],
-                        #                                                 "ldavg-1min": field_data["SYS"]["ldavg-1"]})
+                        self.display_cpu(avg_data["CPU"], plot_data={"user %": self.series(stats, "CPU", "usr"),
+                                                                     "util %": self.series(stats, "CPU", "util")})
+                        self.display_storage(block, avg_data["STORAGE"], plot_data={"util %": self.series(stats, "STORAGE", "util"),
+                                                                                    "ws": self.series(stats, "STORAGE", "ws")})
+                        self.display_network(nic, avg_data["NET"], plot_data={"ifutil": self.series(stats, "NET", "ifutil"),
+                                                                              "rxkBs": self.series(stats, "NET", "rxkBs")})
+                        self.display_mem(avg_data["MEM"], plot_data={"Free": self.series(stats, "MEM", "MemFree"),
+                                                                     "BWUtil": self.series(stats, "MEM", "Total_Util")})
+                        # self.display_perf(avg_data["PERF"], plot_data={"IPC": self.series(stats, "PERF", "IPC"),
+                        #                                                "CMR": self.series(stats, "PERF", "CACHE-MISS-RATIO")})
+                        # self.display_system(avg_data["SYS"], plot_data={"FD Util %": self.series(stats, "SYS", "fd-util"),
+                        #                                                 "ldavg-1min": self.series(stats, "SYS", "ldavg-1")})
                         self.screen.refresh()
-                        time.sleep(interval)
-                    x.join()
+
+                    feed.start()
+                    try:
+                        if window is not None:
+                            self.run_frames(draw, feed, lambda: self.scrub(window))
+                        elif index is not None:
+                            self.run_frames(draw, feed, lambda: self.control_replay(source))
+                        else:
+                            self.run_frames(draw, feed)
+                    finally:
+                        if window is not None:
+                            window.close()
+                        else:
+                            feed.stop(None if index is not None else interval)
+                        if index is not None:
+                            index.close()
         except Exception as err:
             raise err
         finally:
@@ -906,59 +992,32 @@ class DisplayScreen:
                 nic = json_data["network"].split(",")
                 block = json_data["block"].split(",")
 
-                collector = Collector(json_data)
+                collector = Collector(json_data, retain=self.history)
                 logger.info('collector.field_name')
                 logger.info(collector.field_name)
-                fields = list(collector.field_name)
-                csv_data = []
-
-                avg_data = {
-                    "CPU": {},
-                    "STORAGE": {},
-                    "NET": {},
-                    "MEM": {},
-                    "PERF": {},
-                    "SYS": {}
-                }
-
-                listening = True
-                def listen_user_input():
-                    while listening and self.key != KEY_EXIT:
-                        self.key = self.screen.getch()
-                x = threading.Thread(target=listen_user_input, args=())
-                x.start()
-                while self.key != KEY_EXIT:
-                    # update field_data
-                    self.modules = []
-                    field_data = copy.deepcopy(avg_data)
-                    data = collector.collect_data()
-                    csv_data.append(data)
-                    for index, key in enumerate(fields):
-                        item = key.split('.')
-                        if len(item) > 3:
-                            item[-2] = item[-2] + "." + item[-1]
-                            item.pop()
-                        module, metric = item[0], item[-1]
-                        self.modules.append(module)
-                        field_data[module][metric] = [float(row[index]) for row in csv_data]
-                        avg_data[module][metric] = sum(field_data[module][metric]) / len(field_data[module][metric])
-                        avg_data[module][metric] = round(avg_data[module][metric], 2)
-                    self.modules = sorted(list(set(self.modules)), key=self.modules.index)
-
-                    # update screen
-                    height, width = self.screen.getmaxyx()
+                stats = FieldStats(collector.field_name, self.history, self.period)
+                feed = CollectorFeed(collector, stats)
+                self.modules = stats.modules
+
+                def draw():
+                    avg_data = stats.averages()
                     # TODO: update window if terminal size is changed
                     # if height != self.height or width != self.width:
                     #     self.height, self.width = height, width
                     #     self.win_init()
-                    
+
                     self.display_notebar()
-                    self.display_cpu_plot("util %", field_data["CPU"]["util"])
-                    self.display_storage_plot(block, "ws", field_data["STORAGE"]["ws"])
-                    self.display_network_plot(nic, "rxkBs", field_data["NET"]["rxkBs"])
-                    self.display_mem_plot(avg_data['MEM'], "Free", field_data["MEM"]["MemFree"])
+                    self.display_cpu_plot("util %", self.series(stats, "CPU", "util"))
+                    self.display_storage_plot(block, "ws", self.series(stats, "STORAGE", "ws"))
+                    self.display_network_plot(nic, "rxkBs", self.series(stats, "NET", "rxkBs"))
+                    self.display_mem_plot(avg_data['MEM'], "Free", self.series(stats, "MEM", "MemFree"))
                     self.screen.refresh()
-                    time.sleep(interval)
+
+                feed.start()
+                try:
+                    self.run_frames(draw, feed)
+                finally:
+                    feed.stop(interval)
         except Exception as err:
             raise err
         finally:
@@ -967,6 +1026,67 @@ class DisplayScreen:
             curses.nocbreak()
             curses.endwin()
 
+    def display_hosts(self, specs: List[str], top: int = None, speed: float = 1):
+        """
+        Compare hosts in one screen: a sparkline and the latest value of each
+        metric of DASHBOARD_METRICS per host, sorted by one metric.
+        [m] switches the metric to sort by.
+
+        :specs: unix:PATH or tcp:HOST:PORT of the collector streams, or csv files to replay
+        :top: the max number of hosts shown, limited by the terminal height
+        :speed: the replay speed of the csv files
+        """
+        sources, indexes = open_sources(specs, speed)
+        feed = MultiHostFeed(sources)
+        chars = SPARK_CHARS if "UTF" in locale.getpreferredencoding().upper() else SPARK_ASCII
+        self.sort_metric = 0
+        name_width = 16
+
+        def switch_metric():
+            if self.key == KEY_METRIC:
+                self.sort_metric = (self.sort_metric + 1) % len(DASHBOARD_METRICS)
+
+        def draw():
+            self.screen.erase()
+            rows = self.height - 3
+            count = rows if top is None else min(top, rows)
+            column_width = max((self.width - name_width - 1) // len(DASHBOARD_METRICS), 10)
+            spark_width = column_width - 8
+            title = "hosts sorted by {}, {} of {}".format(
+                DASHBOARD_METRICS[self.sort_metric][0], min(count, len(feed.hosts)), len(sources))
+            self.screen.addnstr(0, 0, title, self.width - 1,
+                                curses.A_BOLD | curses.color_pair(COLOR_YELLOW_BLACK))
+            for index, (label, _, _) in enumerate(DASHBOARD_METRICS):
+                attr = curses.A_BOLD | (curses.A_REVERSE if index == self.sort_metric else 0)
+                self.screen.addnstr(1, name_width + 1 + index * column_width,
+                                    "{} %".format(label), column_width - 1, attr)
+            for line, host in enumerate(feed.top(self.sort_metric, count)):
+                self.screen.addnstr(2 + line, 0, host.name, name_width, curses.A_BOLD)
+                for index in range(len(DASHBOARD_METRICS)):
+                    series = PlotData(host.series(index), host.history.total - len(host.history))
+                    points = self.downsampler.reduce((host.number, index), series, spark_width)
+                    text = "{} {:>6.1f}".format(sparkline(points, spark_width, chars=chars),
+                                                host.latest[index])
+                    self.screen.addnstr(2 + line, name_width + 1 + index * column_width, text,
+                                        column_width - 1, curses.color_pair(COLOR_CYAN_BLACK))
+            status = "{} running, {} ended".format(len(sources) - feed.ended, feed.ended)
+            if feed.failed:
+                status += ", {} failed".format(len(feed.failed))
+            self.display_notebar("[m]: sort metric | " + status)
+            self.screen.refresh()
+
+        feed.start()
+        try:
+            self.run_frames(draw, feed, switch_metric)
+        finally:
+            feed.stop(1)
+            for index in indexes:
+                index.close()
+            self.screen.keypad(False)
+            curses.echo()
+            curses.nocbreak()
+            curses.endwin()
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('-f', '--file',
@@ -980,16 +1100,38 @@ if __name__ == "__main__":
                         action='store_true', 
                         default=False, 
                         help="collector use plot mode")
+    parser.add_argument('--history', type=int,
+                        default=DEFAULT_HISTORY,
+                        help="number of recent samples kept for the plots")
+    parser.add_argument('--period', type=int,
+                        default=DEFAULT_PERIOD,
+                        help="seconds of each point of the long-term plots")
+    parser.add_argument('--replay', type=replay_speed,
+                        default=None,
+                        help="replay the csv file at the speed, such as 1, 10 or 100")
+    parser.add_argument('--hosts', nargs='+',
+                        default=None,
+                        help="compare hosts from unix:PATH or tcp:HOST:PORT streams or csv files")
+    parser.add_argument('--top', type=int,
+                        default=None,
+                        help="number of hosts shown by --hosts")
+    parser.add_argument('--downsample',
+                        choices=["lttb", "minmax"], default="lttb",
+                        help="how the plots are reduced to the diagram width")
     args = parser.parse_args()
-    if args.plot:
+    if args.hosts:
+        locale.setlocale(locale.LC_ALL, "")
+        scr = DisplayScreen(args.history, args.period, args.downsample)
+        scr.display_hosts(args.hosts, args.top, args.replay or 1)
+    elif args.plot:
         with open(args.config, 'r') as jsonfile:
-            scr = DisplayScreen()
+            scr = DisplayScreen(args.history, args.period, args.downsample)
             scr.display_plot(jsonfile=jsonfile)
     elif args.file:
         with open(args.file, 'r') as csvfile, open(args.config, 'r') as jsonfile:
-            scr = DisplayScreen()
-            scr.display_from_file(csvfile=csvfile, jsonfile=jsonfile)
+            scr = DisplayScreen(args.history, args.period, args.downsample)
+            scr.display_from_file(csvfile=csvfile, jsonfile=jsonfile, replay=args.replay)
     else:
         with open(args.config, 'r') as jsonfile:
-            scr = DisplayScreen()
+            scr = DisplayScreen(args.history, args.period, args.downsample)
             scr.display_from_file(jsonfile=jsonfile, use_collector=True)
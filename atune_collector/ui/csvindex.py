@@ -0,0 +1,404 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Lazy access to collected csv files too large to load. The file is memory-mapped
+and a sparse index of row offsets is built on the first open and cached next to
+the file, so only the rows of the displayed time window are parsed, while a
+background thread computes the whole-file aggregates block by block.
+"""
+
+import bisect
+import io
+import logging
+import mmap
+import os
+import threading
+import zipfile
+
+import numpy as np
+
+from stats import RunningStats, field_index, group_by_module, DEFAULT_HISTORY
+
+LOGGER = logging.getLogger('atune_collector')
+
+# rows between two indexed offsets, also the block of the aggregates
+INDEX_STRIDE = 1024
+INDEX_SUFFIX = ".idx.npz"
+TIME_FIELD = "TimeStamp"
+SCAN_BLOCK = 64 * 1024 * 1024
+DAY_SECONDS = 24 * 3600
+
+
+def parse_time(text):
+    """
+    Parse a recorded time of day.
+
+    :param text: HH:MM:SS, HH:MM or HH
+    :returns int: the seconds since midnight
+    :raises ValueError: Fail, invalid time
+    """
+    parts = [int(part) for part in text.strip().split(":")]
+    if not parts or len(parts) > 3:
+        raise ValueError("Invalid time: {}".format(text))
+    parts += [0] * (3 - len(parts))
+    return parts[0] * 3600 + parts[1] * 60 + parts[2]
+
+
+def unwrap_times(seconds, start=None):
+    """
+    Turn times of day into seconds increasing across midnight.
+
+    :param seconds: the times of day in seconds
+    :param start: the unwrapped time before the first one, None if none
+    :returns list: the unwrapped times
+    """
+    unwrapped = []
+    days = 0 if start is None else start // DAY_SECONDS
+    last = start
+    for value in seconds:
+        value += days * DAY_SECONDS
+        if last is not None and value < last:
+            days += 1
+            value += DAY_SECONDS
+        unwrapped.append(value)
+        last = value
+    return unwrapped
+
+
+class CsvIndex:
+    """The sparse row index of a csv file written by collect_data.py"""
+
+    def __init__(self, path, stride=INDEX_STRIDE):
+        """
+        :param path: the csv file
+        :param stride: the number of rows between two indexed offsets
+        :raises ValueError: Fail, the file has no header
+        """
+        self.path = path
+        self.stride = stride
+        self.__file = open(path, "rb")
+        stat = os.fstat(self.__file.fileno())
+        self.size = stat.st_size
+        self.__mtime = stat.st_mtime_ns
+        if self.size == 0:
+            raise ValueError("Empty csv file: {}".format(path))
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = self.__map.find(b"\n")
+        if end < 0:
+            raise ValueError("No csv header: {}".format(path))
+        header = self.__map[:end].decode().strip().split(",")
+        self.time_column = header.index(TIME_FIELD) if TIME_FIELD in header else None
+        self.value_columns = [column for column, name in enumerate(header) if name != TIME_FIELD]
+        self.fields = [header[column] for column in self.value_columns]
+        self.__data_start = end + 1
+        if not self.__load():
+            self.__build()
+            self.__save()
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def cache_path(self):
+        """the file caching the index"""
+        return self.path + INDEX_SUFFIX
+
+    def __load(self):
+        """load the cached index, if it matches the file"""
+        try:
+            with np.load(self.cache_path) as cache:
+                size, mtime, stride, rows = cache["meta"].tolist()
+                if (size, mtime, stride) != (self.size, self.__mtime, self.stride):
+                    return False
+                self.offsets = cache["offsets"]
+                self.rows = rows
+                return True
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return False
+
+    def __save(self):
+        """cache the index next to the file, skipped if the directory is read only"""
+        meta = np.array([self.size, self.__mtime, self.stride, self.rows], dtype=np.int64)
+        try:
+            with open(self.cache_path, "wb") as cache:
+                np.savez(cache, meta=meta, offsets=self.offsets)
+        except OSError as err:
+            LOGGER.info("fail to cache the csv index %s: %s", self.cache_path, err)
+
+    def __build(self):
+        """scan the newlines block by block, keeping the start of every stride rows"""
+        buffer = np.frombuffer(self.__map, dtype=np.uint8)
+        block = None
+        offsets = []
+        rows = 0
+        for base in range(self.__data_start, self.size, SCAN_BLOCK):
+            block = buffer[base:base + SCAN_BLOCK]
+            # the rows start at the data start and after each newline but the last byte
+            starts = np.flatnonzero(block == ord("\n")) + base + 1
+            if base == self.__data_start:
+                starts = np.concatenate(([base], starts))
+            starts = starts[starts < self.size]
+            first = (-rows) % self.stride
+            offsets.append(starts[first::self.stride])
+            rows += len(starts)
+        # release the views of the map, so that it can be closed
+        del buffer, block
+        self.offsets = np.concatenate(offsets) if offsets else np.zeros(0, dtype=np.int64)
+        self.rows = rows
+
+    def __seek(self, row):
+        """the offset of a row"""
+        offset = int(self.offsets[row // self.stride])
+        for _ in range(row % self.stride):
+            offset = self.__map.find(b"\n", offset) + 1
+        return offset
+
+    def __lines(self, start, stop):
+        """the bytes of the rows in [start, stop)"""
+        start = max(0, start)
+        stop = min(self.rows, stop)
+        if start >= stop:
+            return b""
+        begin = self.__seek(start)
+        end = begin
+        for _ in range(stop - start):
+            end = self.__map.find(b"\n", end) + 1
+            if end == 0:
+                end = self.size
+                break
+        return self.__map[begin:end]
+
+    def read_rows(self, start, stop):
+        """
+        Parse the values of the rows in [start, stop).
+
+        :returns ndarray: rows by fields, float64
+        """
+        lines = self.__lines(start, stop)
+        if not lines.strip():
+            return np.zeros((0, len(self.fields)))
+        return np.loadtxt(io.BytesIO(lines), delimiter=",", usecols=self.value_columns,
+                          dtype=float, ndmin=2)
+
+    def read_times(self, start, stop):
+        """
+        Get the recorded times of the rows in [start, stop).
+
+        :returns list: HH:MM:SS of each row, empty if the file has no time column
+        """
+        if self.time_column is None:
+            return []
+        return [line.split(b",")[self.time_column].decode()
+                for line in self.__lines(start, stop).splitlines()]
+
+    def find_time(self, text):
+        """
+        Find the first row at or after a time of day, the recorded times may
+        cross midnight.
+
+        :param text: HH:MM:SS
+        :returns int: the row, the last one if the time is after the end
+        :raises ValueError: Fail, invalid time or the file has no time column
+        """
+        if self.time_column is None:
+            raise ValueError("No {} column in {}".format(TIME_FIELD, self.path))
+        if self.rows == 0:
+            return 0
+        sparse = unwrap_times(parse_time(self.read_times(row, row + 1)[0])
+                              for row in range(0, self.rows, self.stride))
+        target = parse_time(text)
+        # the time of day on the first day, or the next one
+        if target < sparse[0] % DAY_SECONDS:
+            target += DAY_SECONDS
+        target += sparse[0] // DAY_SECONDS * DAY_SECONDS
+        block = max(bisect.bisect_right(sparse, target) - 1, 0)
+        start = block * self.stride
+        times = unwrap_times((parse_time(value) for value in
+                              self.read_times(start, start + self.stride)), sparse[block] - 1)
+        row = start + bisect.bisect_left(times, target)
+        return min(row, self.rows - 1)
+
+    def close(self):
+        """unmap and close the file"""
+        self.__map.close()
+        self.__file.close()
+
+
+class CsvAggregator:
+    """Compute the whole-file statistics block by block in a background thread"""
+
+    def __init__(self, index: CsvIndex):
+        self.index = index
+        self.running = RunningStats(len(index.fields))
+        # the mean of each block, the long-term view of the file
+        self.blocks = []
+        self.done = 0
+        self.error = None
+        self.lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__listeners = []
+
+    def subscribe(self, listener):
+        """call listener() after each block"""
+        self.__listeners.append(listener)
+
+    def start(self):
+        """start aggregating"""
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        stride = self.index.stride
+        try:
+            for start in range(0, self.index.rows, stride):
+                if self.__stop.is_set():
+                    return
+                rows = self.index.read_rows(start, start + stride)
+                with self.lock:
+                    self.running.update_rows(rows)
+                    self.blocks.append(np.nanmean(rows, axis=0) if len(rows) else
+                                       np.full(len(self.index.fields), np.nan))
+                    self.done = min(start + stride, self.index.rows)
+                for listener in self.__listeners:
+                    listener()
+        except Exception as err:
+            self.error = err
+
+    def stop(self):
+        """stop aggregating after the block in progress"""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+
+class CsvWindow:
+    """
+    The displayed time window of a csv file, with the same interface as
+    FieldStats and CollectorFeed for the render loop.
+    """
+
+    def __init__(self, index: CsvIndex, span=DEFAULT_HISTORY):
+        """
+        :param index: the csv index
+        :param span: the number of rows of the window
+        """
+        self.index = index
+        self.fields = index.fields
+        self.modules, self.field_index = field_index(self.fields)
+        self.lock = threading.Lock()
+        self.version = 0
+        self.first = 0
+        self.span = max(int(span), 2)
+        self.rows = np.zeros((0, len(self.fields)))
+        self.aggregator = CsvAggregator(index)
+        self.aggregator.subscribe(self.__changed)
+        self.move(max(len(index) - self.span, 0))
+
+    @property
+    def error(self):
+        """the error of the background aggregation"""
+        return self.aggregator.error
+
+    def __changed(self):
+        self.version += 1
+
+    @property
+    def offset(self):
+        """the row number of the first row of the window"""
+        return self.first
+
+    def start(self):
+        """start the whole-file aggregation"""
+        self.aggregator.start()
+
+    def move(self, start, span=None):
+        """
+        Move the window and parse its rows.
+
+        :param start: the first row, clamped to the file
+        :param span: the new number of rows, unchanged if None
+        """
+        if span is not None:
+            self.span = min(max(int(span), 2), max(len(self.index), 2))
+        start = min(max(int(start), 0), max(len(self.index) - self.span, 0))
+        rows = self.index.read_rows(start, start + self.span)
+        with self.lock:
+            self.first = start
+            self.rows = rows
+            self.__changed()
+
+    def scroll(self, fraction):
+        """move by a fraction of the window, negative to the beginning"""
+        self.move(self.first + round(self.span * fraction))
+
+    def zoom(self, factor):
+        """scale the window around its center, factor < 1 to zoom in"""
+        span = max(round(self.span * factor), 2)
+        self.move(self.first + (self.span - span) // 2, span)
+
+    def jump(self, text):
+        """
+        Center the window at a time of day.
+
+        :param text: HH:MM:SS
+        :raises ValueError: Fail, invalid time
+        """
+        self.move(self.index.find_time(text) - self.span // 2)
+
+    def describe(self):
+        """the position of the window and the aggregation progress"""
+        times = self.index.read_times(self.first, self.first + 1) + \
+            self.index.read_times(self.first + len(self.rows) - 1, self.first + len(self.rows))
+        where = " - ".join(times) if times else "rows {}-{}".format(
+            self.first, self.first + len(self.rows))
+        progress = 100 * self.aggregator.done // max(len(self.index), 1)
+        return "{} of {} rows, aggregated {}%".format(where, len(self.index), progress)
+
+    def averages(self, digits=2):
+        """
+        Get the means of the whole file, complete once the aggregation ends.
+
+        :returns dict: module -> metric -> mean
+        """
+        with self.aggregator.lock:
+            return group_by_module(self.field_index, self.aggregator.running.mean, digits)
+
+    def series(self, module, metric):
+        """
+        Get the values of a metric in the window.
+
+        :returns list: the values, empty if not collected
+        """
+        column = self.field_index.get(module, {}).get(metric)
+        if column is None:
+            return []
+        return self.rows[:, column].tolist()
+
+    def longterm_series(self, module, metric):
+        """
+        Get the block means of a metric over the aggregated part of the file.
+
+        :returns list: the values, empty if not collected
+        """
+        column = self.field_index.get(module, {}).get(metric)
+        if column is None:
+            return []
+        with self.aggregator.lock:
+            return [block[column] for block in self.aggregator.blocks]
+
+    def close(self):
+        """stop aggregating and close the file"""
+        self.aggregator.stop()
+        self.index.close()
@@ -0,0 +1,239 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+The multi-host dashboard. Several collector streams or csv files are consumed
+at once, merged by timestamp and reduced to the few metrics compared across
+hosts, each kept in a short ring buffer for the sparklines.
+"""
+
+import heapq
+import os
+import threading
+import time
+
+import numpy as np
+
+from stats import RingBuffer, parse_field
+from stream import StreamClient, is_stream
+
+# the compared metrics: (label, module, metric), the max of the instances is taken
+DASHBOARD_METRICS = (("cpu util", "CPU", "util"),
+                     ("disk util", "STORAGE", "util"),
+                     ("nic ifutil", "NET", "ifutil"))
+DEFAULT_SPARK = 256
+# seconds a host may lag behind the newest one before it stops holding the others
+MERGE_GRACE = 5.0
+# the timestamps below are the seconds of the day of replayed files, not epoch seconds
+EPOCH_MIN = 1e8
+SPARK_CHARS = " ▁▂▃▄▅▆▇█"
+SPARK_ASCII = " .:-=+*#%@"
+
+
+def sparkline(values, width, low=0.0, high=100.0, chars=SPARK_CHARS):
+    """
+    Draw the last values as characters of increasing height.
+
+    :param values: the values, nan drawn as blank
+    :param width: the number of characters
+    :param low: the value of the lowest character
+    :param high: the value of the highest character
+    :param chars: the characters from the lowest to the highest
+    :returns str: the sparkline, right-aligned to width
+    """
+    values = np.asarray(values, dtype=float)[-width:]
+    levels = np.clip((values - low) / max(high - low, 1e-9), 0, 1) * (len(chars) - 1)
+    line = "".join(" " if np.isnan(level) else chars[int(round(level))] for level in levels)
+    return line.rjust(width)
+
+
+class TimestampMerger:
+    """
+    Order the samples of several hosts by timestamp. A sample is released once
+    every running host has sent a later one, so the hosts are shown up to the
+    same time. A host lagging more than grace seconds behind the newest one,
+    stalled or with a skewed clock, no longer holds the others back and its
+    late samples are released as they come.
+
+    The replayed files are timed by the seconds of the day while the collectors
+    stream epoch seconds, so the replays are moved together to the epoch time
+    of their first sample.
+    """
+
+    def __init__(self, grace=MERGE_GRACE):
+        self.grace = grace
+        self.__heap = []
+        self.__sequence = 0
+        self.__latest = {}
+        self.__ended = set()
+        self.__shift = None
+
+    def push(self, host, timestamp, values):
+        """queue a sample of a host, timestamp in epoch seconds or in seconds of the day"""
+        merged = timestamp
+        if timestamp < EPOCH_MIN:
+            if self.__shift is None:
+                self.__shift = time.time() - timestamp
+            merged += self.__shift
+        heapq.heappush(self.__heap, (merged, self.__sequence, host, timestamp, values))
+        self.__sequence += 1
+        self.__latest[host] = max(merged, self.__latest.get(host, merged))
+
+    def end(self, host):
+        """the host sends no more samples"""
+        self.__ended.add(host)
+
+    def pop_ready(self):
+        """
+        Release the samples not later than the latest sample of every running host.
+
+        :returns list: (host, timestamp, values) in the order of timestamps
+        """
+        running = [latest for host, latest in self.__latest.items() if host not in self.__ended]
+        watermark = max(min(running), max(running) - self.grace) if running else float("inf")
+        ready = []
+        while self.__heap and self.__heap[0][0] <= watermark:
+            _, _, host, timestamp, values = heapq.heappop(self.__heap)
+            ready.append((host, timestamp, values))
+        return ready
+
+
+class HostStats:
+    """The recent values of the compared metrics of a host"""
+
+    def __init__(self, name, fields, history=DEFAULT_SPARK, number=None):
+        self.name = name
+        # the number of the source, the names of several hosts may be the same
+        self.number = number
+        self.time = None
+        # the columns of the instances of each metric
+        self.columns = []
+        for _, module, metric in DASHBOARD_METRICS:
+            self.columns.append([column for column, field in enumerate(fields)
+                                 if parse_field(field)[0] == module and
+                                 parse_field(field)[1].split("#")[0] == metric])
+        self.history = RingBuffer(history, len(DASHBOARD_METRICS))
+        self.latest = np.full(len(DASHBOARD_METRICS), np.nan)
+
+    def update(self, timestamp, values):
+        """add a sample"""
+        values = np.asarray(values, dtype=float)
+        for index, columns in enumerate(self.columns):
+            parts = values[columns]
+            self.latest[index] = np.nan if not len(parts) or np.isnan(parts).all() \
+                else np.nanmax(parts)
+        self.history.append(self.latest)
+        self.time = timestamp
+
+    def series(self, index):
+        """the recent values of a metric, from the oldest to the newest"""
+        return self.history.column(index)
+
+
+class MultiHostFeed:
+    """
+    Consume several sources in threads and publish the merged samples,
+    with the lock, version and error of CollectorFeed for the render loop.
+    A failing source does not stop the others, its error is kept in failed.
+    """
+
+    def __init__(self, sources, history=DEFAULT_SPARK):
+        """
+        :param sources: objects with iter_samples(stop=...), such as StreamClient or CsvReplay
+        :param history: the number of samples of the sparklines
+        """
+        self.sources = list(sources)
+        self.history = history
+        self.hosts = {}
+        self.lock = threading.Lock()
+        self.version = 0
+        self.error = None
+        self.failed = {}
+        self.ended = 0
+        self.__merger = TimestampMerger()
+        self.__stop = threading.Event()
+        self.__threads = []
+
+    def start(self):
+        """start consuming every source"""
+        for number, source in enumerate(self.sources):
+            thread = threading.Thread(target=self.__run, args=(number, source), daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+
+    def __release(self):
+        """apply the merged samples, with lock held"""
+        for number, timestamp, (name, fields, values) in self.__merger.pop_ready():
+            if number not in self.hosts:
+                self.hosts[number] = HostStats(name, fields, self.history, number)
+            self.hosts[number].update(timestamp, values)
+            self.version += 1
+
+    def __run(self, number, source):
+        try:
+            for sample in source.iter_samples(stop=self.__stop):
+                name = getattr(source, "host", None) or "#{}".format(number)
+                with self.lock:
+                    self.__merger.push(number, sample.timestamp,
+                                       (name, sample.fields, np.array(sample.values, dtype=float)))
+                    self.__release()
+        except Exception as err:
+            self.failed[number] = err
+        finally:
+            with self.lock:
+                self.__merger.end(number)
+                self.ended += 1
+                self.__release()
+                self.version += 1
+
+    def top(self, metric, count=None):
+        """
+        Sort the hosts by the latest value of a metric, with lock held.
+
+        :param metric: the index in DASHBOARD_METRICS
+        :param count: the max number of hosts, None for all
+        :returns list: HostStats, the hosts without the metric last
+        """
+        hosts = sorted(self.hosts.values(), key=lambda host: (
+            np.isnan(host.latest[metric]), -np.nan_to_num(host.latest[metric]), host.name))
+        return hosts if count is None else hosts[:count]
+
+    def stop(self, timeout=None):
+        """stop consuming"""
+        self.__stop.set()
+        for thread in self.__threads:
+            thread.join(timeout)
+
+
+def open_sources(specs, speed=1):
+    """
+    Open the sources of the dashboard.
+
+    :param specs: unix:PATH or tcp:HOST:PORT of the streams, or csv files to replay
+    :param speed: the replay speed of the csv files
+    :returns tuple: (sources, csv indexes to close)
+    """
+    from csvindex import CsvIndex
+    from replay import CsvReplay
+    sources = []
+    indexes = []
+    for spec in specs:
+        if is_stream(spec):
+            sources.append(StreamClient(spec))
+            continue
+        index = CsvIndex(spec)
+        replay = CsvReplay(index, speed)
+        replay.host = os.path.splitext(os.path.basename(spec))[0]
+        sources.append(replay)
+        indexes.append(index)
+    return sources, indexes
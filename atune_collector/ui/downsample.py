@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Reduce the plot series to the columns of the diagrams. The buckets are aligned
+to the sample numbers, so the points of the complete buckets are cached per
+series and only the new buckets are computed when the series moves on.
+"""
+
+import math
+
+import numpy as np
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+class PlotData(list):
+    """The values of a plot series"""
+
+    def __init__(self, values=(), offset=None, key=None):
+        """
+        :param values: the values from the oldest to the newest
+        :param offset: the sample number of the first value, None if unknown
+        :param key: the identity of the series, such as (module, metric), None if unknown
+        """
+        super().__init__(values)
+        self.offset = offset
+        self.key = key
+
+
+class Downsampler:
+    """
+    Downsample the series of the diagrams, by largest-triangle-three-buckets,
+    which keeps the shape, or by the min and max of each bucket, which keeps
+    every spike. The triangles of lttb are drawn between the averages of the
+    neighbouring buckets, so a bucket is cached once they are complete.
+    """
+
+    def __init__(self, method="lttb"):
+        if method not in DOWNSAMPLE_METHODS:
+            raise ValueError("Unknown downsample method: {}".format(method))
+        self.method = method
+        # key -> (bucket size, {bucket: points})
+        self.__cache = {}
+        # the keys reduced since the last sweep
+        self.__used = set()
+
+    def reduce(self, key, data, width):
+        """
+        Reduce a series to at most width points.
+
+        :param key: the identity of the series, such as (module, metric), None not to cache
+        :param data: the values, PlotData with an offset to cache the complete buckets
+        :param width: the number of columns
+        :returns list: the points, data itself if it fits
+        """
+        if width < 2 or len(data) <= width:
+            return data
+        values = np.asarray(data, dtype=float)
+        offset = getattr(data, "offset", None)
+        buckets = width if self.method == "lttb" else width // 2
+        size = math.ceil(len(values) / max(buckets - 1, 1))
+        start = 0 if offset is None else offset
+        end = start + len(values)
+
+        cache = {}
+        if offset is not None and key is not None:
+            self.__used.add(key)
+            cached_size, cached = self.__cache.get(key, (None, {}))
+            if cached_size == size:
+                cache = cached
+            self.__cache[key] = (size, cache)
+
+        points = []
+        first = start // size
+        for bucket in range(first, (end - 1) // size + 1):
+            low = max(bucket * size, start)
+            high = min((bucket + 1) * size, end)
+            complete = low == bucket * size and high == (bucket + 1) * size
+            # lttb also depends on the previous and the next buckets being complete
+            stable = complete and (self.method != "lttb" or
+                                   (bucket - 1) * size >= start and (bucket + 2) * size <= end)
+            chosen = cache.get(bucket) if stable else None
+            if chosen is None:
+                chosen = self.__bucket(values, low - start, high - start, start, size, end,
+                                       bucket == first)
+                if stable:
+                    cache[bucket] = chosen
+            points.extend(chosen)
+
+        # forget the buckets which left the series
+        for bucket in [bucket for bucket in cache if bucket < start // size]:
+            del cache[bucket]
+        return [value for _, value in points]
+
+    def __bucket(self, values, low, high, start, size, end, leading):
+        """the points of a bucket, as (sample number, value)"""
+        part = values[low:high]
+        if self.method == "minmax":
+            first, second = sorted((int(np.nanargmin(part)) if not np.isnan(part).all() else 0,
+                                    int(np.nanargmax(part)) if not np.isnan(part).all() else 0))
+            chosen = [(start + low + first, part[first])]
+            if second != first:
+                chosen.append((start + low + second, part[second]))
+            return chosen
+        if leading:
+            return [(start + low, part[0])]
+        # the triangles lean on the averages of the neighbouring buckets rather than on the
+        # point chosen in the previous one, so a bucket does not depend on the window start
+        prev_x, prev_y = self.__average(values, max(low - size, 0), low, start)
+        # the average of the next bucket, or the last point for the last bucket
+        if high < end - start:
+            next_x, next_y = self.__average(values, high, min(high + size, end - start), start)
+        else:
+            next_x, next_y = start + high - 1, part[-1]
+        x = np.arange(start + low, start + high)
+        area = np.abs((prev_x - next_x) * (part - prev_y) - (prev_x - x) * (next_y - prev_y))
+        index = int(np.nanargmax(area)) if not np.isnan(area).all() else 0
+        return [(start + low + index, part[index])]
+
+    @staticmethod
+    def __average(values, low, high, start):
+        """the center and the mean of the values of a bucket"""
+        part = values[low:high]
+        return start + (low + high - 1) / 2, np.nanmean(part) if not np.isnan(part).all() else 0.0
+
+    def sweep(self):
+        """drop the cached buckets of the series not reduced since the last sweep"""
+        for key in [key for key in self.__cache if key not in self.__used]:
+            del self.__cache[key]
+        self.__used.clear()
+
+    def forget(self, key=None):
+        """drop the cached buckets of a series, or of all series"""
+        if key is None:
+            self.__cache.clear()
+        else:
+            self.__cache.pop(key, None)
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Collect samples in a background thread and publish them to the render loop,
+so drawing and key handling do not wait for the collection rounds.
+"""
+
+import threading
+
+
+class CollectorFeed:
+    """
+    Publish the samples of a collector into FieldStats. The render loop holds
+    lock while reading the stats and redraws when version changes.
+    """
+
+    def __init__(self, collector, stats):
+        """
+        :param collector: Collector, or any object with iter_samples(stop=...)
+        :param stats: FieldStats updated by each sample
+        """
+        self.stats = stats
+        self.lock = threading.Lock()
+        self.version = 0
+        self.error = None
+        self.__collector = collector
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def start(self):
+        """start collecting"""
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        try:
+            for sample in self.__collector.iter_samples(stop=self.__stop):
+                with self.lock:
+                    self.stats.update(sample.values, sample.timestamp)
+                    self.version += 1
+        except Exception as err:
+            # raised by the render loop
+            self.error = err
+
+    def stop(self, timeout=None):
+        """
+        Stop collecting after the round in progress.
+
+        :param timeout: max time to wait for the round in seconds, None to wait until it ends
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Replay a recorded csv file like a live collection. The rows are read block by
+block through the csv index and released at the pace of the recorded times,
+so a replay feeds the same CollectorFeed and statistics as a live session.
+"""
+
+import argparse
+import threading
+import time
+
+from samples import Sample
+from csvindex import CsvIndex, parse_time, unwrap_times
+
+REPLAY_SPEEDS = (1, 10, 100)
+# the slowest speed, a speed of 0 would never release a row
+MIN_SPEED = 1e-3
+# max time to wait at once, also the latency of the controls
+REPLAY_TICK = 0.1
+
+
+def replay_speed(value):
+    """
+    Parse a replay speed argument.
+
+    :param value: the speed string
+    :returns float: the speed
+    :raises ArgumentTypeError: Fail, the speed is not a positive number
+    """
+    try:
+        speed = float(value)
+    except ValueError:
+        speed = 0.0
+    if not speed > 0:
+        raise argparse.ArgumentTypeError("invalid replay speed: {}, it must be > 0".format(value))
+    return speed
+
+
+class CsvReplay:
+    """
+    The rows of a csv file as samples, with the iter_samples interface of
+    Collector. The speed, pause and step controls may be called from any thread.
+    """
+
+    def __init__(self, index: CsvIndex, speed=1, interval=1, start=0):
+        """
+        :param index: the csv index
+        :param speed: the replay speed, 10 for 10 times faster than recorded
+        :param interval: the seconds between rows if the file has no time column
+        :param start: the first row to replay
+        """
+        self.index = index
+        self.speed = max(speed, MIN_SPEED)
+        self.interval = interval
+        self.paused = False
+        self.position = start
+        self.time = None
+        self.__steps = 0
+        self.__condition = threading.Condition()
+
+    def set_speed(self, speed):
+        """change the replay speed"""
+        with self.__condition:
+            self.speed = max(speed, MIN_SPEED)
+            self.__condition.notify_all()
+
+    def faster(self):
+        """switch to the next speed of REPLAY_SPEEDS"""
+        self.set_speed(next((speed for speed in REPLAY_SPEEDS if speed > self.speed),
+                            REPLAY_SPEEDS[-1]))
+
+    def slower(self):
+        """switch to the previous speed of REPLAY_SPEEDS"""
+        self.set_speed(next((speed for speed in reversed(REPLAY_SPEEDS) if speed < self.speed),
+                            REPLAY_SPEEDS[0]))
+
+    def toggle_pause(self):
+        """pause or resume"""
+        with self.__condition:
+            self.paused = not self.paused
+            self.__condition.notify_all()
+
+    def step(self):
+        """release one row while paused"""
+        with self.__condition:
+            self.__steps += 1
+            self.__condition.notify_all()
+
+    def __times(self, start, stop, last):
+        """the unwrapped recorded times of the rows in [start, stop)"""
+        times = self.index.read_times(start, stop)
+        if not times:
+            return [row * self.interval for row in range(start, stop)]
+        return unwrap_times((parse_time(value) for value in times), last)
+
+    def __wait(self, delay, stop):
+        """
+        Wait for the recorded delay at the current speed, or for a step while paused.
+
+        :returns bool: False if stop is set
+        """
+        checked = time.monotonic()
+        waited = 0.0
+        with self.__condition:
+            while stop is None or not stop.is_set():
+                now = time.monotonic()
+                if self.paused:
+                    if self.__steps > 0:
+                        self.__steps -= 1
+                        return True
+                    checked = now
+                else:
+                    # the speed may change while waiting
+                    waited += (now - checked) * self.speed
+                    checked = now
+                    if waited >= delay:
+                        return True
+                    self.__condition.wait(min(REPLAY_TICK, (delay - waited) / self.speed))
+                    continue
+                self.__condition.wait(REPLAY_TICK)
+        return False
+
+    def iter_samples(self, count=None, duration=None, stop=None):
+        """
+        Replay the rows from the current position.
+
+        :param count: the max number of samples, None until the end of the file
+        :param duration: the max recorded time to replay in seconds, None until the end
+        :param stop: threading.Event to cancel
+        :returns iterator: Sample of each row, timestamp is the recorded time
+        """
+        stride = self.index.stride
+        replayed = 0
+        first = None
+        last = None
+        while self.position < len(self.index):
+            start = self.position
+            rows = self.index.read_rows(start, start + stride)
+            if len(rows) == 0:
+                return
+            times = self.__times(start, start + len(rows), last)
+            for values, timestamp in zip(rows, times):
+                if count is not None and replayed >= count:
+                    return
+                first = timestamp if first is None else first
+                if duration is not None and timestamp - first > duration:
+                    return
+                delay = 0 if last is None else timestamp - last
+                if not self.__wait(delay, stop):
+                    return
+                last = timestamp
+                self.time = timestamp
+                self.position += 1
+                replayed += 1
+                yield Sample(timestamp, values, self.index.fields)
+
+    def describe(self):
+        """the state of the replay"""
+        state = "paused" if self.paused else "{:g}x".format(self.speed)
+        where = ""
+        if self.time is not None and self.index.time_column is not None:
+            seconds = int(self.time) % (24 * 3600)
+            where = " {:02d}:{:02d}:{:02d}".format(seconds // 3600, seconds // 60 % 60, seconds % 60)
+        return "replay {}, row {} of {}{}".format(state, self.position, len(self.index), where)
@@ -0,0 +1,260 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Incremental statistics of the displayed fields. Each sample updates the running
+statistics and the plot history once, so the cost of a frame does not depend on
+how long the session has been running, and the memory is bounded by the
+history window and the downsampled long-term tier.
+"""
+
+import collections
+import time
+
+import numpy as np
+
+from summary import RunningStats
+
+DEFAULT_HISTORY = 1024
+# the long-term tier keeps a day of 1-minute buckets by default
+DEFAULT_PERIOD = 60
+DEFAULT_PERIODS = 1440
+
+
+def parse_field(name):
+    """
+    Split a field name into the module and metric shown by the UI.
+
+    :param name: MODULE.PURPOSE.metric, the metric may contain a dot, such as CPU.STAT.util.cpu
+    :returns tuple: (module, metric)
+    """
+    item = name.split('.')
+    if len(item) > 3:
+        item[-2] = item[-2] + "." + item[-1]
+        item.pop()
+    return item[0], item[-1]
+
+
+def field_index(fields):
+    """
+    Group the columns of the fields by module and metric.
+
+    :param fields: the field names
+    :returns tuple: (modules in the order of fields, module -> metric -> column)
+    """
+    modules = []
+    # any module is accepted, a repeated metric takes the last column
+    index = collections.OrderedDict()
+    for column, name in enumerate(fields):
+        module, metric = parse_field(name)
+        if module not in index:
+            modules.append(module)
+            index[module] = {}
+        index[module][metric] = column
+    return modules, index
+
+
+def group_by_module(index, values, digits=2):
+    """
+    Group the values of a row by module and metric.
+
+    :param index: module -> metric -> column, see field_index
+    :param values: the row
+    :param digits: round to digits
+    :returns dict: module -> metric -> value, modules not collected are empty
+    """
+    rounded = np.round(values, digits).tolist()
+    grouped = collections.defaultdict(dict)
+    for module, metrics in index.items():
+        grouped[module] = {metric: rounded[column] for metric, column in metrics.items()}
+    return grouped
+
+
+class RingBuffer:
+    """Rows of float64 with a fixed capacity, the oldest rows are overwritten"""
+
+    def __init__(self, capacity, width):
+        self.capacity = max(int(capacity), 1)
+        self.data = np.zeros((self.capacity, width))
+        # the number of rows ever appended
+        self.total = 0
+        self.__next = 0
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def append(self, row):
+        """append a row, overwriting the oldest one when full"""
+        self.data[self.__next] = row
+        self.total += 1
+        self.__next = (self.__next + 1) % self.capacity
+        self.__count = min(self.__count + 1, self.capacity)
+
+    def column(self, index):
+        """
+        Get a column from the oldest row to the newest.
+
+        :param index: the column number
+        :returns ndarray: the values, a copy
+        """
+        if self.__count < self.capacity:
+            return self.data[:self.__count, index].copy()
+        return np.concatenate((self.data[self.__next:, index], self.data[:self.__next, index]))
+
+
+class DownsampledHistory:
+    """The min, max and mean of each field per period, nan values are not counted"""
+
+    def __init__(self, width, period=DEFAULT_PERIOD, capacity=DEFAULT_PERIODS):
+        """
+        :param width: the number of fields
+        :param period: the length of a bucket in seconds
+        :param capacity: the number of buckets kept
+        """
+        self.period = period
+        self.times = RingBuffer(capacity, 1)
+        self.rings = {kind: RingBuffer(capacity, width) for kind in ("mean", "min", "max")}
+        self.__bucket = None
+        self.__sum = np.zeros(width)
+        self.__count = np.zeros(width, dtype=np.int64)
+        self.__min = np.full(width, np.nan)
+        self.__max = np.full(width, np.nan)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __current(self):
+        """the statistics of the bucket in progress"""
+        mean = np.divide(self.__sum, self.__count, out=np.full(len(self.__sum), np.nan),
+                         where=self.__count > 0)
+        return {"mean": mean, "min": self.__min, "max": self.__max}
+
+    def __flush(self):
+        """close the bucket in progress"""
+        for kind, values in self.__current().items():
+            self.rings[kind].append(values)
+        self.times.append(self.__bucket * self.period)
+        self.__sum[:] = 0
+        self.__count[:] = 0
+        self.__min[:] = np.nan
+        self.__max[:] = np.nan
+
+    def update(self, timestamp, row):
+        """
+        Add a row of values.
+
+        :param timestamp: the time of the row in seconds
+        :param row: the values
+        """
+        bucket = int(timestamp // self.period)
+        if self.__bucket is not None and bucket != self.__bucket:
+            self.__flush()
+        self.__bucket = bucket
+        row = np.asarray(row, dtype=float)
+        valid = ~np.isnan(row)
+        self.__sum[valid] += row[valid]
+        self.__count[valid] += 1
+        np.fmin(self.__min, row, out=self.__min)
+        np.fmax(self.__max, row, out=self.__max)
+
+    def series(self, column, kind="mean"):
+        """
+        Get the buckets of a field, including the one in progress.
+
+        :param column: the column number
+        :param kind: mean/min/max
+        :returns list: the values from the oldest bucket to the newest
+        """
+        values = self.rings[kind].column(column).tolist()
+        if self.__bucket is not None:
+            values.append(float(self.__current()[kind][column]))
+        return values
+
+
+class FieldStats:
+    """The statistics of the displayed fields, grouped by module"""
+
+    def __init__(self, fields, history=DEFAULT_HISTORY, period=DEFAULT_PERIOD,
+                 periods=DEFAULT_PERIODS):
+        """
+        :param fields: the field names, in the order of the values of a sample
+        :param history: the number of samples kept for the plots
+        :param period: the bucket length of the long-term tier in seconds, None to disable it
+        :param periods: the number of buckets kept by the long-term tier
+        """
+        self.fields = list(fields)
+        # module -> metric -> column
+        self.modules, self.index = field_index(self.fields)
+        self.running = RunningStats(len(self.fields))
+        self.history = RingBuffer(history, len(self.fields))
+        self.longterm = None
+        if period is not None:
+            self.longterm = DownsampledHistory(len(self.fields), period, periods)
+
+    def __len__(self):
+        return len(self.history)
+
+    @property
+    def offset(self):
+        """the sample number of the oldest sample in the history"""
+        return self.history.total - len(self.history)
+
+    def update(self, values, timestamp=None):
+        """
+        Add a sample.
+
+        :param values: the values in the order of fields
+        :param timestamp: the time of the sample in seconds, now by default
+        """
+        self.running.update(values)
+        self.history.append(values)
+        if self.longterm is not None:
+            self.longterm.update(time.time() if timestamp is None else timestamp, values)
+
+    def averages(self, digits=2):
+        """
+        Get the means since the first sample.
+
+        :param digits: round to digits
+        :returns dict: module -> metric -> mean, modules not collected are empty
+        """
+        return group_by_module(self.index, self.running.mean, digits)
+
+    def series(self, module, metric):
+        """
+        Get the history of a metric for plotting.
+
+        :param module: the module, such as CPU
+        :param metric: the metric, such as util
+        :returns list: the values from the oldest to the newest, empty if not collected
+        """
+        column = self.index.get(module, {}).get(metric)
+        if column is None:
+            return []
+        return self.history.column(column).tolist()
+
+    def longterm_series(self, module, metric, kind="mean"):
+        """
+        Get the long-term tier of a metric for plotting.
+
+        :param module: the module, such as CPU
+        :param metric: the metric, such as util
+        :param kind: mean/min/max of each period
+        :returns list: the values from the oldest period to the newest,
+                       empty if not collected or the tier is disabled
+        """
+        column = self.index.get(module, {}).get(metric)
+        if column is None or self.longterm is None:
+            return []
+        return self.longterm.series(column, kind)
@@ -0,0 +1,254 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune-Collector is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Collector streams, used by the multi-host dashboard. A publisher serves the
+samples of a collector, or of a replayed csv file, on a unix or tcp socket as
+json lines: a header {"host": name, "fields": [...]} followed by one
+{"t": timestamp, "v": [...]} per sample.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+
+sys.path.append(os.path.dirname(__file__) + '/..')
+from samples import Sample
+
+# max time to block on a socket, also the latency of stop
+STREAM_TICK = 0.5
+# max bytes queued for a subscriber not reading fast enough before it is dropped
+MAX_BACKLOG = 1 << 20
+
+
+def parse_address(spec):
+    """
+    Parse a stream address.
+
+    :param spec: unix:PATH or tcp:HOST:PORT
+    :returns tuple: (socket family, address)
+    :raises ValueError: Fail, unknown address
+    """
+    kind, _, address = spec.partition(":")
+    if kind == "unix" and address:
+        return socket.AF_UNIX, address
+    if kind == "tcp":
+        host, _, port = address.rpartition(":")
+        if port.isdigit():
+            return socket.AF_INET, (host or "127.0.0.1", int(port))
+    raise ValueError("Invalid stream address: {}".format(spec))
+
+
+def is_stream(spec):
+    """whether spec is a stream address rather than a csv file"""
+    return spec.startswith(("unix:", "tcp:"))
+
+
+class StreamServer:
+    """
+    Publish samples to every connected subscriber. The samples are sent without
+    blocking the collector, the unsent bytes are queued per subscriber and a
+    subscriber falling more than MAX_BACKLOG bytes behind is dropped.
+    """
+
+    def __init__(self, spec, fields, host=None):
+        """
+        :param spec: unix:PATH or tcp:HOST:PORT to listen on
+        :param fields: the field names of the samples
+        :param host: the name of the host, the hostname by default
+        """
+        family, address = parse_address(spec)
+        self.header = (json.dumps({"host": host or socket.gethostname(),
+                                   "fields": list(fields)}) + "\n").encode()
+        # subscriber -> the bytes not sent yet
+        self.__clients = {}
+        self.__lock = threading.Condition()
+        self.__sock = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+        if family == socket.AF_INET:
+            self.__sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__sock.bind(address)
+        self.__sock.listen()
+        self.__address = address if family == socket.AF_UNIX else None
+        threading.Thread(target=self.__accept, daemon=True).start()
+
+    def __accept(self):
+        while True:
+            try:
+                client, _ = self.__sock.accept()
+            except OSError:
+                # closed
+                return
+            try:
+                client.settimeout(STREAM_TICK)
+                client.sendall(self.header)
+                client.setblocking(False)
+            except OSError:
+                client.close()
+                continue
+            with self.__lock:
+                self.__clients[client] = bytearray()
+                self.__lock.notify_all()
+
+    def wait_subscribers(self, count, timeout=None):
+        """
+        Wait until count subscribers are connected.
+
+        :returns bool: False on timeout
+        """
+        with self.__lock:
+            return self.__lock.wait_for(lambda: len(self.__clients) >= count, timeout)
+
+    def publish(self, sample):
+        """send a sample, the subscribers failing or falling behind are dropped"""
+        line = (json.dumps({"t": float(sample.timestamp),
+                            "v": [float(value) for value in sample.values]}) + "\n").encode()
+        with self.__lock:
+            for client, backlog in list(self.__clients.items()):
+                backlog += line
+                try:
+                    del backlog[:client.send(backlog)]
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    backlog = None
+                if backlog is None or len(backlog) > MAX_BACKLOG:
+                    client.close()
+                    del self.__clients[client]
+
+    def close(self):
+        """stop listening and disconnect the subscribers"""
+        self.__sock.close()
+        with self.__lock:
+            for client in self.__clients:
+                client.close()
+            self.__clients = {}
+        if self.__address is not None and os.path.exists(self.__address):
+            os.unlink(self.__address)
+
+
+class StreamClient:
+    """Subscribe to a published stream, with the iter_samples interface of Collector"""
+
+    def __init__(self, spec):
+        """
+        :param spec: unix:PATH or tcp:HOST:PORT to connect to
+        """
+        self.spec = spec
+        self.host = spec
+        self.fields = None
+        self.__family, self.__address = parse_address(spec)
+
+    def __lines(self, sock, stop):
+        """the lines received until the stream ends or stop is set"""
+        pending = b""
+        while stop is None or not stop.is_set():
+            try:
+                data = sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not data:
+                return
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                yield line
+
+    def iter_samples(self, count=None, duration=None, stop=None):
+        """
+        Receive the samples until the publisher ends the stream.
+
+        :param count: the max number of samples, None for unbounded
+        :param duration: the max time of the samples in seconds, None for unbounded
+        :param stop: threading.Event to cancel
+        :returns iterator: Sample of each received sample
+        :raises OSError: Fail, the publisher is not reachable
+        """
+        sock = socket.socket(self.__family, socket.SOCK_STREAM)
+        sock.connect(self.__address)
+        sock.settimeout(STREAM_TICK)
+        received = 0
+        first = None
+        try:
+            for line in self.__lines(sock, stop):
+                record = json.loads(line)
+                if self.fields is None:
+                    self.host = record["host"]
+                    self.fields = record["fields"]
+                    continue
+                if count is not None and received >= count:
+                    return
+                first = record["t"] if first is None else first
+                if duration is not None and record["t"] - first > duration:
+                    return
+                received += 1
+                yield Sample(record["t"], record["v"], self.fields)
+        finally:
+            sock.close()
+
+
+def serve(spec, source, fields, host=None, subscribers=0):
+    """
+    Publish the samples of a source until it ends.
+
+    :param spec: the address to listen on
+    :param source: Collector or CsvReplay
+    :param fields: the field names
+    :param host: the name of the host
+    :param subscribers: the number of subscribers to wait for before the first sample
+    """
+    server = StreamServer(spec, fields, host)
+    try:
+        server.wait_subscribers(subscribers)
+        for sample in source.iter_samples():
+            server.publish(sample)
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    from replay import replay_speed
+    PARSER = argparse.ArgumentParser(description="publish a collector stream for the dashboard")
+    PARSER.add_argument('-l', '--listen', required=True,
+                        help="unix:PATH or tcp:HOST:PORT to listen on")
+    PARSER.add_argument('-c', '--config',
+                        default="/etc/atune_collector/collect_data.json",
+                        help="collector configuration json file")
+    PARSER.add_argument('-f', '--file', default="",
+                        help="replay the csv file instead of collecting")
+    PARSER.add_argument('--replay', type=replay_speed, default=1,
+                        help="the replay speed of the csv file")
+    PARSER.add_argument('--host', default=None,
+                        help="the host name shown by the dashboard")
+    PARSER.add_argument('--wait', type=int, default=0,
+                        help="the number of subscribers to wait for before starting")
+    ARGS = PARSER.parse_args()
+    if ARGS.file:
+        from csvindex import CsvIndex
+        from replay import CsvReplay
+        INDEX = CsvIndex(ARGS.file)
+        SOURCE = CsvReplay(INDEX, ARGS.replay)
+        FIELDS = INDEX.fields
+    else:
+        from collect_data import Collector
+        with open(ARGS.config, 'r') as jsonfile:
+            SOURCE = Collector(json.load(jsonfile), retain=1)
+        FIELDS = SOURCE.field_name
+    try:
+        serve(ARGS.listen, SOURCE, FIELDS, ARGS.host, ARGS.wait)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+import shutil
+
+from atune_collector.plugin.monitor.cgroup.stat import CgroupStat, walk
+
+
+def make_cgroup(root, path, usage, current, rbytes):
+    """create a cgroup of the fake cgroup v2 hierarchy"""
+    cgroup = os.path.join(root, path)
+    os.makedirs(cgroup, exist_ok=True)
+    contents = {
+        "cpu.stat": "usage_usec %d\nuser_usec %d\nsystem_usec 0\n" % (usage, usage),
+        "memory.current": "%d\n" % current,
+        "memory.stat": "anon %d\nfile 0\npgfault 10\n" % current,
+        "io.stat": "8:0 rbytes=%d wbytes=0 rios=1 wios=0\n8:16 rbytes=%d wbytes=0 rios=1 wios=0\n"
+                   % (rbytes, rbytes),
+        "cpu.pressure": "some avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+                        "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n",
+    }
+    for name, content in contents.items():
+        with open(os.path.join(cgroup, name), 'w') as file:
+            file.write(content)
+
+
+class TestCgroupStat:
+    """ test cgroup stat monitor"""
+
+    def test_walk_depth(self, tmp_path):
+        """test walk the hierarchy to the given depth only"""
+        root = str(tmp_path)
+        os.makedirs(os.path.join(root, "system.slice", "sshd.service", "deep"))
+        cgroups = walk(root, 2)
+        assert sorted(cgroups) == ["", "system.slice", "system.slice/sshd.service"]
+
+    def test_glob_aggregate(self, tmp_path):
+        """test glob patterns aggregate all matched cgroups"""
+        root = str(tmp_path)
+        make_cgroup(root, "system.slice/docker-a.scope", 0, 1024 * 1024, 0)
+        make_cgroup(root, "system.slice/docker-b.scope", 0, 2048 * 1024, 0)
+        make_cgroup(root, "system.slice/sshd.service", 0, 1024, 0)
+        monitor = CgroupStat("UT", root)
+        para = "--interval=1 --cgroup=system.slice/docker-*.scope,system.slice/sshd.service;" \
+               "--fields=memory --fields=rkBs --fields=anon " \
+               "--cgroup=system.slice/docker-*.scope,system.slice/sshd.service"
+        assert monitor.report("data", None, para) == \
+            ["3072.000", "1.000", "0.000", "0.000", "3072.000", "1.000"]
+
+        make_cgroup(root, "system.slice/docker-a.scope", 0, 1024 * 1024, 1024 * 1024)
+        rkbs = float(monitor.report("data", None, para)[2])
+        assert rkbs > 0
+
+        info = monitor._get("--cgroup=system.slice/docker-*.scope")
+        assert info.startswith("system.slice/docker-*.scope (#cgroups: 2)")
+
+    def test_removed_cgroup(self, tmp_path):
+        """test the files of a removed cgroup are no longer read"""
+        root = str(tmp_path)
+        make_cgroup(root, "system.slice/docker-a.scope", 0, 1024 * 1024, 0)
+        make_cgroup(root, "system.slice/docker-b.scope", 0, 2048 * 1024, 0)
+        monitor = CgroupStat("UT", root)
+        para = "--cgroup=system.slice/docker-*.scope"
+        assert "memory                  : 3072.000" in monitor._get(para)
+        shutil.rmtree(os.path.join(root, "system.slice", "docker-b.scope"))
+        info = monitor._get(para)
+        assert info.startswith("system.slice/docker-*.scope (#cgroups: 1)")
+        assert "memory                  : 1024.000" in info
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import json
+
+import pytest
+
+from atune_collector.plugin.monitor.memory import topo
+from atune_collector.plugin.monitor.memory.bandwidth import MemBandwidth
+
+from .test_memory_uncore import make_cpu, make_pmu
+
+
+def dimm(slot):
+    """a 64 bits DDR4 2933 MHz dimm of lshw"""
+    return {"id": "bank", "class": "memory", "slot": slot, "size": 16 * 1024 ** 3,
+            "width": 64, "description": "DIMM DDR4 2933 MHz (0.3 ns)"}
+
+
+class TestMemoryBandwidth:
+    """ test memory bandwidth monitor"""
+
+    def test_theory_bandwidth(self, tmp_path, monkeypatch, caplog):
+        """test the max bandwidth of every discovered socket, the ones without dimms are 0"""
+        root = str(tmp_path)
+        for cpu, socket in ((0, 0), (28, 1), (56, 9)):
+            make_cpu(root, cpu, socket)
+        make_pmu(root, "uncore_imc_0", "0,28,56", {"cas_count_read": "event=0x04,umask=0x0f"})
+        # two channels of socket 0, the second dimm of a channel does not count
+        memorys = {"memorys": [{"children": [dimm("DIMM000"), dimm("DIMM001"), dimm("DIMM010"),
+                                             dimm("DIMM900")]}]}
+        monkeypatch.setattr(topo.MemTopo, "report", lambda *_: json.dumps(memorys))
+
+        caplog.set_level("INFO")
+        monitor = MemBandwidth("UT", root)
+        assert "socket 1 is unknown" in caplog.text
+        channel = 64 * 2933000000 / 8 / 1024 / 1024
+        values = monitor.decode("", "--fields=CPU0_Max --fields=CPU1_Max --fields=CPU9_Max "
+                                    "--fields=Total_Max").split()
+        assert [float(value) for value in values] == pytest.approx(
+            [2 * channel, 0, channel, 3 * channel], abs=0.01)
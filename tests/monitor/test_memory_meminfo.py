@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+from atune_collector.plugin.monitor.memory.meminfo import MemInfo
+
+from .test_procparse import MEMINFO
+
+
+class TestMemInfo:
+    """ test memory meminfo monitor"""
+
+    def test_decode(self, tmp_path, monkeypatch):
+        """test the info of get and any other info are decoded alike"""
+        path = tmp_path / "meminfo"
+        path.write_bytes(MEMINFO % 123456789)
+        monkeypatch.setattr(MemInfo, "_option", str(path))
+        monitor = MemInfo("UT")
+        para = "--fields=MemFree --fields=Active(anon)"
+        info = monitor._get()
+        assert monitor.decode(info, para) == " 123456789 4000"
+        assert monitor.decode((MEMINFO % 12).decode(), para) == " 12 4000"
+        # an equal info of another read is parsed from the buffer
+        path.write_bytes(MEMINFO % 12)
+        monitor._get()
+        assert monitor.decode((MEMINFO % 12).decode(), para) == " 12 4000"
+        assert monitor.decode(info, para) == " 123456789 4000"
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+
+from atune_collector.plugin.monitor.memory.numainfo import MemNuma
+
+
+def write_node(root, node, local, other, free):
+    """write numastat and meminfo of a node of the fake sysfs"""
+    path = os.path.join(root, "node%d" % node)
+    os.makedirs(path, exist_ok=True)
+    # rewrite in place, the monitor keeps the files open
+    with open(os.path.join(path, "numastat"), 'w') as file:
+        file.write("numa_hit %d\nnuma_miss 0\nnuma_foreign 0\ninterleave_hit 0\n"
+                   "local_node %d\nother_node %d\n" % (local + other, local, other))
+    with open(os.path.join(path, "meminfo"), 'w') as file:
+        file.write("Node %d MemTotal:  8192 kB\nNode %d MemFree:  %d kB\n" % (node, node, free))
+
+
+class TestMemoryNumainfo:
+    """ test numa monitor"""
+
+    def test_numa_fields(self, tmp_path):
+        """test per node meminfo and remote access ratio from sysfs"""
+        root = str(tmp_path)
+        with open(os.path.join(root, "online"), 'w') as file:
+            file.write("0-1\n")
+        write_node(root, 0, 0, 0, 1024)
+        write_node(root, 1, 0, 0, 3072)
+        monitor = MemNuma("UT")
+        monitor._option = root
+        para = "--interval=1;--fields=MemFree.total --fields=MemFree.node1 " \
+               "--fields=remote_ratio.node0 --fields=remote_ratio.total"
+        assert monitor.report("data", None, para) == ["4096.000", "3072.000", "0.000", "0.000"]
+
+        write_node(root, 0, 300, 100, 1024)
+        write_node(root, 1, 400, 0, 3072)
+        assert monitor.report("data", None, para)[2:] == ["25.000", "12.500"]
+
+    def test_raw(self, tmp_path):
+        """test the info without options keeps the layout of numactl -H"""
+        root = str(tmp_path)
+        with open(os.path.join(root, "online"), 'w') as file:
+            file.write("0-1\n")
+        for node, cpus, distance in ((0, "0-1", "10 21"), (1, "2,3", "21 10")):
+            write_node(root, node, 0, 0, 1024 * (node + 1))
+            for name, value in (("cpulist", cpus), ("distance", distance)):
+                with open(os.path.join(root, "node%d" % node, name), 'w') as file:
+                    file.write(value + "\n")
+        monitor = MemNuma("UT")
+        monitor._option = root
+        assert monitor.report("raw", None) == (
+            "available: 2 nodes (0-1)\n"
+            "node 0 cpus: 0 1\nnode 0 size: 8 MB\nnode 0 free: 1 MB\n"
+            "node 1 cpus: 2 3\nnode 1 size: 8 MB\nnode 1 free: 2 MB\n"
+            "node distances:\n"
+            "node   0   1 \n"
+            "  0:  10  21 \n"
+            "  1:  21  10 \n")
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+
+from atune_collector.plugin.monitor.memory.uncore import UncoreDiscovery, UncoreLayout
+
+
+def write_file(path, content):
+    """write content to path, creating parent directories"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def make_cpu(root, cpu, socket, die=0):
+    """create cpu topology of the fake sysfs"""
+    topology = os.path.join(root, "devices", "system", "cpu", "cpu%d" % cpu, "topology")
+    write_file(os.path.join(topology, "physical_package_id"), "%d\n" % socket)
+    write_file(os.path.join(topology, "die_id"), "%d\n" % die)
+
+
+def make_pmu(root, name, cpumask, events):
+    """create an uncore pmu of the fake sysfs"""
+    pmu = os.path.join(root, "bus", "event_source", "devices", name)
+    write_file(os.path.join(pmu, "cpumask"), cpumask + "\n")
+    for event, content in events.items():
+        write_file(os.path.join(pmu, "events", event), content + "\n")
+
+
+class TestMemoryUncore:
+    """ test memory uncore discovery"""
+
+    def test_discover_hisi_ddrc(self, tmp_path):
+        """test discover hisi ddrc pmus of 2 sockets with 2 dies"""
+        root = str(tmp_path)
+        for cpu, socket in ((0, 0), (24, 0), (48, 1), (72, 1)):
+            make_cpu(root, cpu, socket)
+        for sccl, cpu in ((1, 0), (3, 24), (5, 48), (7, 72)):
+            for ddrc in range(4):
+                make_pmu(root, "hisi_sccl%d_ddrc%d" % (sccl, ddrc), str(cpu),
+                         {"flux_rd": "config=0x1", "flux_wr": "config=0x0"})
+        make_pmu(root, "cpu", "0-95", {"cycles": "event=0x11"})
+
+        counters = UncoreDiscovery(root).discover()
+        assert len(counters) == 32
+        last = counters[-1]
+        assert (last.pmu, last.socket, last.die, last.channel, last.direction) == \
+            ("hisi_sccl7_ddrc3", 1, 1, 3, "W")
+
+        layout = UncoreLayout(counters)
+        assert layout.dies == {0: [0, 1], 1: [0, 1]}
+        output = "\n".join("1.000,CPU72,%d,,hisi_sccl7_ddrc%d/flux_rd/,1000,100.00,," % (32768, i)
+                           for i in range(4))
+        bandwidth = layout.bandwidth(layout.parse_perf(output), 1000)
+        assert bandwidth[(1, 1, "R")] == 4.0
+        assert bandwidth[(0, 0, "R")] == 0
+
+    def test_discover_imc_with_scale(self, tmp_path):
+        """test discover imc pmus which count on every socket"""
+        root = str(tmp_path)
+        make_cpu(root, 0, 0)
+        make_cpu(root, 28, 1)
+        make_pmu(root, "uncore_imc_0", "0,28",
+                 {"cas_count_read": "event=0x04,umask=0x0f",
+                  "cas_count_read.scale": "6.103515625e-5",
+                  "cas_count_read.unit": "MiB"})
+
+        layout = UncoreLayout(UncoreDiscovery(root).discover())
+        assert layout.sockets == [0, 1]
+        output = "2.001,CPU0,100.00,MiB,uncore_imc_0/cas_count_read/,2001,100.00,,\n" \
+                 "2.001,CPU28,<not counted>,MiB,uncore_imc_0/cas_count_read/,0,0.00,,"
+        bandwidth = layout.bandwidth(layout.parse_perf(output), 2000)
+        assert bandwidth[(0, 0, "R")] == 50.0
+        assert bandwidth[(1, 0, "R")] == 0
+
+    def test_discover_without_pmus(self, tmp_path):
+        """test discover on platform without uncore pmus"""
+        assert UncoreDiscovery(str(tmp_path)).discover() == []
@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+
+from atune_collector.plugin.monitor.process.procindex import ProcIndex
+
+
+def make_process(proc, pid, comm, cmdline, starttime):
+    """create a process of the fake procfs"""
+    path = os.path.join(proc, str(pid))
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "stat"), 'w') as file:
+        file.write("%d (%s) S 1 %d %d 0 -1 4194560 %s %d 0 0\n" % (
+            pid, comm, pid, pid, " ".join(["0"] * 12), starttime))
+    with open(os.path.join(path, "cmdline"), 'w') as file:
+        file.write("\0".join(cmdline) + "\0")
+
+
+class TestProcessProcIndex:
+    """ test process index"""
+
+    def test_scan_apps(self, tmp_path):
+        """test all applications are matched in one scan"""
+        proc = str(tmp_path)
+        make_process(proc, 10, "nginx", ["nginx: master process"], 100)
+        make_process(proc, 11, "nginx", ["nginx: worker process"], 101)
+        make_process(proc, 20, "postgres", ["/usr/bin/postgres", "-D", "/data"], 200)
+        make_process(proc, 30, "java-long-name-", ["/opt/java-long-name-server"], 300)
+        os.makedirs(os.path.join(proc, "self"))
+
+        index = ProcIndex(proc)
+        index.set_apps(["nginx", "post*", "re:-D /data", "java-long-name-server", "mysqld"])
+        assert index.scan() == [[10, 11], [20], [20], [30], []]
+        assert index.starttime(11) == 101
+
+    def test_scan_pid_reuse(self, tmp_path):
+        """test a reused pid is matched again"""
+        proc = str(tmp_path)
+        make_process(proc, 10, "nginx", ["nginx"], 100)
+        index = ProcIndex(proc)
+        index.set_apps(["nginx"])
+        assert index.scan() == [[10]]
+
+        make_process(proc, 10, "bash", ["bash"], 500)
+        assert index.scan() == [[]]
+        assert index.starttime(10) == 500
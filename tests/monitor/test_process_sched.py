@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import errno
+import os
+
+import pytest
+
+from atune_collector.plugin.monitor import procfile
+from atune_collector.plugin.monitor.process import sched
+from atune_collector.plugin.monitor.process.sched import ProcSched
+
+from .test_process_procindex import make_process
+
+
+class FakeTime:
+    """the monotonic clock of the monitor, moved by the test"""
+    now = 0.0
+
+    @classmethod
+    def monotonic(cls):
+        return cls.now
+
+
+def write_sched(path, runtime, switches, load):
+    """write a sched file with a counter in ms, a counter in events and a gauge"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write("nginx (10, #threads: 2)\n" + "-" * 59 + "\n"
+                   "se.sum_exec_runtime                          : %18.6f\n"
+                   "nr_switches                                  : %18d\n"
+                   "se.avg.load_avg                              : %18d\n" % (
+                       runtime, switches, load))
+
+
+def parse(info):
+    """the header and the values of the single application of the output"""
+    lines = info.splitlines()
+    values = {}
+    for line in lines[1:]:
+        key, value = line.split(":")
+        values[key.strip()] = float(value)
+    return lines[0], values
+
+
+class TestProcessSched:
+    """ test process sched monitor"""
+
+    def make_proc(self, proc, scale=1):
+        """two nginx processes, the first one with two threads"""
+        for pid in (10, 11):
+            make_process(proc, pid, "nginx", ["nginx"], pid * 10)
+            write_sched(os.path.join(proc, str(pid), "sched"), 100 * scale * pid, 10 * scale, pid)
+        for tid in (10, 12):
+            write_sched(os.path.join(proc, "10", "task", str(tid), "sched"),
+                        100 * scale * tid, 10 * scale, tid)
+        write_sched(os.path.join(proc, "11", "task", "11", "sched"), 1100 * scale, 10 * scale, 11)
+
+    def test_first(self, tmp_path):
+        """test the sched file of the first process is reported as read"""
+        proc = str(tmp_path)
+        self.make_proc(proc)
+        monitor = ProcSched("UT", proc)
+        info = monitor._get("--interval=1 --app=nginx,mysqld")
+        assert info.startswith("nginx (10, #threads: 2)")
+        assert monitor.decode(info, "--fields=switches --fields=load_avg") == " 10 10 0 0"
+
+    def test_aggregate(self, tmp_path, monkeypatch):
+        """test the counters of all processes are summed as rates and the gauges as values"""
+        proc = str(tmp_path)
+        self.make_proc(proc)
+        monkeypatch.setattr(sched, "time", FakeTime)
+        FakeTime.now = 100.0
+        monitor = ProcSched("UT", proc)
+        header, values = parse(monitor._get("--app=nginx --aggregate=sum"))
+        assert header == "nginx (sum, #tasks: 2)"
+        assert values == {"sum_exec_runtime": 0.0, "switches": 0.0, "load_avg": 21.0}
+
+        self.make_proc(proc, scale=3)
+        FakeTime.now = 102.0
+        _, values = parse(monitor._get("--app=nginx --aggregate=sum"))
+        assert values == {"sum_exec_runtime": 2100.0, "switches": 20.0, "load_avg": 21.0}
+
+        self.make_proc(proc, scale=5)
+        FakeTime.now = 104.0
+        header, values = parse(monitor._get("--app=nginx --aggregate=avg"))
+        assert header == "nginx (avg, #tasks: 2)"
+        assert values == {"sum_exec_runtime": 1050.0, "switches": 10.0, "load_avg": 10.5}
+
+    def test_threads(self, tmp_path, monkeypatch):
+        """test the threads of all processes are aggregated with --threads"""
+        proc = str(tmp_path)
+        self.make_proc(proc)
+        monkeypatch.setattr(sched, "time", FakeTime)
+        FakeTime.now = 100.0
+        monitor = ProcSched("UT", proc)
+        para = "--app=nginx --aggregate=sum --threads"
+        header, values = parse(monitor._get(para))
+        assert header == "nginx (sum, #tasks: 3)"
+        assert values["load_avg"] == 33.0
+
+        self.make_proc(proc, scale=2)
+        FakeTime.now = 101.0
+        _, values = parse(monitor._get(para))
+        assert values["sum_exec_runtime"] == 3300.0
+        assert values["switches"] == 30.0
+
+    def test_fd_limit(self, tmp_path, monkeypatch):
+        """test the tasks past the open file limit are still read, and EMFILE is raised"""
+        proc = str(tmp_path)
+        self.make_proc(proc)
+        monkeypatch.setattr(procfile, "open_file_limit", lambda: 1)
+        monitor = ProcSched("UT", proc)
+        para = "--app=nginx --aggregate=sum --threads"
+        header, values = parse(monitor._get(para))
+        assert header == "nginx (sum, #tasks: 3)"
+        assert values["load_avg"] == 33.0
+
+        def exhausted(*_, **__):
+            raise OSError(errno.EMFILE, os.strerror(errno.EMFILE))
+
+        monkeypatch.setattr(procfile.os, "open", exhausted)
+        with pytest.raises(OSError):
+            monitor._get(para)
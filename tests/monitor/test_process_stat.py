@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import errno
+import os
+
+import pytest
+
+from atune_collector.plugin.monitor import procfile
+from atune_collector.plugin.monitor.process import stat
+from atune_collector.plugin.monitor.process.stat import ProcStat, ProcessFiles
+
+from .test_process_sched import FakeTime
+
+
+def make_process(proc, pid, utime, rss, pss, fds=2):
+    """create a process of the fake procfs with its stat, status, io, smaps_rollup and fds"""
+    path = os.path.join(proc, str(pid))
+    os.makedirs(os.path.join(path, "fd"), exist_ok=True)
+    fields = ["0"] * 22
+    fields[0] = "S"
+    fields[7] = str(utime * 10)
+    fields[11] = str(utime)
+    fields[12] = str(utime // 2)
+    fields[17] = "4"
+    fields[19] = str(pid * 10)
+    contents = {
+        "stat": "%d (nginx) %s\n" % (pid, " ".join(fields)),
+        "cmdline": "nginx\0",
+        "status": "Name:\tnginx\nVmRSS:\t%8d kB\nVmSwap:\t       0 kB\n"
+                  "voluntary_ctxt_switches:\t%d\nnonvoluntary_ctxt_switches:\t0\n" % (rss, utime),
+        "io": "rchar: %d\nwchar: 0\nread_bytes: 0\nwrite_bytes: 0\n" % (utime * 1024),
+        "smaps_rollup": "00400000-7fff0000 ---p 00000000 00:00 0  [rollup]\n"
+                        "Rss:            %8d kB\nPss:            %8d kB\n" % (rss, pss),
+    }
+    for name, content in contents.items():
+        with open(os.path.join(path, name), 'w') as file:
+            file.write(content)
+    for fd in range(fds):
+        open(os.path.join(path, "fd", str(fd)), 'w').close()
+
+
+def parse(info):
+    """the values of each application of the output"""
+    apps = {}
+    values = None
+    for line in info.splitlines():
+        if " (#processes: " in line:
+            values = apps.setdefault(line.split(" ")[0], {})
+        else:
+            field, value = line.split(":")
+            values[field.strip()] = float(value)
+    return apps
+
+
+class TestProcessStat:
+    """ test process stat monitor"""
+
+    def test_fields(self, tmp_path, monkeypatch):
+        """test the gauges are summed and the counters converted to rates per second"""
+        proc = str(tmp_path)
+        make_process(proc, 10, 100, 1000, 600, fds=3)
+        make_process(proc, 11, 200, 3000, 1400)
+        monkeypatch.setattr(stat, "time", FakeTime)
+        FakeTime.now = 100.0
+        monitor = ProcStat("UT", proc)
+        values = parse(monitor._get("--interval=1 --app=nginx,mysqld"))
+        assert values["mysqld"]["rss"] == 0.0
+        nginx = values["nginx"]
+        assert (nginx["rss"], nginx["pss"], nginx["fds"], nginx["threads"]) == \
+            (4000.0, 2000.0, 5.0, 8.0)
+        assert nginx["cpu"] == 0.0
+
+        make_process(proc, 10, 100 + 2 * stat.CLK_TCK, 1000, 600, fds=3)
+        FakeTime.now = 102.0
+        nginx = parse(monitor._get("--aggregate=avg"))["nginx"]
+        # 2 seconds of user time and 1 second of system time in 2 seconds, of 2 processes
+        assert nginx["utime"] == pytest.approx(50.0)
+        assert nginx["cpu"] == pytest.approx(75.0)
+        assert nginx["rchar"] == pytest.approx(stat.CLK_TCK * 1024 / 2)
+        assert nginx["rss"] == 2000.0
+
+    def test_requested_sources(self, tmp_path, monkeypatch):
+        """test only the files of the fields given to get are read"""
+        proc = str(tmp_path)
+        make_process(proc, 10, 100, 1000, 600)
+        read = []
+        original = ProcessFiles.read
+
+        def record(files, name):
+            read.append(name)
+            return original(files, name)
+
+        monkeypatch.setattr(ProcessFiles, "read", record)
+        monitor = ProcStat("UT", proc)
+        monitor._get("--app=nginx")
+        assert set(read) == {"stat", "status", "io", "smaps_rollup"}
+        read.clear()
+        para = "--interval=1 --app=nginx --fields=rss --fields=cpu;--fields=rss --fields=cpu"
+        assert monitor.report("data", None, para) == ["1000.000", "0.000"]
+        assert sorted(read) == ["stat", "status"]
+        read.clear()
+        assert monitor.report("data", None, "--fields=pss;--fields=pss") == ["600.000"]
+        assert sorted(read) == ["smaps_rollup", "stat"]
+        with pytest.raises(LookupError):
+            monitor._get("--fields=vsz")
+
+    def test_fd_limit(self, tmp_path, monkeypatch):
+        """test the processes past the open file limit are still read, and EMFILE is raised"""
+        proc = str(tmp_path)
+        for pid in range(10, 14):
+            make_process(proc, pid, 100, 1000, 600)
+        monkeypatch.setattr(procfile, "open_file_limit", lambda: 2)
+        monitor = ProcStat("UT", proc)
+        para = "--app=nginx --fields=rss --fields=pss"
+        assert parse(monitor._get(para))["nginx"] == {"rss": 4000.0, "pss": 2400.0}
+        assert parse(monitor._get(para))["nginx"] == {"rss": 4000.0, "pss": 2400.0}
+
+        def exhausted(*_, **__):
+            raise OSError(errno.EMFILE, os.strerror(errno.EMFILE))
+
+        monkeypatch.setattr(procfile.os, "open", exhausted)
+        with pytest.raises(OSError):
+            monitor._get(para)
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import pytest
+
+from atune_collector.plugin.monitor.processor.schedstat import CpuSchedstat, parse_schedstat
+from atune_collector.plugin.monitor.system.softirq import SysSoftirq
+
+SCHEDSTAT = """\
+version 15
+timestamp 4295003745
+cpu0 0 0 0 0 0 0 {0} {1} {2}
+domain0 00000003 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+cpu1 0 0 0 0 0 0 {3} {4} {5}
+domain0 00000003 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+"""
+
+SOFTIRQS = """\
+                    CPU0       CPU1
+          HI:          0          0
+      NET_RX:       {0}       {1}
+"""
+
+
+def write_file(path, content):
+    """write the fake proc file"""
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+class TestProcessorSchedstat:
+    """ test schedstat and softirq monitors"""
+
+    def test_parse_schedstat(self):
+        """test parse the cpu lines only"""
+        cpus, counts = parse_schedstat(SCHEDSTAT.format(1, 2, 3, 4, 5, 6))
+        assert cpus == [0, 1]
+        assert counts[:, 6:].tolist() == [[1, 2, 3], [4, 5, 6]]
+
+    def test_schedstat_rates(self, tmp_path):
+        """test summary and per cpu fields from the deltas"""
+        path = str(tmp_path / "schedstat")
+        write_file(path, SCHEDSTAT.format(0, 0, 0, 0, 0, 0))
+        monitor = CpuSchedstat("UT")
+        monitor._option = path
+        para = "--interval=1;--fields=wait.total --fields=wait.imbalance --fields=timeslices.cpu1"
+        assert monitor.report("data", None, para) == ["0.000", "0.000", "0.000"]
+
+        write_file(path, SCHEDSTAT.format(0, 3 * 10 ** 9, 0, 0, 10 ** 9, 10))
+        total, imbalance, timeslices = [float(value) for value in
+                                        monitor.report("data", None, para)]
+        assert total > 0
+        assert imbalance == 1.5
+        assert timeslices > 0
+
+        with pytest.raises(LookupError):
+            monitor.decode("", "--fields=wait.cpu9")
+
+    def test_softirq_rates(self, tmp_path):
+        """test the softirq distribution over cpus"""
+        path = str(tmp_path / "softirqs")
+        write_file(path, SOFTIRQS.format(0, 0))
+        monitor = SysSoftirq("UT")
+        monitor._option = path
+        para = "--interval=1;--fields=NET_RX.max --fields=NET_RX.imbalance --fields=HI.total"
+        monitor.report("data", None, para)
+
+        write_file(path, SOFTIRQS.format(400, 0))
+        _, imbalance, total = monitor.report("data", None, para)
+        assert (imbalance, total) == ("2.000", "0.000")
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from atune_collector.plugin.monitor.procfile import ProcBuffer, ProcFile, ProcFileCache
+
+
+class TestProcFile:
+    """ test persistent proc file"""
+
+    def test_reread_and_grow(self, tmp_path):
+        """test the file is re-read from the start and the buffer grows"""
+        path = str(tmp_path / "file-nr")
+        with open(path, 'w') as file:
+            file.write("1024\t0\t4096\n")
+        proc_file = ProcFile(path, size=4)
+        assert proc_file.read_text() == "1024\t0\t4096\n"
+
+        with open(path, 'r+') as file:
+            file.write("2048")
+        assert bytes(proc_file.read()) == b"2048\t0\t4096\n"
+        proc_file.close()
+
+    def test_shared_buffer_with_dir_fd(self, tmp_path):
+        """test files opened relative to a directory share one buffer"""
+        for name in ("stat", "status"):
+            with open(str(tmp_path / name), 'w') as file:
+                file.write(name * 100)
+        dirfd = os.open(str(tmp_path), os.O_RDONLY | os.O_DIRECTORY)
+        buf = ProcBuffer(16)
+        files = [ProcFile(name, dirfd, buf=buf) for name in ("stat", "status")]
+        assert bytes(files[0].read()) == b"stat" * 100
+        assert len(files[1].read()) == 600
+        assert len(buf.data) == 1024
+        for proc_file in files:
+            proc_file.close()
+        os.close(dirfd)
+
+    def test_missing_file(self, tmp_path):
+        """test reading a missing file raises OSError"""
+        with pytest.raises(OSError):
+            ProcFile(str(tmp_path / "missing")).read()
+
+    def test_short_reads(self, tmp_path, monkeypatch):
+        """test the file is read until the end when each read returns a part of it"""
+        path = str(tmp_path / "interrupts")
+        content = "".join("%4d: %s\n" % (irq, " 0" * 64) for irq in range(64)).encode()
+        with open(path, 'wb') as file:
+            file.write(content)
+        preadv = os.preadv
+        monkeypatch.setattr(os, "preadv", lambda fd, buffers, offset: preadv(
+            fd, [buffers[0][:100]], offset))
+        proc_file = ProcFile(path, size=256)
+        assert bytes(proc_file.read()) == content
+        assert bytes(proc_file.read()) == content
+        proc_file.close()
+
+    def test_seq_file(self):
+        """test a seq_file of many pages is read whole"""
+        child = subprocess.Popen(
+            [sys.executable, "-c", "import sys, time; print(flush=True); time.sleep(30)"],
+            stdout=subprocess.PIPE)
+        try:
+            # the mappings of the child do not change once it sleeps
+            child.stdout.readline()
+            path = "/proc/%d/smaps" % child.pid
+            with open(path, 'rb') as file:
+                content = file.read()
+            assert len(content) > 8192
+            proc_file = ProcFile(path)
+            assert len(proc_file.read()) == len(content)
+            proc_file.close()
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_cache_limit(self, tmp_path):
+        """test the files past the limit are read without being kept open"""
+        paths = []
+        for tid in range(4):
+            paths.append(str(tmp_path / str(tid)))
+            with open(paths[-1], 'w') as file:
+                file.write("task %d\n" % tid)
+        cache = ProcFileCache(limit=2, buf=ProcBuffer(4))
+        for _ in range(2):
+            assert [bytes(cache.read(tid, "sched", path)) for tid, path in enumerate(paths)] == \
+                [b"task %d\n" % tid for tid in range(4)]
+        assert len(cache) == 2
+        cache.retain({1, 3})
+        assert len(cache) == 1
+        os.remove(paths[3])
+        with pytest.raises(OSError):
+            cache.read(3, "sched", paths[3])
+        assert bytes(cache.read(1, "sched", paths[1])) == b"task 1\n"
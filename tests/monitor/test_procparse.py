@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import math
+
+from atune_collector.plugin.monitor import procparse
+
+MEMINFO = b"""\
+MemTotal:       16318412 kB
+MemFree:         %d kB
+Active:          2000 kB
+Inactive:        3000 kB
+Active(anon):    4000 kB
+"""
+
+STAT = b"""\
+cpu  10 20 30 40 50 60 70 80 0 0
+cpu0 1 2 3 4 5 6 7 8 0 0
+intr 1000 1 2 3 4 5 6 7 8 9
+ctxt 123456
+procs_running 3
+"""
+
+
+class TestProcParse:
+    """ test byte level proc parsers"""
+
+    def test_meminfo_relearn_offsets(self):
+        """test keys are matched on row boundaries and offsets are relearned"""
+        parser = procparse.meminfo_parser(["Active", "MemFree", "Inactive", "Cached"])
+        values = parser.parse(MEMINFO % 12)
+        assert list(values[:3]) == [2000, 12, 3000]
+        assert math.isnan(values[3])
+        # the longer value shifts the following rows
+        assert list(parser.parse(MEMINFO % 123456789)[:3]) == [2000, 123456789, 3000]
+        assert parser.parse(MEMINFO % 12) is values
+
+    def test_columns(self):
+        """test the columns of a row and the keys which prefix other keys"""
+        parser = procparse.RowParser([(b"cpu", 4), (b"cpu0", 0), (b"ctxt", 0), (b"cpu", 0)])
+        assert list(parser.parse(STAT)) == [50, 1, 123456, 10]
+        assert list(parser.parse(memoryview(STAT))) == [50, 1, 123456, 10]
+
+    def test_memoryview_in_place(self):
+        """test a view of a larger reused buffer is parsed without the bytes past its end"""
+        parser = procparse.meminfo_parser(["MemFree", "Active(anon)", "MemTotal"])
+        buf = bytearray(4096)
+        for free in (123456789, 12):
+            content = MEMINFO % free
+            buf[:len(content)] = content
+            assert list(parser.parse(memoryview(buf)[:len(content)])) == \
+                [free, 4000, 16318412]
+        # the end of the view ends the last row, the longer content before stays in buf
+        view = memoryview(buf)[:MEMINFO.index(b"Active:")]
+        values = parser.parse(view)
+        assert list(values[[0, 2]]) == [12, 16318412]
+        assert math.isnan(values[1])
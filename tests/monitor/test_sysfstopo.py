@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import json
+import os
+import struct
+
+from atune_collector.plugin.monitor import sysfstopo, topocache
+from atune_collector.plugin.monitor.memory.topo import MemTopo
+from atune_collector.plugin.monitor.network.topo import NetTopo
+from atune_collector.plugin.monitor.processor.info import CpuInfo
+from atune_collector.plugin.monitor.storage.topo import StorageTopo
+
+PCI = "0000:00:17.0"
+
+
+def write_file(path, content, mode='w'):
+    """write content to path, creating parent directories"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode) as file:
+        file.write(content)
+
+
+def memory_device(handle, size_mb, speed, locator):
+    """build a SMBIOS type 17 structure"""
+    raw = bytearray(0x22)
+    raw[0] = 17
+    raw[1] = 0x22
+    struct.pack_into("<H", raw, 2, handle)
+    struct.pack_into("<H", raw, 4, 0x1000)
+    struct.pack_into("<H", raw, 0x08, 72)
+    struct.pack_into("<H", raw, 0x0A, 64)
+    struct.pack_into("<H", raw, 0x0C, size_mb)
+    raw[0x0E] = 0x09
+    raw[0x10] = 1
+    raw[0x12] = 0x1A
+    struct.pack_into("<H", raw, 0x15, speed)
+    return bytes(raw) + locator.encode() + b"\0\0"
+
+
+def make_pci(root, businfo, driver):
+    """create a pci device with its driver, returns the path of the device"""
+    path = os.path.join(root, "devices", "pci0000:00", businfo)
+    write_file(os.path.join(path, "vendor"), "0x8086\n")
+    write_file(os.path.join(path, "device"), "0xa282\n")
+    write_file(os.path.join(path, "numa_node"), "1\n")
+    os.makedirs(os.path.join(root, "bus", "pci", "drivers", driver), exist_ok=True)
+    os.symlink(os.path.join(root, "bus", "pci", "drivers", driver), os.path.join(path, "driver"))
+    os.makedirs(os.path.join(root, "bus", "pci", "devices"), exist_ok=True)
+    os.symlink(path, os.path.join(root, "bus", "pci", "devices", businfo))
+    return path
+
+
+def lshw(monkeypatch, nodes):
+    """the sysfs collectors find nothing and lshw -json reports nodes"""
+    for name, key in (("processor_topology", "processors"), ("storage_topology", "storages"),
+                      ("network_topology", "networks")):
+        monkeypatch.setattr(sysfstopo, name, lambda key=key: {key: []})
+    commands = []
+
+    def check_output(cmd):
+        commands.append(cmd)
+        return json.dumps({"id": "computer", "class": "system", "children": nodes})
+
+    monkeypatch.setattr(topocache, "check_output", check_output)
+    return commands
+
+
+class TestSysfsTopo:
+    """ test sysfs topology collectors"""
+
+    def test_memory_topology(self, tmp_path):
+        """test dimms are decoded from the dmi entries"""
+        root = str(tmp_path)
+        entries = os.path.join(root, "firmware", "dmi", "entries")
+        write_file(os.path.join(entries, "17-0", "raw"),
+                   memory_device(0x1100, 16384, 2933, "DIMM000 J11"), 'wb')
+        write_file(os.path.join(entries, "17-1", "raw"),
+                   memory_device(0x1101, 0, 0, "DIMM001 J12"), 'wb')
+
+        memorys = sysfstopo.memory_topology(root)["memorys"]
+        assert len(memorys) == 1
+        assert memorys[0]["size"] == 16 * 1024 ** 3
+        dimm, empty = memorys[0]["children"]
+        assert dimm["description"] == "DIMM DDR4 2933 MHz (0.3 ns)"
+        assert dimm["width"] == 64
+        assert [dimm["handle"], empty["handle"]] == ["DMI:1100", "DMI:1101"]
+        assert "size" not in empty
+        memtopo = MemTopo("UT")
+        assert memtopo.table_get_locator(dimm["slot"]) == [0, 0, 0]
+        assert memtopo.table_get_freq(dimm["description"]) == 2933000000
+
+    def test_numa_topology(self, tmp_path):
+        """test numa nodes are read from sysfs"""
+        root = str(tmp_path)
+        node_dir = os.path.join(root, "devices", "system", "node")
+        write_file(os.path.join(node_dir, "online"), "0-1\n")
+        for node in range(2):
+            write_file(os.path.join(node_dir, "node%d" % node, "cpulist"), "%d\n" % node)
+            write_file(os.path.join(node_dir, "node%d" % node, "meminfo"),
+                       "Node %d MemTotal:       1024 kB\n" % node)
+        numas = sysfstopo.numa_topology(root)["numas"]
+        assert [numa["id"] for numa in numas] == ["node:0", "node:1"]
+        assert numas[1]["size"] == 1024 * 1024
+        assert numas[1]["configuration"]["cpus"] == "1"
+
+    def test_processor_topology(self, tmp_path):
+        """test one processor per package, with its cores, threads and shared caches"""
+        root = str(tmp_path / "sys")
+        proc = str(tmp_path / "proc")
+        cpu_dir = os.path.join(root, "devices", "system", "cpu")
+        write_file(os.path.join(cpu_dir, "online"), "0-3\n")
+        # two packages of one core with two threads
+        for cpu in range(4):
+            topology = os.path.join(cpu_dir, "cpu%d" % cpu, "topology")
+            write_file(os.path.join(topology, "physical_package_id"), "%d\n" % (cpu // 2))
+            write_file(os.path.join(topology, "core_id"), "0\n")
+            for index, level, size, shared in (("index0", "1", "32K", str(cpu)),
+                                               ("index3", "3", "8192K", "0-3")):
+                cache = os.path.join(cpu_dir, "cpu%d" % cpu, "cache", index)
+                write_file(os.path.join(cache, "level"), level + "\n")
+                write_file(os.path.join(cache, "size"), size + "\n")
+                write_file(os.path.join(cache, "shared_cpu_list"), shared + "\n")
+        write_file(os.path.join(proc, "cpuinfo"), "processor\t: 0\nmodel name\t: Kunpeng 920\n")
+
+        processors = sysfstopo.processor_topology(root, proc)["processors"]
+        assert [node["id"] for node in processors] == ["cpu:0", "cpu:1"]
+        assert processors[1]["product"] == "Kunpeng 920"
+        assert processors[1]["configuration"] == {"cores": "1", "threads": "2", "cpus": "2,3"}
+        l1, l3 = processors[0]["children"]
+        assert (l1["description"], l1["size"], l1["configuration"]["instances"]) == \
+            ("L1 cache", 32 * 1024, "2")
+        assert (l3["description"], l3["size"], l3["configuration"]["instances"]) == \
+            ("L3 cache", 8192 * 1024, "1")
+
+    def test_storage_topology(self, tmp_path):
+        """test the disks are grouped by their pci controller, virtual devices are skipped"""
+        root = str(tmp_path)
+        pci = make_pci(root, PCI, "ahci")
+        for disk, rotational in (("sda", "1"), ("sdb", "0")):
+            device = os.path.join(pci, "ata1", "host0", disk)
+            write_file(os.path.join(device, "model"), "ST1000\n")
+            block = os.path.join(root, "block", disk)
+            write_file(os.path.join(block, "size"), "2048\n")
+            write_file(os.path.join(block, "queue", "rotational"), rotational + "\n")
+            os.symlink(device, os.path.join(block, "device"))
+        write_file(os.path.join(root, "block", "loop0", "size"), "0\n")
+
+        storages = sysfstopo.storage_topology(root)["storages"]
+        assert len(storages) == 1
+        controller = storages[0]
+        assert controller["businfo"] == "pci@" + PCI
+        assert controller["configuration"] == {"driver": "ahci", "numa_node": "1"}
+        assert [disk["logicalname"] for disk in controller["children"]] == ["/dev/sda", "/dev/sdb"]
+        disk = controller["children"][0]
+        assert (disk["size"], disk["product"], disk["configuration"]["rotational"]) == \
+            (1024 * 1024, "ST1000", "1")
+
+    def test_network_topology(self, tmp_path):
+        """test the physical nics with their pci and numa locality, virtual ones are skipped"""
+        root = str(tmp_path)
+        pci = make_pci(root, PCI, "ixgbe")
+        write_file(os.path.join(pci, "local_cpulist"), "8-15\n")
+        nic = os.path.join(root, "class", "net", "eth0")
+        for name, value in (("speed", "10000"), ("carrier", "1"), ("mtu", "1500"),
+                            ("address", "52:54:00:12:34:56")):
+            write_file(os.path.join(nic, name), value + "\n")
+        os.symlink(pci, os.path.join(nic, "device"))
+        write_file(os.path.join(root, "class", "net", "lo", "mtu"), "65536\n")
+
+        networks = sysfstopo.network_topology(root)["networks"]
+        assert [node["logicalname"] for node in networks] == ["eth0"]
+        node = networks[0]
+        assert (node["businfo"], node["size"], node["serial"]) == \
+            ("pci@" + PCI, 10 ** 10, "52:54:00:12:34:56")
+        assert node["configuration"]["speed"] == "10000Mbit/s"
+        assert (node["configuration"]["driver"], node["configuration"]["link"],
+                node["configuration"]["numa_node"], node["configuration"]["local_cpus"]) == \
+            ("ixgbe", "yes", "1", "8-15")
+
+    def test_lshw_fallback(self, monkeypatch):
+        """test the topo monitors use lshw when sysfs finds no device"""
+        nodes = [{"id": "cpu", "class": "processor", "description": "CPU"},
+                 {"id": "storage", "class": "storage", "description": "SATA controller"},
+                 {"id": "network", "class": "network", "description": "Ethernet interface"}]
+        commands = lshw(monkeypatch, nodes)
+        assert json.loads(StorageTopo("UT").format("", "json")) == {"storages": [nodes[1]]}
+        assert json.loads(NetTopo("UT").format("", "json")) == {"networks": [nodes[2]]}
+        assert commands == ["lshw -json", "lshw -json"]
+        CpuInfo("UT").format("", "json")
+        assert commands[-1] == "lshw -json -c processor"
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import pytest
+
+from atune_collector.plugin.monitor.system.interrupts import parse_interrupts
+from atune_collector.plugin.monitor.system.irqrate import SysIrqRate
+
+INTERRUPTS = """\
+           CPU0       CPU2
+  0:         {0}          0   IO-APIC   2-edge      timer
+ 24:         {1}          {2}   PCI-MSI 524288-edge      eth0-TxRx-0
+ 25:          0          {3}   PCI-MSI 524289-edge      eth0-TxRx-1
+NMI:          0          0   Non-maskable interrupts
+ERR:          0
+"""
+
+
+def write_interrupts(path, *counts):
+    """write the fake /proc/interrupts"""
+    with open(path, 'w') as file:
+        file.write(INTERRUPTS.format(*counts))
+
+
+class TestSystemIrqRate:
+    """ test irq rate monitor"""
+
+    def test_parse_interrupts(self):
+        """test parse the irq x cpu matrix"""
+        cpus, labels, names, counts = parse_interrupts(INTERRUPTS.format(1, 2, 3, 4))
+        assert cpus == [0, 2]
+        assert labels == ["0", "24", "25", "NMI"]
+        assert names == ["timer", "eth0-TxRx-0", "eth0-TxRx-1", "interrupts"]
+        assert counts.tolist() == [[1, 0], [2, 3], [0, 4], [0, 0]]
+
+    def test_irq_rates(self, tmp_path):
+        """test top, nic and imbalance fields from the deltas"""
+        path = str(tmp_path / "interrupts")
+        write_interrupts(path, 0, 0, 0, 0)
+        monitor = SysIrqRate("UT")
+        monitor._option = path
+        para = "--interval=1;--fields=top1 --fields=nic --fields=nic_imbalance " \
+               "--fields=imbalance --nic=eth0"
+        assert monitor.report("data", None, para) == ["0.000", "0.000", "0.000", "0.000"]
+
+        write_interrupts(path, 0, 300, 0, 100)
+        top1, nic, nic_imbalance, imbalance = \
+            [float(value) for value in monitor.report("data", None, para)]
+        assert nic == pytest.approx(top1 * 4 / 3)
+        assert nic_imbalance == 1.5
+        assert imbalance == 1.5
+        assert top1 > 0
+
+    def test_nic_queues(self, tmp_path):
+        """test the queues of a nic are matched as a whole word and reported one by one"""
+        path = str(tmp_path / "interrupts")
+        content = "           CPU0\n" \
+                  " 40:          {0}   PCI-MSI 1-edge      eth1-TxRx-1\n" \
+                  " 41:          {1}   PCI-MSI 2-edge      eth10-TxRx-0\n" \
+                  " 39:          {2}   PCI-MSI 3-edge      eth1-TxRx-0\n" \
+                  "LOC:          {3}   Local timer interrupts\n"
+        with open(path, 'w') as file:
+            file.write(content.format(0, 0, 0, 0))
+        monitor = SysIrqRate("UT")
+        monitor._option = path
+        para = "--interval=1;--fields=nic --fields=nic_queue1 --fields=nic_queue2 " \
+               "--fields=nic_queue3 --fields=top1_irq --fields=top2_irq --fields=top9_irq " \
+               "--nic=eth1"
+        monitor.report("data", None, para)
+        with open(path, 'w') as file:
+            file.write(content.format(100, 1000, 300, 5000))
+        nic, queue1, queue2, queue3, top1, top2, top9 = \
+            [float(value) for value in monitor.report("data", None, para)]
+        assert queue1 == pytest.approx(3 * queue2)
+        assert nic == pytest.approx(queue1 + queue2)
+        assert queue3 == 0
+        assert (top1, top2, top9) == (-1, 41, -1)
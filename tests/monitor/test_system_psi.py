@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+
+import pytest
+
+from atune_collector.plugin.monitor.system.psi import SysPsi, PsiTrigger, PsiWatcher
+
+
+def write_pressure(root, resource, some_total, full_total):
+    """write a pressure file of the fake /proc/pressure"""
+    with open(os.path.join(root, resource), 'w') as file:
+        file.write("some avg10=1.50 avg60=0.75 avg300=0.10 total=%d\n" % some_total)
+        file.write("full avg10=0.00 avg60=0.00 avg300=0.00 total=%d\n" % full_total)
+
+
+class TestSystemPsi:
+    """ test psi monitor"""
+
+    def test_psi_fields(self, tmp_path):
+        """test avg and total fields, missing resources are reported as 0"""
+        root = str(tmp_path)
+        write_pressure(root, "memory", 0, 0)
+        monitor = SysPsi("UT")
+        monitor._option = root
+        para = "--interval=1;--fields=memory_some_avg10 --fields=memory_some_total " \
+               "--fields=irq_full_avg60"
+        assert monitor.report("data", None, para) == ["1.50", "0.000", "0"]
+
+        write_pressure(root, "memory", 10 ** 9, 0)
+        assert float(monitor.report("data", None, para)[1]) > 0
+
+    def test_psi_unknown_field(self):
+        """test unknown fields are rejected"""
+        monitor = SysPsi("UT")
+        with pytest.raises(LookupError):
+            monitor.decode("", "--fields=disk_some_avg10")
+
+    def test_psi_trigger_args(self):
+        """test invalid trigger arguments are rejected"""
+        with pytest.raises(ValueError):
+            PsiTrigger("disk")
+        with pytest.raises(ValueError):
+            PsiTrigger("memory", "some", 2000, 1000)
+
+    def test_psi_trigger_retry(self, tmp_path, caplog):
+        """test a trigger failing to register is logged once and registered by a later wait"""
+        trigger = PsiTrigger("memory", proc=str(tmp_path))
+        watcher = PsiWatcher([trigger], retry=0)
+        assert watcher.triggers == [] and watcher.failed == [trigger]
+        assert watcher.wait(0) == []
+        assert len([record for record in caplog.records if record.levelname == "ERROR"]) == 1
+
+        write_pressure(str(tmp_path), "memory", 0, 0)
+        assert watcher.wait(0) == []
+        assert watcher.triggers == [trigger] and watcher.failed == []
+        watcher.close()
+        assert trigger.fileno() is None
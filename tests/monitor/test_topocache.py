@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import os
+
+from atune_collector.plugin.monitor.topocache import TopologyCache
+
+
+class TestTopoCache:
+    """ test topology cache"""
+
+    def test_cache_by_generation(self, tmp_path):
+        """test cached output is reused until the generation changes"""
+        data = os.path.join(str(tmp_path), "data")
+        boot_id = os.path.join(str(tmp_path), "boot_id")
+        path = os.path.join(str(tmp_path), "cache", "topology.json")
+        with open(data, 'w') as file:
+            file.write("first")
+        with open(boot_id, 'w') as file:
+            file.write("1")
+
+        cache = TopologyCache(path, (boot_id,))
+        cmd = "cat {}".format(data)
+        assert cache.check_output(cmd) == "first"
+        with open(data, 'w') as file:
+            file.write("second")
+        assert cache.check_output(cmd) == "first"
+        assert TopologyCache(path, (boot_id,)).check_output(cmd) == "first"
+        assert os.listdir(os.path.dirname(path)) == ["topology.json"]
+
+        with open(boot_id, 'w') as file:
+            file.write("2")
+        assert cache.check_output(cmd) == "second"
+
+        with open(data, 'w') as file:
+            file.write("third")
+        cache.invalidate()
+        assert not os.path.exists(path)
+        assert cache.check_output(cmd) == "third"
+
+    def test_hotplug(self, tmp_path):
+        """test a block device or nic added or removed refreshes the cached output"""
+        data = os.path.join(str(tmp_path), "data")
+        block = os.path.join(str(tmp_path), "block")
+        net = os.path.join(str(tmp_path), "net")
+        for directory in (block, net):
+            os.makedirs(os.path.join(directory, "sda" if directory == block else "eth0"))
+        with open(data, 'w') as file:
+            file.write("first")
+
+        cache = TopologyCache(os.path.join(str(tmp_path), "topology.json"), (), (block, net))
+        cmd = "cat {}".format(data)
+        assert cache.check_output(cmd) == "first"
+        with open(data, 'w') as file:
+            file.write("second")
+        assert cache.check_output(cmd) == "first"
+        os.makedirs(os.path.join(block, "sdb"))
+        assert cache.check_output(cmd) == "second"
+
+        with open(data, 'w') as file:
+            file.write("third")
+        os.rmdir(os.path.join(net, "eth0"))
+        assert cache.check_output(cmd) == "third"
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import numpy as np
+import pytest
+
+from atune_collector.analyze import analyze, scan
+
+
+def write_run(path, fields, rows):
+    """write a csv file as collect_data.py does"""
+    lines = [",".join(["TimeStamp"] + fields)]
+    for number, row in enumerate(rows):
+        lines.append(",".join(["10:00:{:02d}".format(number % 60)] + [str(value) for value in row]))
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestAnalyze:
+    """ test the offline analysis of an output_dir"""
+
+    def test_analyze(self, tmp_path):
+        """test the runs are summarized, merged by workload and cached"""
+        state = np.random.RandomState(3)
+        mysql = [state.uniform(0, 100, (50, 2)) for _ in range(3)]
+        for number, rows in enumerate(mysql):
+            write_run(tmp_path / "mysql-{}.csv".format(1000 + number),
+                      ["CPU.STAT.util", "STORAGE.STAT.util#sda"], rows)
+        write_run(tmp_path / "default-2000.csv", ["CPU.STAT.util", "MEM.MEMINFO.MemFree"],
+                  [[1, 2], [3, 4]])
+        write_run(tmp_path / "default-2000-burst.csv", ["CPU.STAT.util"], [[1]])
+        (tmp_path / "broken-3000.csv").write_text("TimeStamp,CPU.STAT.util\n10:00:00,x\n")
+        assert [run[0] for run in scan(str(tmp_path))] == \
+            ["broken-3000.csv", "default-2000.csv", "mysql-1000.csv", "mysql-1001.csv",
+             "mysql-1002.csv"]
+
+        result = analyze(str(tmp_path), workers=2)
+        assert result["processed"] == 4 and result["cached"] == 0
+        assert list(result["errors"]) == ["broken-3000.csv"]
+        assert result["files"]["mysql-1001.csv"]["fields"]["CPU.STAT.util"]["mean"] == \
+            pytest.approx(mysql[1][:, 0].mean(), abs=1e-3)
+        merged = result["workloads"]["mysql"]
+        values = np.concatenate(mysql)
+        assert merged["runs"] == 3 and merged["samples"] == 150
+        assert merged["first"] == 1000 and merged["last"] == 1002
+        util = merged["fields"]["STORAGE.STAT.util#sda"]
+        assert util["mean"] == pytest.approx(values[:, 1].mean(), abs=1e-3)
+        assert util["stddev"] == pytest.approx(values[:, 1].std(ddof=1), abs=1e-3)
+        assert util["max"] == pytest.approx(values[:, 1].max(), abs=1e-3)
+        assert util["p95"] == pytest.approx(np.quantile(values[:, 1], 0.95), rel=0.03)
+        assert result["workloads"]["default"]["fields"]["MEM.MEMINFO.MemFree"]["mean"] == 3.0
+
+        again = analyze(str(tmp_path), workers=2)
+        assert again["processed"] == 0 and again["cached"] == 4
+        assert again["workloads"] == result["workloads"]
+
+        write_run(tmp_path / "mysql-1003.csv", ["CPU.STAT.util", "STORAGE.STAT.util#sda"],
+                  [[1, 2], [3, 4], [5, 6]])
+        (tmp_path / "default-2000.csv").unlink()
+        latest = analyze(str(tmp_path), workers=2, workload="mysql")
+        assert latest["processed"] == 1 and latest["cached"] == 3
+        assert latest["workloads"]["mysql"]["samples"] == 153
+        assert list(latest["workloads"]) == ["mysql"]
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import pytest
+
+from atune_collector.catalog import CatalogWriter, RunCatalog, import_directory
+from atune_collector.summary import RunSummary
+
+FIELDS = ["CPU.STAT.util", "STORAGE.STAT.util#sda"]
+
+
+def collect(path, workload, disk, period=None):
+    """register a run of 20 samples, 1 second apart"""
+    writer = CatalogWriter(path, workload, FIELDS, "/data/{}-{}.csv".format(workload, disk),
+                           {"interval": 1, "workload_type": workload}, period)
+    writer.start()
+    summary = RunSummary(FIELDS)
+    for number in range(20):
+        values = [10.0 + number, disk + number % 2]
+        summary.update(values, 100.0 + number)
+        writer.add(100.0 + number, values)
+    assert writer.finish(summary.to_dict(), timeout=10) is not None
+    return writer.run_id
+
+
+class TestCatalog:
+    """ test the catalog of the runs"""
+
+    def test_catalog(self, tmp_path):
+        """test runs are registered with their statistics and series, and found by index"""
+        path = str(tmp_path / "catalog.db")
+        busy = collect(path, "mysql", 90, period=10)
+        idle = collect(path, "mysql", 20)
+        other = collect(path, "redis", 95)
+
+        catalog = RunCatalog(path)
+        assert catalog.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        runs = catalog.find_runs("mysql", "STORAGE.STAT.util#sda", "p95", above=80)
+        assert [run["id"] for run in runs] == [busy]
+        assert runs[0]["value"] == pytest.approx(91, rel=0.01)
+        assert [run["id"] for run in catalog.find_runs(field="STORAGE.STAT.util#sda",
+                                                       stat="max", above=50)] == [busy, other]
+        assert [run["id"] for run in catalog.find_runs(workload="mysql")] == [busy, idle]
+        with pytest.raises(ValueError):
+            catalog.find_runs(stat="p42")
+        plan = " ".join(row[-1] for row in catalog.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT run_id FROM stats WHERE field_id = 2 AND p95 > 80"))
+        assert "stats_p95" in plan
+
+        run = catalog.run(busy)
+        assert run["fields"] == FIELDS
+        assert run["samples"] == 20
+        assert run["config"]["workload_type"] == "mysql"
+        assert run["host_facts"]["hostname"] == run["host"]
+        assert run["stats"]["CPU.STAT.util"]["mean"] == 19.5
+        assert catalog.series(busy, "CPU.STAT.util") == [(100.0, 14.5, 10.0, 19.0),
+                                                         (110.0, 24.5, 20.0, 29.0)]
+        assert catalog.series(idle, "CPU.STAT.util") == []
+        catalog.close()
+
+    def test_import(self, tmp_path):
+        """test the csv files collected without the catalog are registered once"""
+        (tmp_path / "mysql-1000.csv").write_text(
+            "TimeStamp,CPU.STAT.util\n10:00:00,1\n10:00:01,3\n")
+        catalog = RunCatalog(str(tmp_path / "catalog.db"))
+        import_directory(catalog, str(tmp_path), workers=1)
+        import_directory(catalog, str(tmp_path), workers=1)
+        runs = catalog.find_runs("mysql", "CPU.STAT.util", "mean")
+        assert len(runs) == 1
+        assert runs[0]["value"] == 2.0 and runs[0]["finished"] == 1.0
+        catalog.close()
+
+    def test_writer_error(self, tmp_path):
+        """test any failure of the writer is reported by finish without raising"""
+        writer = CatalogWriter(str(tmp_path / "catalog.db"), "mysql", FIELDS,
+                               config={"interval": object()}, period=10)
+        writer.start()
+        writer.add(100.0, [1.0, 2.0])
+        assert writer.finish({}, timeout=10) is None
+        assert isinstance(writer.error, TypeError)
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# collect_data.py imports the plugins and samples as top-level modules, and the plugin
+# package inserts its own directory, which also has a plugin module, first in sys.path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../atune_collector"))
+import collect_data
+from collect_data import Collector
+
+CONFIG = {"network": "eth0", "block": "sda", "interval": 1,
+          "collection_items": [{"name": "cpu", "module": "CPU", "purpose": "STAT",
+                                "metrics": ["usr", "sys"]}]}
+
+
+class FakeMPI:
+    """monitors filling each round with its number, a round may wait for release"""
+
+    def __init__(self, release=None):
+        self.rounds = 0
+        self.entered = threading.Event()
+        self.release = release
+
+    def get_monitors_data(self, monitors, out=None):
+        self.rounds += 1
+        self.entered.set()
+        if self.release is not None:
+            self.release.wait()
+        out[:] = [self.rounds, -self.rounds]
+        return out
+
+
+def make_collector(monkeypatch, release=None):
+    """a collector of CONFIG with fake monitors"""
+    monkeypatch.setattr(collect_data, "MPI", lambda: FakeMPI(release))
+    return Collector(CONFIG, retain=1)
+
+
+class TestCollector:
+    """ test the sample iterators of the collector"""
+
+    def test_iter_count(self, monkeypatch):
+        """test count samples are collected lazily, one round per sample"""
+        collector = make_collector(monkeypatch)
+        samples = collector.iter_samples(3)
+        assert collector.mpi.rounds == 0
+        first = next(samples)
+        assert collector.mpi.rounds == 1
+        assert first.fields == ["CPU.STAT.usr", "CPU.STAT.sys"]
+        assert [sample.values[0] for sample in samples] == [2, 3]
+        assert collector.mpi.rounds == 3
+
+    def test_iter_duration_and_stop(self, monkeypatch):
+        """test the iteration ends after duration or when stop is set"""
+        collector = make_collector(monkeypatch)
+        assert len(list(collector.iter_samples(duration=0))) == 0
+        start = time.monotonic()
+        assert len(list(collector.iter_samples(100, duration=0.05))) == 100 or \
+            time.monotonic() - start >= 0.05
+        stop = threading.Event()
+        collected = []
+        for sample in collector.iter_samples(stop=stop):
+            collected.append(sample.timestamp)
+            if len(collected) == 2:
+                stop.set()
+        assert len(collected) == 2
+
+    def test_aiter(self, monkeypatch):
+        """test the async iteration ends after count samples"""
+        collector = make_collector(monkeypatch)
+
+        async def consume():
+            return [sample.values[1] async for sample in collector.aiter_samples(3)]
+
+        assert asyncio.run(consume()) == [-1, -2, -3]
+
+    def test_aiter_cancel(self, monkeypatch):
+        """test cancelling during a round raises CancelledError once the round ends"""
+        release = threading.Event()
+        collector = make_collector(monkeypatch, release)
+
+        async def consume():
+            async for _ in collector.aiter_samples():
+                pass
+
+        async def cancel():
+            task = asyncio.create_task(consume())
+            await asyncio.get_running_loop().run_in_executor(None, collector.mpi.entered.wait)
+            task.cancel()
+            threading.Timer(0.05, release.set).start()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert release.is_set()
+
+        asyncio.run(cancel())
+        assert collector.mpi.rounds == 1
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import pytest
+
+from atune_collector.samples import SampleMatrix
+
+
+class TestSampleMatrix:
+    """ test sample matrix"""
+
+    def test_bounded(self):
+        """test the preallocated matrix returns views and rejects extra rows"""
+        samples = SampleMatrix(["CPU.STAT.util", "MEM.MEMINFO.MemFree"], capacity=2)
+        samples.next_row(1.0)[:] = [10, 20]
+        row = samples.next_row(2.0)
+        row[1] = 40
+        assert samples.index["MEM.MEMINFO.MemFree"] == 1
+        assert samples.column("MEM.MEMINFO.MemFree").tolist() == [20, 40]
+        assert samples.array().base is not None
+        assert samples.timestamp(-1) == 2.0
+        with pytest.raises(IndexError):
+            samples.next_row()
+
+    def test_chunked(self):
+        """test the unbounded matrix grows by chunks without moving rows"""
+        samples = SampleMatrix(["a"], chunk=2)
+        first = samples.next_row()
+        first[0] = 1
+        for value in range(2, 6):
+            samples.next_row()[0] = value
+        assert len(samples) == 5
+        assert [len(rows) for _, rows in samples.chunks()] == [2, 2, 1]
+        assert samples.column("a").tolist() == [1, 2, 3, 4, 5]
+        assert samples.row(0) is not first and samples.row(0)[0] == first[0]
+
+        samples.drop_last()
+        assert samples.column("a").tolist() == [1, 2, 3, 4]
+
+    def test_retain(self):
+        """test the oldest chunks are reused once enough rows are retained"""
+        samples = SampleMatrix(["a"], chunk=2, retain=3)
+        for value in range(1, 8):
+            samples.next_row()[0] = value
+        assert len(samples) == 5
+        assert samples.column("a").tolist() == [3, 4, 5, 6, 7]
+        assert len(list(samples.chunks())) == 3
+        # a retain of 1 keeps the previous chunk with the current one
+        samples = SampleMatrix(["a"], chunk=2, retain=1)
+        for value in range(1, 8):
+            samples.next_row()[0] = value
+        assert samples.column("a").tolist() == [5, 6, 7]
+        assert len(list(samples.chunks())) == 2
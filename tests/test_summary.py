@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import json
+import math
+
+import numpy as np
+import pytest
+
+from atune_collector.summary import QuantileSketch, RunSummary
+
+
+class TestRunSummary:
+    """ test the summary of a run"""
+
+    def test_sketch_accuracy(self):
+        """test the quantiles are within the relative accuracy, for both signs"""
+        values = np.random.RandomState(1).lognormal(2, 1.5, 20000)
+        values[::7] *= -1
+        values[::11] = 0
+        sketch = QuantileSketch(0.01)
+        for value in values[:1000]:
+            sketch.add(value)
+        sketch.add_many(values[1000:])
+        sketch.add(math.nan)
+        assert sketch.count == len(values)
+        for quantile in (0.01, 0.1, 0.5, 0.95, 0.99):
+            exact = np.quantile(values, quantile, method="lower")
+            assert sketch.quantile(quantile) == pytest.approx(exact, rel=0.02, abs=1e-9)
+        assert sketch.quantile(0) == values.min()
+        assert sketch.quantile(1) == values.max()
+
+    def test_sketch_bounded(self):
+        """test the buckets of the smallest values are collapsed past max_bins"""
+        sketch = QuantileSketch(0.01, max_bins=64)
+        values = np.geomspace(1e-3, 1e6, 5000)
+        sketch.add_many(values)
+        assert len(sketch.positive) == 64
+        assert sketch.quantile(0.99) == pytest.approx(np.quantile(values, 0.99, method="lower"),
+                                                      rel=0.02)
+
+    def test_summary(self, tmp_path):
+        """test the moments, quantiles and changed fields of a run"""
+        summary = RunSummary(["CPU.STAT.util", "MEM.MEMINFO.MemFree"], expected=100)
+        for number in range(100):
+            util = 10.0 + number % 5 if number < 50 else 60.0 + number % 5
+            summary.update([util, 1000.0 + number % 2], 1000.0 + number)
+        path = tmp_path / "default-1-summary.json"
+        summary.dump(str(path))
+        result = json.loads(path.read_text())
+        assert result["samples"] == 100
+        assert result["start"] == 1000.0 and result["end"] == 1099.0
+        util = result["fields"]["CPU.STAT.util"]
+        assert util["mean"] == 37.0
+        assert util["min"] == 10.0 and util["max"] == 64.0
+        assert util["p50"] == pytest.approx(14.0, rel=0.01)
+        assert util["p99"] == pytest.approx(64.0, rel=0.01)
+        assert util["stddev"] == pytest.approx(np.std([10.0 + n % 5 for n in range(50)] +
+                                                      [60.0 + n % 5 for n in range(50)],
+                                                      ddof=1), abs=1e-3)
+        assert [change["field"] for change in result["changed"]] == ["CPU.STAT.util"]
+        assert result["changed"][0]["before"] == 12.0 and result["changed"][0]["after"] == 62.0
+
+    def test_empty_field(self):
+        """test a field without values is reported as null"""
+        summary = RunSummary(["a"])
+        summary.update([math.nan])
+        result = summary.to_dict()
+        assert result["fields"]["a"]["mean"] is None
+        assert result["fields"]["a"]["p95"] is None
+        assert result["changed"] == []
+
+    def test_merge(self):
+        """test merged summaries match the summary of all the samples, by field name"""
+        values = np.random.RandomState(2).normal(50, 10, (300, 2))
+        first = RunSummary(["a", "b"])
+        first.update_rows(values[:100], [1.0, 2.0])
+        second = RunSummary(["b"])
+        second.update_rows(values[100:, 1:], [3.0, 4.0])
+        total = RunSummary(["a", "b"])
+        total.merge(RunSummary.from_state(json.loads(json.dumps(first.state()))))
+        total.merge(RunSummary.from_state(json.loads(json.dumps(second.state()))))
+        assert total.count == 300
+        assert (total.start, total.end) == (1.0, 4.0)
+        assert total.stats.count.tolist() == [100, 300]
+        assert total.stats.mean[1] == pytest.approx(values[:, 1].mean())
+        assert total.stats.variance[1] == pytest.approx(values[:, 1].var(ddof=1))
+        assert total.stats.variance[0] == pytest.approx(values[:100, 0].var(ddof=1))
+        assert total.sketches[1].quantile(0.5) == pytest.approx(np.median(values[:, 1]), rel=0.02)
+        with pytest.raises(KeyError):
+            second.merge(first)
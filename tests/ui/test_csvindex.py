@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import csv
+import os
+import threading
+
+import pytest
+
+from csvindex import CsvIndex, CsvWindow
+
+FIELDS = ["CPU.STAT.util", "MEM.MEMINFO.MemFree"]
+
+
+def write_csv(path, rows, start=23 * 3600):
+    """write rows of (util, free) one second apart, as collect_data.py does"""
+    with open(path, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["TimeStamp"] + FIELDS)
+        for index, row in enumerate(rows):
+            seconds = (start + index) % (24 * 3600)
+            stamp = "%02d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+            writer.writerow([stamp] + [str(value) for value in row])
+
+
+class TestCsvIndex:
+    """ test the lazy csv index"""
+
+    def test_index(self, tmp_path):
+        """test the rows are read through the sparse index and the index is cached"""
+        path = str(tmp_path / "default-1.csv")
+        write_csv(path, [(index, index * 10) for index in range(10)])
+        index = CsvIndex(path, stride=4)
+        assert len(index) == 10
+        assert index.fields == FIELDS
+        assert index.offsets.tolist()[0] > 0 and len(index.offsets) == 3
+        assert index.read_rows(5, 7).tolist() == [[5, 50], [6, 60]]
+        assert index.read_rows(8, 20)[:, 0].tolist() == [8, 9]
+        assert index.read_times(0, 2) == ["23:00:00", "23:00:01"]
+        index.close()
+        assert os.path.exists(index.cache_path)
+
+        cached = CsvIndex(path, stride=4)
+        assert len(cached) == 10
+        assert cached.read_rows(9, 10).tolist() == [[9, 90]]
+        cached.close()
+
+    def test_find_time(self, tmp_path):
+        """test jumping to a time crossing midnight"""
+        path = str(tmp_path / "default-2.csv")
+        write_csv(path, [(index, 0) for index in range(7200)], start=23 * 3600 + 1800)
+        index = CsvIndex(path, stride=100)
+        assert index.find_time("23:30:10") == 10
+        assert index.find_time("00:00:05") == 1805
+        assert index.find_time("01:29:59") == 7199
+        assert index.find_time("12:00") == 7199
+        with pytest.raises(ValueError):
+            index.find_time("noon")
+        index.close()
+
+    def test_window(self, tmp_path):
+        """test scrubbing the window and the whole-file aggregates"""
+        path = str(tmp_path / "default-3.csv")
+        write_csv(path, [(index % 10, 1) for index in range(100)])
+        window = CsvWindow(CsvIndex(path, stride=16), span=10)
+        assert window.first == 90
+        window.scroll(-0.5)
+        assert window.first == 85
+        window.zoom(2)
+        assert (window.first, window.span) == (80, 20)
+        window.jump("23:00:10")
+        assert window.first == 0
+        assert window.series("CPU", "util")[:3] == [0.0, 1.0, 2.0]
+        assert window.series("NET", "rxkBs") == []
+
+        window.start()
+        while window.aggregator.done < 100:
+            threading.Event().wait(0.001)
+        window.close()
+        assert window.version > 5
+        assert window.averages()["CPU"]["util"] == 4.5
+        assert len(window.longterm_series("CPU", "util")) == 7
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import csv
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import dashboard
+from dashboard import MultiHostFeed, TimestampMerger, open_sources, sparkline
+from samples import Sample
+from stream import MAX_BACKLOG, StreamServer
+
+UI_DIR = os.path.dirname(dashboard.__file__)
+
+
+def write_host_csv(path, util, rows=30):
+    """write the rows of a host, the disk util of two devices"""
+    with open(path, "w") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["TimeStamp", "CPU.STAT.util", "STORAGE.STAT.util#sda",
+                         "STORAGE.STAT.util#sdb"])
+        for index in range(rows):
+            writer.writerow(["10:00:%02d" % index, util, index, 1])
+
+
+class TestDashboard:
+    """ test the multi-host dashboard"""
+
+    def test_merger(self):
+        """test the samples are released in the order of timestamps"""
+        merger = TimestampMerger()
+        merger.push("a", 1, "a1")
+        merger.push("a", 3, "a3")
+        assert [item[2] for item in merger.pop_ready()] == ["a1", "a3"]
+        merger.push("b", 2, "b2")
+        merger.push("a", 4, "a4")
+        assert [item[2] for item in merger.pop_ready()] == ["b2"]
+        merger.end("b")
+        assert [item[2] for item in merger.pop_ready()] == ["a4"]
+
+    def test_merger_lag(self):
+        """test a host lagging past the grace stops holding the others"""
+        merger = TimestampMerger(grace=5)
+        merger.push("a", 1, "a1")
+        merger.push("b", 1, "b1")
+        for timestamp in range(2, 11):
+            merger.push("a", timestamp, "a{}".format(timestamp))
+        assert [item[2] for item in merger.pop_ready()] == ["a1", "b1", "a2", "a3", "a4", "a5"]
+        # the late samples of the stalled host are released as they come
+        merger.push("b", 2, "b2")
+        assert [item[2] for item in merger.pop_ready()] == ["b2"]
+
+    def test_merger_time_bases(self):
+        """test the seconds of the day of a replay are merged with the epoch seconds of a stream"""
+        merger = TimestampMerger()
+        now = time.time()
+        merger.push("live", now, "live")
+        merger.push("replay", 36000, "replay")
+        merger.push("live", now + 1, "later")
+        assert merger.pop_ready() == [("live", now, "live"), ("replay", 36000, "replay")]
+
+    def test_sparkline(self):
+        """test the levels and the width"""
+        assert sparkline([0, 50, 100, float("nan")], 5, chars=" .:-=+*#%@") == "  =@ "
+
+    def test_slow_subscriber(self, tmp_path):
+        """test a subscriber not reading neither blocks the publisher nor stays subscribed"""
+        spec = "unix:" + str(tmp_path / "slow.sock")
+        server = StreamServer(spec, ["CPU.STAT.util"] * 100, "slow")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(spec[len("unix:"):])
+            assert server.wait_subscribers(1, 5)
+            sample = Sample(0.0, [1.0] * 100, None)
+            start = time.monotonic()
+            # each line is about 500 bytes, more than the backlog and the socket buffer
+            for _ in range(MAX_BACKLOG // 200):
+                server.publish(sample)
+            assert time.monotonic() - start < 5
+            assert not server.wait_subscribers(1, 0)
+        finally:
+            sock.close()
+            server.close()
+
+    def test_streams(self, tmp_path):
+        """test several local publishers replaying files are merged and sorted"""
+        procs = []
+        specs = []
+        for host, util in (("web", 20), ("db", 90), ("cache", 50)):
+            path = str(tmp_path / "{}.csv".format(host))
+            write_host_csv(path, util)
+            spec = "unix:" + str(tmp_path / "{}.sock".format(host))
+            specs.append(spec)
+            procs.append(subprocess.Popen(
+                [sys.executable, os.path.join(UI_DIR, "stream.py"), "--listen", spec,
+                 "--file", path, "--replay", "100", "--host", host, "--wait", "1"]))
+        try:
+            for spec in specs:
+                while not os.path.exists(spec[len("unix:"):]):
+                    time.sleep(0.01)
+            sources, indexes = open_sources(specs + [str(tmp_path / "web.csv")])
+            assert indexes and sources[-1].host == "web"
+            feed = MultiHostFeed(sources[:-1])
+            feed.start()
+            deadline = time.monotonic() + 20
+            while feed.ended < 3 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            feed.stop(1)
+            assert feed.failed == {}
+            with feed.lock:
+                assert [host.name for host in feed.top(0)] == ["db", "cache", "web"]
+                # equal disk util, sorted by name
+                assert [host.name for host in feed.top(1, 1)] == ["cache"]
+                assert len(feed.hosts[0].series(0)) == 30
+                assert feed.hosts[0].latest.tolist()[:2] == [20.0, 29.0]
+            for index in indexes:
+                index.close()
+        finally:
+            for proc in procs:
+                proc.kill()
+                proc.wait()
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import pytest
+
+from downsample import Downsampler, PlotData
+
+
+class TestDownsampler:
+    """ test the downsampling of the plots"""
+
+    @pytest.mark.parametrize("method", ["lttb", "minmax"])
+    def test_spike(self, method):
+        """test the width is respected and a single spike stays visible"""
+        values = [1.0] * 1000
+        values[437] = 100.0
+        points = Downsampler(method).reduce("cpu", values, 40)
+        assert len(points) <= 40
+        assert max(points) == 100.0
+        assert Downsampler(method).reduce("cpu", values[:30], 40) == values[:30]
+
+    @pytest.mark.parametrize("method", ["lttb", "minmax"])
+    def test_sliding_cache(self, method):
+        """test the cached buckets match a fresh computation as the window slides"""
+        cached = Downsampler(method)
+        series = [float(index % 17) for index in range(3000)]
+        for offset in range(0, 1000, 37):
+            data = PlotData(series[offset:offset + 2000], offset)
+            assert cached.reduce("mem", data, 50) == Downsampler(method).reduce("mem", data, 50)
+
+    def test_sweep(self):
+        """test the series not reduced since the last sweep are dropped from the cache"""
+        downsampler = Downsampler("minmax")
+        series = [float(index % 17) for index in range(2000)]
+        for key in [("CPU", "util"), ("NET", "rxkBs"), None]:
+            downsampler.reduce(key, PlotData(series, 0), 50)
+        downsampler.sweep()
+        downsampler.reduce(("CPU", "util"), PlotData(series, 0), 50)
+        downsampler.sweep()
+        assert list(downsampler._Downsampler__cache) == [("CPU", "util")]
+
+    def test_unknown(self):
+        """test the methods are checked"""
+        with pytest.raises(ValueError):
+            Downsampler("mean")
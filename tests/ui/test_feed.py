@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import threading
+
+from atune_collector.samples import Sample
+from atune_collector.ui.feed import CollectorFeed
+from atune_collector.ui.stats import FieldStats
+
+
+class SampleSource:
+    """samples published one by one when released by the test"""
+
+    def __init__(self, values):
+        self.values = values
+        self.release = threading.Semaphore(0)
+
+    def iter_samples(self, stop=None):
+        for index, value in enumerate(self.values):
+            self.release.acquire()
+            if stop.is_set():
+                return
+            yield Sample(index, [value], ["CPU.STAT.util"])
+        raise RuntimeError("source exhausted")
+
+
+class TestCollectorFeed:
+    """ test the feed of the render loop"""
+
+    def test_publish(self):
+        """test each sample bumps the version and the errors are kept"""
+        source = SampleSource([1.0, 2.0])
+        stats = FieldStats(["CPU.STAT.util"])
+        feed = CollectorFeed(source, stats)
+        feed.start()
+        for version in (1, 2):
+            source.release.release()
+            while feed.version < version:
+                threading.Event().wait(0.001)
+        with feed.lock:
+            assert stats.series("CPU", "util") == [1.0, 2.0]
+        feed.stop(1)
+        assert isinstance(feed.error, RuntimeError)
+
+    def test_stop(self):
+        """test stop ends the collection after the round in progress"""
+        source = SampleSource([1.0])
+        feed = CollectorFeed(source, FieldStats(["CPU.STAT.util"]))
+        feed.start()
+        # the round in progress ends after stop is requested
+        threading.Timer(0.05, source.release.release).start()
+        feed.stop()
+        assert feed.version == 0
+        assert feed.error is None
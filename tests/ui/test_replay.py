@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import argparse
+import threading
+import time
+
+import pytest
+
+from csvindex import CsvIndex
+from feed import CollectorFeed
+from replay import MIN_SPEED, CsvReplay, replay_speed
+from stats import FieldStats
+
+from .test_csvindex import write_csv
+
+
+class TestCsvReplay:
+    """ test the replay of recorded files"""
+
+    def test_pace(self, tmp_path):
+        """test the rows are released at the recorded pace times the speed"""
+        path = str(tmp_path / "default-1.csv")
+        write_csv(path, [(index, 0) for index in range(40)], start=24 * 3600 - 20)
+        index = CsvIndex(path, stride=16)
+        replay = CsvReplay(index, speed=200)
+        begin = time.monotonic()
+        samples = list(replay.iter_samples())
+        elapsed = time.monotonic() - begin
+        assert [sample.values[0] for sample in samples] == list(range(40))
+        # 39 recorded seconds across midnight
+        assert samples[-1].timestamp - samples[0].timestamp == 39
+        assert elapsed >= 39 / 200
+        assert replay.position == 40
+        assert list(CsvReplay(index).iter_samples(duration=0)) != []
+        index.close()
+
+    def test_pause_step(self, tmp_path):
+        """test pausing holds the rows and a step releases one"""
+        path = str(tmp_path / "default-2.csv")
+        write_csv(path, [(index, 0) for index in range(10)])
+        index = CsvIndex(path)
+        replay = CsvReplay(index, speed=1)
+        replay.toggle_pause()
+        stats = FieldStats(index.fields)
+        feed = CollectorFeed(replay, stats)
+        feed.start()
+        time.sleep(0.3)
+        assert feed.version == 0
+        replay.step()
+        replay.step()
+        while feed.version < 2:
+            threading.Event().wait(0.001)
+        time.sleep(0.2)
+        assert feed.version == 2
+        replay.faster()
+        replay.faster()
+        assert replay.speed == 100
+        replay.toggle_pause()
+        while feed.version < 10:
+            threading.Event().wait(0.001)
+        feed.stop(1)
+        assert stats.series("CPU", "util") == list(range(10))
+        assert "row 10 of 10" in replay.describe()
+        index.close()
+
+    def test_speed(self, tmp_path):
+        """test a speed which is not positive is rejected by the parser and clamped by the replay"""
+        assert replay_speed("2.5") == 2.5
+        for value in ("0", "-1", "nan", "fast"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                replay_speed(value)
+        path = str(tmp_path / "default-3.csv")
+        write_csv(path, [(0, 0)])
+        index = CsvIndex(path)
+        assert CsvReplay(index, speed=0).speed == MIN_SPEED
+        assert CsvReplay(index, speed=-1).speed == MIN_SPEED
+        index.close()
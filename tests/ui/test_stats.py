@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Huawei Technologies Co., Ltd.
+# A-Tune is licensed under the Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#     http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR
+# PURPOSE.
+# See the Mulan PSL v2 for more details.
+# Create: 2026-10-19
+
+"""
+Test case.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from atune_collector.ui.stats import FieldStats, RunningStats, parse_field
+
+
+class TestFieldStats:
+    """ test the statistics of the ui"""
+
+    def test_parse_field(self):
+        """test the module and metric of field names"""
+        assert parse_field("CPU.STAT.util") == ("CPU", "util")
+        assert parse_field("CPU.STAT.util.cpu") == ("CPU", "util.cpu")
+        assert parse_field("PROCESS.STAT.rss#mysqld") == ("PROCESS", "rss#mysqld")
+
+    def test_running_stats(self):
+        """test the welford statistics against numpy, skipping nan"""
+        values = np.array([[1.0, 5.0], [2.0, math.nan], [4.0, 7.0], [8.0, 3.0]])
+        running = RunningStats(2)
+        for row in values:
+            running.update(row)
+        assert running.count.tolist() == [4, 3]
+        assert running.mean == pytest.approx(np.nanmean(values, axis=0))
+        assert running.variance == pytest.approx(np.nanvar(values, axis=0, ddof=1))
+        assert running.min.tolist() == [1.0, 3.0]
+        assert running.max.tolist() == [8.0, 7.0]
+
+    def test_history(self):
+        """test the averages cover all samples while the plot history is bounded"""
+        stats = FieldStats(["CPU.STAT.util", "CGROUP.STAT.cpu#a"], history=3)
+        for value in range(1, 6):
+            stats.update([value, value * 10])
+        assert stats.modules == ["CPU", "CGROUP"]
+        averages = stats.averages()
+        assert averages["CPU"]["util"] == 3.0
+        assert averages["CGROUP"]["cpu#a"] == 30.0
+        assert averages["NET"] == {}
+        assert stats.series("CPU", "util") == [3.0, 4.0, 5.0]
+        assert stats.series("NET", "rxkBs") == []
+
+    def test_longterm(self):
+        """test the min, max and mean of each period"""
+        stats = FieldStats(["CPU.STAT.util"], history=2, period=60, periods=2)
+        for timestamp, value in ((0, 1.0), (30, 3.0), (60, 10.0), (150, 5.0), (170, 7.0)):
+            stats.update([value], timestamp)
+        assert len(stats.longterm) == 2
+        assert stats.longterm_series("CPU", "util") == [2.0, 10.0, 6.0]
+        assert stats.longterm_series("CPU", "util", "max") == [3.0, 10.0, 7.0]
+        stats.update([1.0], 240)
+        assert stats.longterm_series("CPU", "util", "min") == [10.0, 5.0, 1.0]
+        assert stats.averages()["CPU"]["util"] == pytest.approx(27 / 6, abs=0.01)